@@ -0,0 +1,160 @@
+"""Live scoreboard state over shared memory (`main.py --state-shm`).
+
+The scoreboard publishes one fixed-layout snapshot per change into a named
+segment (default ``kurash_ring<N>_state``). Readers on the same machine map
+it once and copy it with a seqlock check, so every read is a memory copy
+with no syscall and never returns a half-written snapshot::
+
+    from kurash_shm import StateReader
+    with StateReader("kurash_ring1_state") as r:
+        s = r.read()
+        print(s.time_left_ms, s.blue, s.green, s.winner)
+
+A snapshot is published whenever the scoreboard redraws (at least once per
+clock second); while `running`, time_left_ms counts down from `timestamp`.
+
+Layout (little endian, SIZE bytes):
+    0   4s  magic b"KSST"
+    4   H   version
+    6   H   payload size
+    8   Q   sequence (odd while the writer is mid-update)
+    16  ... payload, see PAYLOAD below
+
+Standard library only; `python kurash_shm.py [NAME]` prints the live state.
+"""
+import struct, sys, time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+MAGIC = b"KSST"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+SEQ = struct.Struct("<Q")
+SEQ_OFFSET = 8
+PAYLOAD_OFFSET = 16
+BUCKETS = ("G", "Y", "C", "D", "T")
+# timestamp, time left ms, bout ms, bout no., blue[5], green[5], timeouts b/g,
+# flags, winner (0 none / 1 BLUE / 2 GREEN), code1, code2
+PAYLOAD = struct.Struct("<diiI5B5BBBBB4s4s")
+SIZE = PAYLOAD_OFFSET + PAYLOAD.size
+
+F_RUNNING, F_JAZZO, F_OVER, F_DECIDING, F_TIE = 1, 2, 4, 8, 16
+WINNERS = ("", "BLUE", "GREEN")
+
+Snapshot = namedtuple("Snapshot", "seq timestamp time_left_ms bout_ms bout blue green timeouts "
+                                  "running jazzo over deciding tie winner code1 code2")
+
+def default_name(ring=1):
+    return f"kurash_ring{int(ring)}_state"
+
+
+class StateWriter:
+    """Single writer side (the scoreboard)."""
+
+    def __init__(self, name):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=SIZE)
+        except FileExistsError:
+            # Stale segment from a previous run: reuse it if large enough
+            self.shm = shared_memory.SharedMemory(name=name)
+            if self.shm.size < SIZE:
+                self.shm.close()
+                raise
+        self.name = name
+        self.seq = 0
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, VERSION, PAYLOAD.size, self.seq)
+
+    def publish(self, time_left_ms, bout_ms, blue, green, timeouts=(0, 0), running=False, jazzo=False,
+                over=False, deciding=False, tie=False, winner="", code1="", code2="", bout=0):
+        flags = ((F_RUNNING if running else 0) | (F_JAZZO if jazzo else 0) | (F_OVER if over else 0) |
+                 (F_DECIDING if deciding else 0) | (F_TIE if tie else 0))
+        payload = PAYLOAD.pack(time.time(), int(time_left_ms), int(bout_ms), bout, *blue, *green,
+                               timeouts[0], timeouts[1], flags, WINNERS.index(winner or ""),
+                               code1.encode("ascii", "replace")[:4], code2.encode("ascii", "replace")[:4])
+        buf = self.shm.buf
+        SEQ.pack_into(buf, SEQ_OFFSET, self.seq + 1)  # odd: readers retry
+        buf[PAYLOAD_OFFSET:SIZE] = payload
+        self.seq += 2
+        SEQ.pack_into(buf, SEQ_OFFSET, self.seq)
+
+    def close(self):
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except Exception:
+            pass
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != "win32":
+        # Older Pythons track attached segments too and would unlink the
+        # scoreboard's segment when this reader exits
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class StateReader:
+    """Maps the segment once; read() returns a consistent Snapshot."""
+
+    def __init__(self, name=None, spins=1000):
+        self.shm = _attach(name or default_name())
+        magic, version, size, _ = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != VERSION or size != PAYLOAD.size:
+            self.shm.close()
+            raise ValueError(f"{name}: not a v{VERSION} scoreboard state segment")
+        self.spins = spins
+        self.last_seq = 0
+
+    def read(self, timeout=0.25):
+        buf = self.shm.buf
+        spins, deadline = 0, None
+        while True:
+            s1 = SEQ.unpack_from(buf, SEQ_OFFSET)[0]
+            if not s1 & 1:
+                raw = bytes(buf[PAYLOAD_OFFSET:SIZE])
+                if SEQ.unpack_from(buf, SEQ_OFFSET)[0] == s1:
+                    break
+            spins += 1
+            if spins >= self.spins:
+                # Writer was preempted mid-update: yield instead of burning the CPU
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                elif time.monotonic() > deadline:
+                    raise TimeoutError("writer kept the snapshot busy")
+                time.sleep(0)
+        v = PAYLOAD.unpack(raw)
+        flags = v[16]
+        self.last_seq = s1
+        return Snapshot(s1 // 2, v[0], v[1], v[2], v[3], v[4:9], v[9:14], v[14:16],
+                        bool(flags & F_RUNNING), bool(flags & F_JAZZO), bool(flags & F_OVER),
+                        bool(flags & F_DECIDING), bool(flags & F_TIE), WINNERS[v[17]],
+                        v[18].rstrip(b"\0").decode("ascii"), v[19].rstrip(b"\0").decode("ascii"))
+
+    def changed(self):
+        """True when a newer snapshot than the last read() is available (one memory read)."""
+        return SEQ.unpack_from(self.shm.buf, SEQ_OFFSET)[0] not in (self.last_seq, self.last_seq + 1)
+
+    def close(self):
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    with StateReader(sys.argv[1] if len(sys.argv) > 1 else None) as reader:
+        while True:
+            if reader.changed():
+                s = reader.read()
+                m, ms = divmod(max(0, s.time_left_ms), 60000)
+                state = " ".join(k for k in ("running", "jazzo", "deciding", "over", "tie") if getattr(s, k))
+                print(f"#{s.seq:<6} {m:02d}:{ms / 1000:06.3f}  {s.code1} {dict(zip(BUCKETS, s.blue))} "
+                      f"{s.code2} {dict(zip(BUCKETS, s.green))}  {state} {s.winner}")
+            time.sleep(0.05)
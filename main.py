@@ -7,16 +7,24 @@ Kurash Scoreboard – Photo Theme (Responsive + Zoom + Fullscreen, per-row Y/C/D
 - Zoom: = / + / KP_Add (in),  - / KP_Subtract (out),  Ctrl+0 (reset)
 - Fullscreen: F11 or Alt+Enter; Esc exits
 - Y C D T labels are placed UNDER each set of four digits for BOTH competitors.
+- --digit-sprites composes the timer/bucket digits from cached glyph images.
+- --broadcast shm|png:DIR|pipe:PATH renders off-screen RGBA frames for OBS (1080p/4K).
 """
 
 
-import os, re, sys, shutil, subprocess, tkinter as tk
+import io, os, re, sys, json, math, mmap, time, heapq, hashlib, asyncio, queue, struct, shutil, argparse, functools, threading, tempfile, subprocess, tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
+from collections import OrderedDict, deque, namedtuple
+from PIL import Image, ImageTk, ImageDraw, ImageFont
 import tkinter.font as tkfont
 
 # Backward-compatible resample filter for Pillow
 RESAMPLE = getattr(Image, "Resampling", Image).LANCZOS
+# While the window is being resized or zoomed, media are drawn with this cheaper
+# filter (from JPEG draft-mode previews) and redrawn with RESAMPLE once input
+# has been quiet for MEDIA_SETTLE_MS
+RESAMPLE_FAST = getattr(Image, "Resampling", Image).BILINEAR
+MEDIA_SETTLE_MS = 200
 
 # --- Windows DPI awareness to avoid blurry UI ---
 if sys.platform == "win32":
@@ -41,6 +49,14 @@ ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
     ROOT_DIR = sys._MEIPASS
 
+# Writable per-install state: next to the script, or a per-user folder when
+# frozen (_MEIPASS is a temporary extraction that is deleted on exit)
+if getattr(sys, "frozen", False):
+    DATA_DIR = os.path.join(os.environ.get("APPDATA") or os.environ.get("XDG_CONFIG_HOME")
+                            or os.path.join(os.path.expanduser("~"), ".config"), "KurashScoreboard")
+else:
+    DATA_DIR = ROOT_DIR
+
 FLAGS_DIR  = os.path.join(ROOT_DIR, "Flags")
 SOUNDS_DIR = os.path.join(ROOT_DIR, "Sounds")
 IKA_LOGO_PATH = os.path.join(FLAGS_DIR, "IKA.png")
@@ -76,1078 +92,3627 @@ BASE_NAME_FRAME_WIDTH = 420
 # remains consistent across 100%/125%/150% Windows scaling.
 RESPECT_DPI = True
 
-COUNTRIES = [
-    ("Afghanistan","AFG"),("Bahrain","BHR"),("Chinese Taipei","TPE"),("Hong Kong","HKG"),
-    ("India","IND"),("Indonesia","INA"),("Iran","IRI"),("Iraq","IRQ"),("Jordan","JOR"),
-    ("Japan","JPN"),("Kazakhstan","KAZ"),("Kyrgyzstan","KGZ"),("Malaysia","MAS"),("Philippines","PHI"),
-    ("Qatar","QAT"),("Saudi Arabia","KSA"),("Singapore","SGP"),("South Korea","KOR"),
-    ("Tajikistan","TJK"),("Turkmenistan","TKM"),("Thailand","THA"),("Uzbekistan","UZB"),("Vietnam","VIE"),
-]
+FLAG_EXTS = (".jpg", ".png", ".jpeg")  # preference order when a code has several files
+
+# --- Packed assets: Flags/ + Sounds/ in one memory-mapped archive ---
+# A frozen build looks for assets.pak next to the executable first (so nothing
+# is extracted to the temp dir), then in ROOT_DIR. Without a pack the loose
+# Flags/ and Sounds/ directories are used exactly as before.
+ASSET_PACK_NAME = "assets.pak"
+ASSET_PACK_DIRS = ("Flags", "Sounds")
+
+class AssetPack:
+    """Read-only archive: header b"KSPK" + u32 version + u32 index length,
+    a JSON index {"Flags/UZB.jpg": {"offset", "length"[, "size"]}}, then the blobs.
+
+    The file is memory-mapped; an entry's bytes are only paged in when it is
+    first read, so a bout touching two flags reads two flags.
+    """
+    MAGIC = b"KSPK"
+    VERSION = 1
+    HEAD = struct.Struct("<4sII")
+
+    def __init__(self, path):
+        self.path = path
+        self._extracted = {}
+        self._fh = open(path, "rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = self.HEAD.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a v{self.VERSION} asset pack")
+        self.index = json.loads(self._mm[self.HEAD.size:self.HEAD.size + index_len].decode("utf-8"))
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self, prefix=""):
+        return [n for n in self.index if n.startswith(prefix)]
+
+    def read(self, name) -> bytes:
+        e = self.index[name]
+        return self._mm[e["offset"]:e["offset"] + e["length"]]
+
+    def open(self, name):
+        return io.BytesIO(self.read(name))
+
+    def extract(self, name):
+        """Real file path for APIs that need one (e.g. winsound); written once, on first use."""
+        path = self._extracted.get(name)
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="kurash_", suffix=os.path.splitext(name)[1])
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(self.read(name))
+            self._extracted[name] = path
+        return path
+
+    def close(self):
+        for path in self._extracted.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._extracted = {}
+        try:
+            self._mm.close()
+        except Exception:
+            pass
+        self._fh.close()
+
+    @classmethod
+    def build(cls, out_path, root=ROOT_DIR, dirs=ASSET_PACK_DIRS):
+        """Pack root/<dirs> into out_path; image entries record their pixel size."""
+        files = []
+        for d in dirs:
+            base = os.path.join(root, d)
+            for fname in sorted(os.listdir(base)) if os.path.isdir(base) else []:
+                full = os.path.join(base, fname)
+                if os.path.isfile(full):
+                    files.append((f"{d}/{fname}", full))
+        if not files:
+            return 0  # keep whatever pack is already there
+        index, blobs, offset = {}, [], 0
+        for name, full in files:
+            with open(full, "rb") as fh:
+                data = fh.read()
+            entry = {"offset": offset, "length": len(data)}
+            if os.path.splitext(name)[1].lower() in FLAG_EXTS:
+                try:
+                    with Image.open(io.BytesIO(data)) as im:
+                        entry["size"] = list(im.size)
+                except Exception:
+                    pass
+            index[name] = entry
+            blobs.append(data)
+            offset += len(data)
+        # Offsets above are relative to the data section, which starts right after
+        # the index; iterate until the index (with absolute offsets) fits its slot.
+        start = cls.HEAD.size
+        while True:
+            rebased = {n: dict(e, offset=e["offset"] + start) for n, e in index.items()}
+            head_index = json.dumps(rebased, separators=(",", ":")).encode("utf-8")
+            if cls.HEAD.size + len(head_index) <= start:
+                head_index = head_index.ljust(start - cls.HEAD.size, b" ")
+                break
+            start = cls.HEAD.size + len(head_index)
+        # Written beside the target and swapped in, so a half-written pack never ships
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(out_path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(cls.HEAD.pack(cls.MAGIC, cls.VERSION, len(head_index)))
+                fh.write(head_index)
+                for data in blobs:
+                    fh.write(data)
+            os.replace(tmp, out_path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        return len(files)
+
+
+def _find_asset_pack():
+    dirs = [ROOT_DIR]
+    if getattr(sys, "frozen", False):
+        dirs.insert(0, os.path.dirname(os.path.abspath(sys.executable)))
+    for d in dirs:
+        p = os.path.join(d, ASSET_PACK_NAME)
+        if os.path.isfile(p):
+            try:
+                pack = AssetPack(p)
+            except Exception:
+                continue
+            import atexit
+            atexit.register(pack.close)  # removes files extract() wrote for winsound
+            return pack
+    return None
+
+ASSETS = _find_asset_pack()
+
+def asset_name(path):
+    """Pack entry name ("Flags/UZB.jpg") for a path under ROOT_DIR, else None."""
+    try:
+        rel = os.path.relpath(path, ROOT_DIR)
+    except ValueError:  # different drive on Windows
+        return None
+    return None if rel.startswith("..") else rel.replace(os.sep, "/")
+
+def asset_file(path):
+    """Filesystem path for an asset (extracted from the pack on first use), or None."""
+    name = asset_name(path) if ASSETS else None
+    if name and name in ASSETS:
+        return ASSETS.extract(name)
+    return path if os.path.exists(path) else None
+
+# ---------- Flag manifest ----------
+FLAG_MANIFEST_JSON = "manifest.json"   # optional prebuilt manifest inside FLAGS_DIR
+FLAG_WATCH_MS = 2000
+FLAG_IMAGE_CACHE = 24                  # decoded flags (and previews) kept, LRU: a few bouts' worth
+
+class FlagManifest:
+    """Code → {path, size, aspect} for every image in the flags directory.
+
+    Built once (from the asset pack index, a prebuilt manifest.json, or else a
+    single directory scan) so lookups never probe the filesystem. The most
+    recently used decoded images are cached per code. poll() rescans the directory and invalidates
+    entries whose file was added, replaced or removed (loose files override
+    packed ones); subscribers get the changed codes.
+    """
+    def __init__(self, directory, pack=None):
+        self.directory = directory
+        self.pack = pack
+        self.entries = {}
+        self._stamps = {}    # file name -> (mtime_ns, size) from the last scan
+        self._images = OrderedDict()    # code -> decoded PIL image, LRU
+        self._previews = OrderedDict()  # code -> reduced JPEG decode (see preview), LRU
+        # image()/preview() also run on executor threads (overlay prewarm): the
+        # caches are read and filled under the lock, decoding happens outside it,
+        # and a decode that raced a poll() invalidation is not cached
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._listeners = []
+        prefix = asset_name(directory) if pack else None
+        self._pack_prefix = f"{prefix}/" if prefix else None
+        if self._pack_prefix:
+            for name in pack.names(self._pack_prefix):
+                self._add_packed(name)
+            self._stamps = None  # loose-file overrides are picked up by the first poll
+        elif not self._load_prebuilt():
+            self._stamps = self._scan()
+            for fname in self._stamps:
+                self._add(fname)
+
+    @staticmethod
+    def _code_of(fname):
+        stem, ext = os.path.splitext(fname)
+        return (stem.upper(), ext.lower()) if ext.lower() in FLAG_EXTS else (None, None)
+
+    def _scan(self):
+        stamps = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for e in it:
+                    if e.is_file() and self._code_of(e.name)[0]:
+                        st = e.stat()
+                        stamps[e.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return stamps
+
+    def _add(self, fname):
+        code, ext = self._code_of(fname)
+        current = self.entries.get(code)
+        if current and FLAG_EXTS.index(current["ext"]) < FLAG_EXTS.index(ext):
+            return  # a preferred extension already provides this code
+        path = os.path.join(self.directory, fname)
+        w = h = None
+        try:
+            with Image.open(path) as im:  # header only; pixels are decoded on first use
+                w, h = im.size
+        except Exception:
+            pass
+        self.entries[code] = {"path": path, "ext": ext, "size": (w, h),
+                              "aspect": (w / h) if w and h else None, "packed": None}
+
+    def _add_packed(self, name):
+        fname = name[len(self._pack_prefix):]
+        code, ext = self._code_of(fname)
+        if not code:
+            return
+        current = self.entries.get(code)
+        if current and FLAG_EXTS.index(current["ext"]) < FLAG_EXTS.index(ext):
+            return
+        w, h = self.pack.index[name].get("size") or (None, None)
+        self.entries[code] = {"path": os.path.join(self.directory, fname), "ext": ext, "size": (w, h),
+                              "aspect": (w / h) if w and h else None, "packed": name}
+
+    def _load_prebuilt(self):
+        path = os.path.join(self.directory, FLAG_MANIFEST_JSON)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        for code, e in data.items():
+            w, h = e.get("size") or (None, None)
+            self.entries[code] = {"path": os.path.join(self.directory, e["file"]),
+                                  "ext": os.path.splitext(e["file"])[1].lower(), "size": (w, h),
+                                  "aspect": (w / h) if w and h else None, "packed": None}
+        # Stamps for watch mode are taken lazily on the first poll
+        self._stamps = None
+        return True
+
+    def write_prebuilt(self):
+        """Write manifest.json so frozen builds can skip the startup scan."""
+        data = {code: {"file": os.path.basename(e["path"]), "size": list(e["size"])}
+                for code, e in sorted(self.entries.items())}
+        with open(os.path.join(self.directory, FLAG_MANIFEST_JSON), "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=1)
+
+    def codes(self):
+        return list(self.entries)
+
+    def path(self, code):
+        e = self.entries.get(code.upper())
+        return e["path"] if e else None
+
+    def info(self, code):
+        return self.entries.get(code.upper())
+
+    def image(self, code):
+        """Decoded PIL image for *code* (shared: callers must not modify it), or None."""
+        code = code.upper()
+        with self._lock:
+            if code in self._images:
+                self._images.move_to_end(code)
+                return self._images[code]
+            e, gen = self.entries.get(code), self._generation
+        img = None
+        if e:
+            try:
+                src = self.pack.open(e["packed"]) if e["packed"] else e["path"]
+                with Image.open(src) as im:
+                    im.load()
+                    img = im.copy()
+            except Exception:
+                img = None
+        with self._lock:
+            if gen == self._generation:
+                img = self._images.setdefault(code, img)
+                self._trim(self._images)
+        return img
+
+    @staticmethod
+    def _trim(cache):
+        while len(cache) > FLAG_IMAGE_CACHE:
+            cache.popitem(last=False)
+
+    def preview(self, code, w, h):
+        """Reduced image of *code*, at least w×h, as cheap as possible to resample from
+        (kept per code): a 1/2–1/8 reduce() of the decoded image, or a JPEG draft-mode
+        decode when the full image has not been decoded yet."""
+        code = code.upper()
+        with self._lock:
+            prev = self._previews.get(code)
+            if prev is not None and prev.width >= w and prev.height >= h:
+                self._previews.move_to_end(code)
+                return prev
+            full, e, gen = self._images.get(code), self.entries.get(code), self._generation
+        if full is not None:
+            factor = max(1, min(8, full.width // max(1, w), full.height // max(1, h)))
+            img = full.reduce(factor) if factor > 1 else full
+        elif e and e["ext"] in (".jpg", ".jpeg"):
+            try:
+                src = self.pack.open(e["packed"]) if e["packed"] else e["path"]
+                with Image.open(src) as im:
+                    im.draft("RGB", (w, h))
+                    im.load()
+                    img = im.copy()
+            except Exception:
+                return self.image(code)
+        else:
+            return self.image(code)
+        with self._lock:
+            if gen == self._generation:
+                self._previews[code] = img
+                self._previews.move_to_end(code)
+                self._trim(self._previews)
+        return img
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def poll(self):
+        """Rescan the directory; returns (and broadcasts) the set of codes that changed."""
+        stamps = self._scan()
+        if self._stamps is None:  # prebuilt manifest: first poll only establishes a baseline
+            self._stamps = stamps
+            return set()
+        changed = {f for f in stamps.keys() | self._stamps.keys() if stamps.get(f) != self._stamps.get(f)}
+        self._stamps = stamps
+        if not changed:
+            return set()
+        codes = {self._code_of(f)[0] for f in changed}
+        with self._lock:  # readers never see a changed code without its entry
+            self._generation += 1
+            for code in codes:
+                self.entries.pop(code, None)
+                self._images.pop(code, None)
+                self._previews.pop(code, None)
+            if self._pack_prefix:
+                for name in self.pack.names(self._pack_prefix):
+                    if self._code_of(name[len(self._pack_prefix):])[0] in codes:
+                        self._add_packed(name)
+            for fname in stamps:
+                code = self._code_of(fname)[0]
+                if code in codes:
+                    if (self.entries.get(code) or {}).get("packed"):
+                        del self.entries[code]  # a loose file overrides the packed copy
+                    self._add(fname)
+        for cb in list(self._listeners):
+            try:
+                cb(codes)
+            except Exception:
+                pass
+        return codes
+
+
+FLAGS = FlagManifest(FLAGS_DIR, pack=ASSETS)
+
+# Display names for IOC codes (including legacy codes some of our flag files use)
+IOC_NAMES = {
+    "AFG":"Afghanistan","AHO":"Netherlands Antilles","ALB":"Albania","ALG":"Algeria","AND":"Andorra",
+    "ANG":"Angola","ANT":"Antigua and Barbuda","ARG":"Argentina","ARM":"Armenia","ARU":"Aruba",
+    "ASA":"American Samoa","AUS":"Australia","AUT":"Austria","AZE":"Azerbaijan","BAH":"Bahamas",
+    "BAN":"Bangladesh","BAR":"Barbados","BDI":"Burundi","BEL":"Belgium","BEN":"Benin","BER":"Bermuda",
+    "BHR":"Bahrain","BIZ":"Belize","BLR":"Belarus","BOL":"Bolivia","BOT":"Botswana","BRA":"Brazil",
+    "BSH":"Bosnia and Herzegovina","BUL":"Bulgaria","BUR":"Burkina Faso","CAF":"Central African Republic",
+    "CAM":"Cambodia","CAN":"Canada","CAY":"Cayman Islands","CGO":"Congo","CHA":"Chad","CHI":"Chile",
+    "CHN":"China","CIV":"Cote d'Ivoire","CMR":"Cameroon","COD":"DR Congo","COK":"Cook Islands",
+    "COL":"Colombia","COM":"Comoros","CPV":"Cape Verde","CRC":"Costa Rica","CRO":"Croatia","CUB":"Cuba",
+    "CYP":"Cyprus","CZE":"Czech Republic","DEN":"Denmark","DJI":"Djibouti","DMA":"Dominica",
+    "DOM":"Dominican Republic","ECU":"Ecuador","EGY":"Egypt","ESA":"El Salvador","ESP":"Spain",
+    "EST":"Estonia","FIJ":"Fiji","FIN":"Finland","FRA":"France","GBR":"Great Britain","GEO":"Georgia",
+    "GEQ":"Equatorial Guinea","GER":"Germany","GHA":"Ghana","GRE":"Greece","GRN":"Grenada",
+    "GUA":"Guatemala","GUI":"Guinea","GUM":"Guam","GUY":"Guyana","HAI":"Haiti","HKG":"Hong Kong",
+    "HON":"Honduras","HUN":"Hungary","INA":"Indonesia","IND":"India","IRI":"Iran","IRL":"Ireland",
+    "IRQ":"Iraq","ISL":"Iceland","ISR":"Israel","ISV":"US Virgin Islands","ITA":"Italy",
+    "IVB":"British Virgin Islands","JAM":"Jamaica","JOR":"Jordan","JPN":"Japan","KAZ":"Kazakhstan",
+    "KEN":"Kenya","KGZ":"Kyrgyzstan","KOR":"South Korea","KSA":"Saudi Arabia","KUW":"Kuwait","LAO":"Laos",
+    "LBA":"Libya","LBR":"Liberia","LCA":"Saint Lucia","LIB":"Lebanon","LIE":"Liechtenstein",
+    "LTU":"Lithuania","LUX":"Luxembourg","MAC":"Macau","MAD":"Madagascar","MAR":"Morocco","MAS":"Malaysia",
+    "MEX":"Mexico","MGL":"Mongolia","MKD":"North Macedonia","MLI":"Mali","MLT":"Malta","MON":"Monaco",
+    "MOZ":"Mozambique","MRI":"Mauritius","MTN":"Mauritania","MYA":"Myanmar","NAM":"Namibia","NAU":"Nauru",
+    "NCA":"Nicaragua","NED":"Netherlands","NEP":"Nepal","NFK":"Norfolk Island","NGR":"Nigeria",
+    "NIG":"Niger","NIU":"Niue","NMA":"Northern Mariana Islands","NOR":"Norway","NZL":"New Zealand",
+    "PAK":"Pakistan","PAN":"Panama","PAR":"Paraguay","PER":"Peru","PHI":"Philippines","PLE":"Palestine",
+    "PNG":"Papua New Guinea","POL":"Poland","POR":"Portugal","PRK":"North Korea","PUR":"Puerto Rico",
+    "QAT":"Qatar","ROM":"Romania","RSA":"South Africa","RUS":"Russia","SAM":"Samoa",
+    "SCG":"Serbia and Montenegro","SEN":"Senegal","SEY":"Seychelles","SGP":"Singapore",
+    "SLE":"Sierra Leone","SLO":"Slovenia","SMR":"San Marino",
+    "SOL":"Solomon Islands","SOM":"Somalia","SRI":"Sri Lanka","SUD":"Sudan","SUI":"Switzerland",
+    "SUR":"Suriname","SVK":"Slovakia","SWE":"Sweden","SYR":"Syria","TAN":"Tanzania","TGA":"Tonga",
+    "TGO":"Togo","THA":"Thailand","TJK":"Tajikistan","TKM":"Turkmenistan","TPE":"Chinese Taipei",
+    "TRI":"Trinidad and Tobago","TUN":"Tunisia","TUR":"Turkey","UAE":"United Arab Emirates",
+    "UGA":"Uganda","UKR":"Ukraine","URU":"Uruguay","USA":"United States","UZB":"Uzbekistan",
+    "VAN":"Vanuatu","VEN":"Venezuela","VIE":"Vietnam","YEM":"Yemen","ZAM":"Zambia","ZIM":"Zimbabwe",
+}
+# Flags shipped under a second, non-IOC code: listed with the country's name
+FLAG_CODE_ALIASES = {"CVI": "CPV", "EQU": "GEQ", "MDK": "MKD", "TPA": "TPE", "UZE": "UZB"}
+IOC_NAMES.update((alias, IOC_NAMES[code]) for alias, code in FLAG_CODE_ALIASES.items())
+# Codes that are always offered, even if the flag manifest is missing
+CORE_CODES = ("AFG","BHR","TPE","HKG","IND","INA","IRI","IRQ","JOR","JPN","KAZ","KGZ","MAS","PHI",
+              "QAT","KSA","SGP","KOR","TJK","TKM","THA","UZB","VIE")
+FLAG_MANIFEST = os.path.join(FLAGS_DIR, "1.txt")
+NON_COUNTRY_FLAGS = {"NONE", "IKA"}
+
+def _manifest_codes(path=FLAG_MANIFEST):
+    """IOC codes listed in Flags/1.txt (used only when the flags directory cannot be scanned)."""
+    try:
+        with open(path, encoding="utf-8-sig") as fh:
+            names = [line.strip() for line in fh]
+    except OSError:
+        return []
+    codes = (os.path.splitext(n)[0].upper() for n in names if n)
+    return [c for c in codes if c.isalpha() and c not in NON_COUNTRY_FLAGS]
+
+
+class CountryRegistry:
+    """All selectable countries with O(1) code lookup and an indexed type-ahead search.
+
+    Every substring (up to INDEX_MAX chars) of each name and code maps to a
+    pre-ranked tuple of entries, so filtering while typing is a dict lookup:
+    exact code first, then name/code prefix matches, then other substrings.
+    """
+    INDEX_MAX = 12
+
+    def __init__(self, codes, names=IOC_NAMES):
+        uniq = dict.fromkeys(c.upper() for c in codes)
+        self.entries = sorted(((names.get(c, c), c) for c in uniq), key=lambda e: (e[0].lower(), e[1]))
+        self.values = [f"{n} ({c})" for n, c in self.entries]
+        self._by_key = {}
+        for (name, code), value in zip(self.entries, self.values):
+            for key in (value, name, code):
+                # A bare country name means its IOC code, not an alias sharing the name
+                known = self._by_key.get(key.lower())
+                if known is None or known in FLAG_CODE_ALIASES:
+                    self._by_key[key.lower()] = code
+        self._index = self._build_index()
+
+    def _build_index(self):
+        ranked = {}
+        for i, (name, code) in enumerate(self.entries):
+            best = {}
+            for text in (name.lower(), code.lower()):
+                for start in range(len(text)):
+                    for end in range(start + 1, min(len(text), start + self.INDEX_MAX) + 1):
+                        key = text[start:end]
+                        rank = 2 if start else 1
+                        if key == code.lower():
+                            rank = 0
+                        if rank < best.get(key, 3):
+                            best[key] = rank
+            for key, rank in best.items():
+                ranked.setdefault(key, []).append((rank, i))
+        return {key: tuple(i for _, i in sorted(hits)) for key, hits in ranked.items()}
+
+    def code_for(self, text: str):
+        """IOC code for a display value, name or code; None if unknown."""
+        return self._by_key.get(text.strip().lower())
+
+    def search(self, query: str):
+        """Display values matching *query* by name or code, best matches first."""
+        q = query.strip().lower()
+        if not q:
+            return list(self.values)
+        if len(q) > self.INDEX_MAX:
+            # Longer than any indexed key (e.g. a full "Name (CODE)" value)
+            return [v for v in self.values if q in v.lower()]
+        return [self.values[i] for i in self._index.get(q, ())]
+
+    def value_for(self, code: str) -> str:
+        code = code.upper()
+        return f"{IOC_NAMES.get(code, code)} ({code})"
+
+
+COUNTRY_REGISTRY = CountryRegistry(
+    list(CORE_CODES) + [c for c in (FLAGS.codes() or _manifest_codes()) if c not in NON_COUNTRY_FLAGS])
+COUNTRIES = COUNTRY_REGISTRY.entries
 WEIGHTS = ["-48Kg","-52Kg","-57Kg","-60Kg","-63Kg","-65Kg","-66Kg","-70Kg","-73Kg",
            "-78Kg","-81Kg","-83Kg","-87Kg","+87Kg","-90Kg","-100Kg","+100Kg","-120Kg","+120Kg"]
 
-def country_values(): return [f"{n} ({c})" for n,c in COUNTRIES]
+def country_values(): return list(COUNTRY_REGISTRY.values)
 def parse_code(s:str)->str:
+    code = COUNTRY_REGISTRY.code_for(s)
+    if code: return code
+    # Free text that is not in the registry: keep the historical "Name (ABC)" / raw-code handling
     m=re.search(r"\(([A-Za-z]{2,3})\)$", s.strip()); return (m.group(1) if m else s.strip())[:3].upper()
 def clamp(n, lo=0, hi=99): return max(lo, min(hi, n))
 
 # Order of score buckets as rendered left → right
 SCORE_LABELS = ("G", "Y", "C", "D", "T")
 LABEL_COLORS = {"D": "#ff5252", "T": "#ff5252"}
+SIDE_COLORS = {"BLUE": ("#1976d2", "white"), "GREEN": ("#00e676", "black")}  # (bg, fg) of the winner card
 LABEL_TO_INDEX = {label: idx for idx, label in enumerate(SCORE_LABELS)}
 SCORE_COUNT = len(SCORE_LABELS)
 MAX_TIMEOUTS = 2
 
-# ---------------- Config ----------------
-class ConfigWindow(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title(f"{APP_TITLE} – Config"); self.geometry("980x720"); self.resizable(True, True)
-        self.show_flags = tk.BooleanVar(value=True)
-        self.show_names = tk.BooleanVar(value=False)
-        self.country1 = tk.StringVar(value="Turkmenistan (TKM)")
-        self.country2 = tk.StringVar(value="Uzbekistan (UZB)")
-        self.name1 = tk.StringVar(value="")
-        self.name2 = tk.StringVar(value="")
-        self.event_left = tk.StringVar(value="G-1 / No.48   Final")
-        self.gender = tk.StringVar(value="Men")
-        self.weight = tk.StringVar(value="-81Kg")
-        self.ring = tk.IntVar(value=1)
-        self.m_m = tk.IntVar(value=DEFAULT_MEN_MMSS[0]); self.m_s = tk.IntVar(value=DEFAULT_MEN_MMSS[1])
-        self.w_m = tk.IntVar(value=DEFAULT_WOMEN_MMSS[0]); self.w_s = tk.IntVar(value=DEFAULT_WOMEN_MMSS[1])
-        self._build()
+# Winner/tie overlays are re-prepared this long after the last rescale / cfg change
+OVERLAY_PREWARM_MS = 250
+
+# Resized flag PhotoImages kept per scoreboard (two flags × a few recent scales)
+FLAG_PHOTO_CACHE = 12
+
+# Render loop frame cap (Hz). State changes only mark the board dirty; widgets
+# are written at most once per frame from a consolidated view-model.
+# cfg["render_fps"] overrides this per scoreboard window.
+RENDER_FPS = 60
+
+# ---------------- Digit sprites ----------------
+class DigitSprites:
+    """Glyphs 0–9 and ':' pre-rasterized once per (pixel size, colours).
+
+    In sprite mode the timer and bucket digits are updated by swapping cached
+    PhotoImages instead of having Tk re-rasterize a 200+ pt glyph on every text
+    change or font resize. A few recent scale levels are kept (LRU).
+    """
+    GLYPHS = "0123456789:"
+
+    def __init__(self, master, max_levels=6):
+        self.master = master
+        self.max_levels = max_levels
+        self._levels = OrderedDict()  # (size_px, fg, bg) -> glyph set
+
+    def _level(self, size, fg, bg):
+        key = (size, fg, bg)
+        lvl = self._levels.get(key)
+        if lvl is None:
+            lvl = self._levels[key] = self._rasterize(size, fg, bg)
+            while len(self._levels) > self.max_levels:
+                self._levels.popitem(last=False)
+        else:
+            self._levels.move_to_end(key)
+        return lvl
+
+    def _rasterize(self, size, fg, bg):
+        font = pil_font(size)
+        ascent, descent = font.getmetrics()
+        h = ascent + descent
+        # Every digit gets the widest advance so the timer never jitters sideways
+        digit_w = int(math.ceil(max(font.getlength(d) for d in "0123456789")))
+        glyphs = {}
+        for ch in self.GLYPHS:
+            w = digit_w if ch.isdigit() else max(1, int(math.ceil(font.getlength(ch))))
+            im = Image.new("RGB", (w, h), bg)
+            ImageDraw.Draw(im).text((w / 2, ascent), ch, font=font, fill=fg, anchor="ms")
+            glyphs[ch] = im
+        return {"glyphs": glyphs, "photos": {}, "digit_w": digit_w, "h": h, "bg": bg}
+
+    def clear(self):
+        self._levels.clear()
+
+    def image(self, text, size, fg, bg, min_chars=0):
+        """PhotoImage of *text* composed from cached glyphs, centred in at least min_chars digit cells."""
+        lvl = self._level(size, fg, bg)
+        key = (text, min_chars)
+        photo = lvl["photos"].get(key)
+        if photo is None:
+            parts = [lvl["glyphs"][ch] for ch in text]
+            used = sum(p.width for p in parts)
+            w = max(1, used, min_chars * lvl["digit_w"])
+            im = Image.new("RGB", (w, lvl["h"]), bg)
+            x = (w - used) // 2
+            for p in parts:
+                im.paste(p, (x, 0)); x += p.width
+            photo = lvl["photos"][key] = ImageTk.PhotoImage(im, master=self.master)
+        return photo
+
+# ---------------- Layout profiles ----------------
+# A profile describes a display class: the font table (points on the
+# 1920×1080 design canvas, like BASE), flag / name column / cell padding
+# sizes, and either a fixed zoom or `fit`, the share of the screen the board
+# should fill. compile_layout() turns a fit profile into the concrete table
+# for one screen and DPI by measuring the rows with the real fonts once; the
+# table is cached in LAYOUT_CACHE, so the next start with the same profile
+# and screen gets its zoom and sizes without measuring or zoom-key tuning.
+# Extra profiles can be defined in layouts.json next to the app (or in the
+# working directory): {"name": {"extends": "1080p", "fonts": {"TIME": 300}, ...}}.
+LAYOUT_PROFILES = {
+    # The historical look: fixed zoom, no fitting
+    "classic": dict(fonts=BASE, flag=(FLAG_W * FLAG_BOOST, FLAG_H * FLAG_BOOST),
+                    name_col=BASE_NAME_FRAME_WIDTH, cell_pad=24, zoom=DEFAULT_ZOOM),
+    "1080p":   dict(extends="classic", fit=0.94),
+    # TVs are read from further away: timer and digits get a larger share
+    "4k":      dict(extends="classic", fit=0.92, fonts=dict(TIME=300, DIGIT=250, NAME=44, SUBMETA=40)),
+    # Wide, short LED walls: height is the limit, so keep the rows lean
+    "ledwall": dict(extends="classic", fit=0.97, cell_pad=32,
+                    fonts=dict(TIME=260, DIGIT=240, LABEL=84, NAME=40, TOPMETA=56, SUBMETA=36, WINNER=48)),
+}
+LAYOUT_DEFAULT = "classic"
+LAYOUT_FILE = "layouts.json"
+LAYOUT_CACHE = os.path.join(DATA_DIR, "layout_cache.json")
+LAYOUT_CONTROLS_PX = 72  # two rows of control buttons (default Tk font, not scaled)
+
+def layout_profiles():
+    """Built-in profiles plus those from layouts.json, with `extends` resolved."""
+    raw = dict(LAYOUT_PROFILES)
+    for d in (ROOT_DIR, os.getcwd()):
+        try:
+            with open(os.path.join(d, LAYOUT_FILE), encoding="utf-8") as fh:
+                raw.update(json.load(fh))
+        except (OSError, ValueError):
+            pass
 
-    def _build(self):
-        pad={"padx":10,"pady":8}
-        lf = ttk.Labelframe(self, text="Event / Meta"); lf.pack(fill="x", padx=12, pady=12)
-        ttk.Label(lf,text="Top-left text:").grid(row=0,column=0,sticky="w",**pad)
-        ttk.Entry(lf,width=32,textvariable=self.event_left).grid(row=0,column=1,**pad)
-        ttk.Label(lf,text="Gender:").grid(row=1,column=0,sticky="w",**pad)
-        ttk.Combobox(lf,width=12,textvariable=self.gender,values=["Men","Women","Boys","Girls"]).grid(row=1,column=1,sticky="w",**pad)
-        ttk.Label(lf,text="Weight:").grid(row=2,column=0,sticky="w",**pad)
-        ttk.Combobox(lf,width=12,textvariable=self.weight,values=WEIGHTS,state="readonly").grid(row=2,column=1,sticky="w",**pad)
-        ttk.Checkbutton(lf,text="Show flags",variable=self.show_flags).grid(row=3,column=0,sticky="w",**pad)
-        ttk.Checkbutton(lf,text="Show names (under codes)",variable=self.show_names).grid(row=3,column=1,sticky="w",**pad)
+    def resolve(name, seen=()):
+        spec = dict(raw[name])
+        parent = spec.pop("extends", None)
+        if parent is None or parent in seen:
+            return spec
+        base = resolve(parent, seen + (name,))
+        spec["fonts"] = dict(base.get("fonts", {}), **spec.get("fonts", {}))
+        return dict(base, **spec)
+
+    return {name: resolve(name) for name in raw}
+
+def _layout_extent(spec, s, metrics):
+    """Board size in px at UI scale *s*; metrics(key, pt) -> (width of "00", linespace)."""
+    sz = layout_sizes(spec, s)
+    pt, (fw, fh), pad = sz["fonts"], sz["flag"], sz["cell_pad"]
+    timeout = max(64, int(120 * s))
+    digit_w, digit_ls = metrics("DIGIT", pt["DIGIT"])
+    id_h = metrics("NAME", pt["NAME"])[1] + 8 + metrics("CODE", pt["CODE"])[1]
+    row_w = 30 + fw + 30 + sz["name_col"] + 5 * (digit_w + 2 * pad) + 30 + timeout
+    row_h = max(fh, digit_ls, id_h, timeout) + 8 + metrics("LABEL", pt["LABEL"])[1] + 8
+    top_h = max(metrics("TIME", pt["TIME"])[1],
+                metrics("TOPMETA", pt["TOPMETA"])[1] + metrics("SUBMETA", pt["SUBMETA"])[1], fh) + 12
+    ribbon_h = metrics("WINNER", pt["WINNER"])[1] + 20 + 12
+    return row_w, top_h + 2 * row_h + ribbon_h + LAYOUT_CONTROLS_PX + 24
+
+def compile_layout(spec, screen, metrics):
+    """Concrete layout for *screen* (w, h): the zoom whose UI scale fills spec['fit']
+    of it, plus the font points / media px at that scale."""
+    sw, sh = screen
+    s_win = min(sw / BASE_W, sh / BASE_H)
+    if spec.get("fit"):
+        lo, hi = 0.05, 4.0
+        for _ in range(24):  # bisect the UI scale; extents grow monotonically with it
+            mid = (lo + hi) / 2
+            w, h = _layout_extent(spec, mid, metrics)
+            if w <= sw * spec["fit"] and h <= sh * spec["fit"]:
+                lo = mid
+            else:
+                hi = mid
+        zoom = lo / s_win
+    else:
+        zoom = spec.get("zoom", DEFAULT_ZOOM)
+    return dict(layout_sizes(spec, s_win * zoom), screen=[sw, sh], zoom=zoom)
+
+def layout_sizes(spec, s):
+    """Font points and px sizes of *spec* at UI scale *s*."""
+    return {"scale": s, "fonts": {k: max(10, int(v * s)) for k, v in spec["fonts"].items()},
+            "flag": [max(30, int(spec["flag"][0] * s)), max(20, int(spec["flag"][1] * s))],
+            "cell_pad": max(12, int(spec["cell_pad"] * s)), "name_col": int(spec["name_col"] * s)}
+
+def load_layout(name, screen, dpi, metrics):
+    """Profile *name* compiled for *screen*/*dpi*, from LAYOUT_CACHE when possible.
+
+    Returns the profile spec with the compiled table under "table".
+    """
+    profiles = layout_profiles()
+    if name not in profiles:
+        raise KeyError(f"unknown layout profile {name!r} (have: {', '.join(sorted(profiles))})")
+    spec = profiles[name]
+    screen = tuple(spec.get("screen") or screen)
+    if not spec.get("fit"):
+        return dict(spec, name=name, table=compile_layout(spec, screen, metrics))  # nothing to measure
+    digest = hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:12]
+    key = f"{name}|{screen[0]}x{screen[1]}|{dpi:.1f}|{sys.platform}|{digest}"
+    try:
+        with open(LAYOUT_CACHE, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        cache = {}
+    table = cache.get(key)
+    if table is None:
+        table = cache[key] = compile_layout(spec, screen, metrics)
+        try:
+            os.makedirs(os.path.dirname(LAYOUT_CACHE), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(LAYOUT_CACHE), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(cache, fh, indent=1, sort_keys=True)
+            os.replace(tmp, LAYOUT_CACHE)
+        except OSError:
+            pass  # read-only install: compile again next time
+    return dict(spec, name=name, table=table)
+
+def tk_font_metrics(widget, font_k=1.0):
+    """metrics() for compile_layout measured with the board's font family
+    (points × *font_k*, as the board sizes them on this monitor)."""
+    fonts = {}
+    def metrics(key, pt):
+        f = fonts.get((key, pt))
+        if f is None:
+            weight = "normal" if key == "SUBMETA" else "bold"
+            f = fonts[key, pt] = tkfont.Font(root=widget, family="Arial", weight=weight,
+                                             size=max(1, round(pt * font_k)))
+        return f.measure("00"), f.metrics("linespace")
+    return metrics
+
+TEXT_METRICS_CACHE = 512
+_TEXT_METRICS = OrderedDict()  # (family, size, weight, text) -> (width, height), LRU
+
+def text_metrics(font, text):
+    """(width, height) of *text* in tkfont *font* as a Label lays it out (widest
+    line, lines × linespace), memoized per (family, size, weight, text)."""
+    key = (font.cget("family"), font.cget("size"), font.cget("weight"), text)
+    m = _TEXT_METRICS.get(key)
+    if m is not None:
+        _TEXT_METRICS.move_to_end(key)
+        return m
+    lines = text.split("\n")
+    width = max(font.measure(line) for line in lines) if text else 0
+    m = _TEXT_METRICS[key] = (width, font.metrics("linespace") * len(lines))
+    while len(_TEXT_METRICS) > TEXT_METRICS_CACHE:
+        _TEXT_METRICS.popitem(last=False)
+    return m
+
+# Which monitor the board is on and how it scales. The board measures this once
+# and again only when a Configure shows it on another monitor or at another DPI.
+ScaleContext = namedtuple("ScaleContext", "monitor screen dpi s_dpi")
+_SCREEN_DPI = {}  # Tk screen -> DPI (one DPI per X screen; fixed for the session)
+
+_WIN32_MONITOR_API = None
+
+def _win32_monitor_api():
+    """(user32, shcore, MONITORINFO) with prototypes declared; set up on first use."""
+    global _WIN32_MONITOR_API
+    if _WIN32_MONITOR_API is None:
+        import ctypes
+        from ctypes import wintypes
+        class MONITORINFO(ctypes.Structure):
+            _fields_ = [("cbSize", wintypes.DWORD), ("rcMonitor", wintypes.RECT),
+                        ("rcWork", wintypes.RECT), ("dwFlags", wintypes.DWORD)]
+        user32, shcore = ctypes.WinDLL("user32"), ctypes.WinDLL("shcore")  # private copies: prototypes stay ours
+        user32.GetParent.restype = wintypes.HWND
+        user32.GetParent.argtypes = (wintypes.HWND,)
+        user32.MonitorFromWindow.restype = wintypes.HMONITOR
+        user32.MonitorFromWindow.argtypes = (wintypes.HWND, wintypes.DWORD)
+        user32.GetMonitorInfoW.argtypes = (wintypes.HMONITOR, ctypes.POINTER(MONITORINFO))
+        shcore.GetDpiForMonitor.argtypes = (wintypes.HMONITOR, ctypes.c_int,
+                                            ctypes.POINTER(wintypes.UINT), ctypes.POINTER(wintypes.UINT))
+        _WIN32_MONITOR_API = (user32, shcore, MONITORINFO)
+    return _WIN32_MONITOR_API
+
+def _win32_monitor(widget):
+    """(monitor handle, size, effective DPI) of the monitor nearest *widget*'s window."""
+    import ctypes
+    from ctypes import wintypes
+    user32, shcore, MONITORINFO = _win32_monitor_api()
+    hwnd = user32.GetParent(widget.winfo_id()) or widget.winfo_id()  # the toplevel's frame window
+    hmon = user32.MonitorFromWindow(hwnd, 2)  # MONITOR_DEFAULTTONEAREST
+    info = MONITORINFO(); info.cbSize = ctypes.sizeof(MONITORINFO)
+    if not user32.GetMonitorInfoW(hmon, ctypes.byref(info)):
+        raise OSError("GetMonitorInfoW failed")
+    dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+    if shcore.GetDpiForMonitor(hmon, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)):  # MDT_EFFECTIVE_DPI
+        raise OSError("GetDpiForMonitor failed")
+    r = info.rcMonitor
+    return hmon, (r.right - r.left, r.bottom - r.top), float(dpi_x.value)
+
+def monitor_context(widget):
+    """ScaleContext for the monitor *widget* is on.
+
+    Windows (per-monitor DPI aware, see the top of the file) asks the OS; Tk's
+    winfo_fpixels keeps the DPI it started with, so the board scales its own
+    fonts by the difference (see _font_scale). Elsewhere Tk has one DPI per
+    screen, cached."""
+    ctx = None
+    if sys.platform == "win32":
+        try:
+            monitor, screen, dpi = _win32_monitor(widget)
+            ctx = (monitor, screen, dpi)
+        except Exception:
+            pass
+    if ctx is None:
+        monitor = widget.winfo_screen()
+        dpi = _SCREEN_DPI.get(monitor)
+        if dpi is None:
+            try:
+                dpi = _SCREEN_DPI[monitor] = widget.winfo_fpixels('1i')
+            except Exception:
+                dpi = 96.0
+        ctx = (monitor, (widget.winfo_screenwidth(), widget.winfo_screenheight()), dpi)
+    return ScaleContext(*ctx, s_dpi=max(1.0, ctx[2] / 96.0) if RESPECT_DPI else 1.0)
 
-        cf = ttk.Labelframe(self, text="Competitors"); cf.pack(fill="x", padx=12, pady=6)
-        ttk.Label(cf,text="Blue country:").grid(row=0,column=0,sticky="w",**pad)
-        ttk.Combobox(cf,width=28,state="readonly",values=country_values(),textvariable=self.country1).grid(row=0,column=1,sticky="w",**pad)
-        ttk.Label(cf,text="Blue name:").grid(row=1,column=0,sticky="w",**pad)
-        ttk.Entry(cf,width=28,textvariable=self.name1).grid(row=1,column=1,sticky="w",**pad)
-        ttk.Label(cf,text="Green country:").grid(row=2,column=0,sticky="w",**pad)
-        ttk.Combobox(cf,width=28,state="readonly",values=country_values(),textvariable=self.country2).grid(row=2,column=1,sticky="w",**pad)
-        ttk.Label(cf,text="Green name:").grid(row=3,column=0,sticky="w",**pad)
-        ttk.Entry(cf,width=28,textvariable=self.name2).grid(row=3,column=1,sticky="w",**pad)
+# ---------------- Scheduling ----------------
+# Every timed rule (1 s tick, JAZZO at half time, the 5 s auto-decision delay,
+# the click flash) goes through a scheduler, so the same code runs on Tk's
+# after() in the app and on virtual time in `--scenarios`.
+class TkScheduler:
+    """after()/after_cancel() of a Tk widget plus a monotonic clock."""
 
-        bf = ttk.Frame(self); bf.pack(fill="x", padx=12, pady=8)
-        tb = ttk.Labelframe(bf, text="Time Preset"); tb.pack(side="left", padx=6)
-        ttk.Label(tb,text="Men (MM:SS)").grid(row=0,column=0,sticky="w",**pad)
-        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.m_m).grid(row=0,column=1,**pad)
-        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.m_s).grid(row=0,column=2,**pad)
-        ttk.Label(tb,text="Women (MM:SS)").grid(row=1,column=0,sticky="w",**pad)
-        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.w_m).grid(row=1,column=1,**pad)
-        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.w_s).grid(row=1,column=2,**pad)
+    def __init__(self, widget):
+        self.widget = widget
 
-        rg = ttk.Labelframe(bf, text="Ring / Actions"); rg.pack(side="left", padx=12)
-        ttk.Radiobutton(rg,text="Ring 1",variable=self.ring,value=1).grid(row=0,column=0,sticky="w",**pad)
-        ttk.Radiobutton(rg,text="Ring 2",variable=self.ring,value=2).grid(row=0,column=1,sticky="w",**pad)
-        ttk.Button(rg,text="About",command=lambda:messagebox.showinfo("About","Responsive photo-style score")).grid(row=1,column=0,**pad)
-        ttk.Button(rg,text="Start",command=self._start).grid(row=1,column=1,**pad)
-        ttk.Button(rg,text="Exit",command=self.destroy).grid(row=1,column=2,**pad)
+    def now(self):
+        return time.perf_counter()
 
-      
-    def _start(self):
-        mm, ss = (self.m_m.get(),self.m_s.get()) if self.gender.get().lower()=="men" else (self.w_m.get(),self.w_s.get())
-        cfg=dict(
-            show_flags=self.show_flags.get(),show_names=self.show_names.get(),
-            code1=parse_code(self.country1.get()),code2=parse_code(self.country2.get()),
-            name1=self.name1.get().strip(),name2=self.name2.get().strip(),
-            event_left=self.event_left.get().strip(),gender=self.gender.get(),weight=self.weight.get(),
-            ring=int(self.ring.get()),mm=clamp(mm,0,59),ss=clamp(ss,0,59),
-        )
-        self.withdraw(); ScoreboardWindow(self,cfg)
+    def after(self, ms, fn):
+        return self.widget.after(int(ms), fn)
 
-# ---------------- Scoreboard ----------------
-class ScoreboardWindow(tk.Toplevel):
-    def __init__(self, root, cfg):
-        super().__init__(root)
-        self.root=root; self.cfg=cfg
-        self.title(APP_TITLE); self.configure(bg="black")
-        self.geometry(f"{BASE_W}x{BASE_H}"); self.minsize(900,600)
-        self._fullscreen=False
+    def cancel(self, handle):
+        if handle is None:
+            return
+        try:
+            self.widget.after_cancel(handle)
+        except Exception:
+            pass
 
-        self.time_left = cfg["mm"]*60 + cfg["ss"]
-        self.running=False; self.after_id=None
-        self.auto_winner = tk.BooleanVar(value=True)
 
-        self.blue=[0]*SCORE_COUNT; self.green=[0]*SCORE_COUNT
-        self.timeout_counts = {"BLUE": 0, "GREEN": 0}
-        self.timeout_widgets = {}
+class VirtualScheduler:
+    """Deterministic scheduler on virtual time; advance() runs due callbacks in order."""
+
+    def __init__(self, start=0.0):
+        self._now = float(start)
+        self._queue = []  # heap of (due, handle, fn)
+        self._next = 1    # handles are truthy, like Tk's after ids
+        self._cancelled = set()
+
+    def now(self):
+        return self._now
+
+    def after(self, ms, fn):
+        handle = self._next
+        self._next += 1
+        heapq.heappush(self._queue, (self.now() + max(0, ms) / 1000.0, handle, fn))
+        return handle
+
+    def cancel(self, handle):
+        if handle is not None:
+            self._cancelled.add(handle)
+
+    def pending(self):
+        return sum(1 for _, h, _ in self._queue if h not in self._cancelled)
+
+    def advance(self, seconds):
+        """Move the clock forward by *seconds*, firing every callback that falls due."""
+        end = self._now + seconds
+        while self._queue and self._queue[0][0] <= end:
+            due, handle, fn = heapq.heappop(self._queue)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            self._now = max(self._now, due)
+            fn()
+        self._now = end
+
+
+class LoopScheduler(VirtualScheduler):
+    """The same queue on the real monotonic clock, for a process with no Tk
+    mainloop (the core server): its loop calls run_due() and waits wait() s."""
+
+    def now(self):
+        return time.perf_counter()
+
+    def run_due(self):
+        while self._queue and self._queue[0][0] <= self.now():
+            _, handle, fn = heapq.heappop(self._queue)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                continue
+            fn()
+
+    def wait(self, limit):
+        """Seconds until the next callback is due, at most *limit*."""
+        while self._queue and self._queue[0][1] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(self._queue)[1])
+        if not self._queue:
+            return limit
+        return min(limit, max(0.0, self._queue[0][0] - self.now()))
+
+# ---------------- Clock sync ----------------
+# Rings on separate PCs follow one time authority (--clock-authority), e.g. the
+# results desk. Followers (--clock-sync HOST) exchange NTP-style timestamps
+# over UDP: offset = ((t2 - t1) + (t3 - t4)) / 2, delay = (t4 - t1) - (t3 - t2).
+# The sample with the lowest delay of the last SYNC_WINDOW is trusted (queueing
+# only ever adds delay), its error bound is delay / 2. The board's
+# SyncedScheduler then counts bout seconds on authority time. After the first
+# estimate, corrections are slewed at most SYNC_SLEW_RATE (s per s) so a new
+# estimate mid-bout stretches a few ticks slightly instead of jumping.
+# The authority only listens on localhost unless given a host ("0.0.0.0:PORT").
+SYNC_PORT = 47600
+SYNC_MAGIC = b"KSCK"
+SYNC_REQUEST = struct.Struct("<4sd")     # magic, t1
+SYNC_REPLY = struct.Struct("<4sddd")     # magic, t1, t2 (authority receive), t3 (authority send)
+SYNC_POLL_S = 1.0
+SYNC_BURST = 8          # quick polls at start-up so the first estimate is good
+SYNC_WINDOW = 8
+SYNC_LOST_S = 5.0       # no reply for this long: report as unsynced
+SYNC_REPORT_MS = 5000   # how often a follower board shows its sync error in the title
+SYNC_SLEW_RATE = 0.02   # a tick is at most 2 % long or short while catching up
+
+def sync_authority_address(spec=""):
+    """'' → localhost on SYNC_PORT; 'PORT' or 'HOST:PORT' otherwise."""
+    host, _, port = str(spec or "").rpartition(":")
+    return (host or "127.0.0.1", int(port) if port else SYNC_PORT)
+
+_SYNC_EPOCH = time.time() - time.perf_counter()
+
+def sync_clock():
+    """Wall-clock seconds that never step (perf_counter anchored to time.time() once)."""
+    return _SYNC_EPOCH + time.perf_counter()
+
+
+class ClockAuthority:
+    """Answers sync requests on UDP *port* from a daemon thread."""
+
+    def __init__(self, port=SYNC_PORT, host="127.0.0.1", clock=sync_clock, delay=0.0):
+        import socket
+        self.clock = clock
+        self.delay = delay  # extra reply latency, for the local stand-in only
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.port = self.sock.getsockname()[1]
+        self.served = 0
+        threading.Thread(target=self._serve, name="clock-authority", daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                pkt, addr = self.sock.recvfrom(64)
+            except OSError:
+                return  # closed
+            t2 = self.clock()
+            if len(pkt) != SYNC_REQUEST.size or pkt[:4] != SYNC_MAGIC:
+                continue
+            _, t1 = SYNC_REQUEST.unpack(pkt)
+            if self.delay:
+                time.sleep(self.delay)
+            try:
+                self.sock.sendto(SYNC_REPLY.pack(SYNC_MAGIC, t1, t2, self.clock()), addr)
+                self.served += 1
+            except OSError:
+                pass
+
+    def close(self):
+        self.sock.close()
+
+
+class ClockSync:
+    """Follower side: keeps an estimate of (authority − local) clock offset.
+
+    now() is authority time; stats has offset/delay/error in ms and whether a
+    reply arrived within SYNC_LOST_S. `offset` is the latest estimate; now()
+    applies it through the slew (see applied_offset).
+    """
+
+    def __init__(self, server, clock=sync_clock, delay=0.0):
+        import socket
+        host, _, port = server.partition(":")
+        self.addr = (host or "127.0.0.1", int(port or SYNC_PORT))
+        self.clock = clock
+        self.delay = delay  # extra request latency, for the local stand-in only
+        self.offset = 0.0
+        self._slew = None   # (local time, applied offset then, target offset); one tuple, swapped atomically
+        self.samples = []   # (delay, offset), newest last
+        self.stats = dict(synced=False, offset_ms=0.0, slew_ms=0.0, delay_ms=0.0, error_ms=None, jitter_ms=0.0,
+                          sent=0, received=0)
+        self._last_reply = None
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.settimeout(SYNC_POLL_S)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="clock-sync", daemon=True)
+        self._thread.start()
+
+    def applied_offset(self, at=None):
+        """Offset now() uses: moving towards `offset` at most SYNC_SLEW_RATE."""
+        slew = self._slew
+        if slew is None:
+            return 0.0
+        anchor, applied, target = slew
+        step = SYNC_SLEW_RATE * max(0.0, (self.clock() if at is None else at) - anchor)
+        return applied + max(-step, min(step, target - applied))
+
+    def now(self):
+        t = self.clock()
+        return t + self.applied_offset(t)
+
+    def _poll(self):
+        t1 = self.clock()
+        if self.delay:
+            time.sleep(self.delay)
+        self.sock.sendto(SYNC_REQUEST.pack(SYNC_MAGIC, t1), self.addr)
+        self.stats["sent"] += 1
+        while True:
+            try:
+                pkt = self.sock.recv(64)
+            except OSError:  # timeout, or closed
+                return None
+            t4 = self.clock()
+            if len(pkt) == SYNC_REPLY.size and pkt[:4] == SYNC_MAGIC:
+                _, r1, t2, t3 = SYNC_REPLY.unpack(pkt)
+                if r1 == t1:  # ignore late replies to earlier polls
+                    return t1, t2, t3, t4
+
+    def _update(self, t1, t2, t3, t4):
+        delay = max(0.0, (t4 - t1) - (t3 - t2))
+        offset = ((t2 - t1) + (t3 - t4)) / 2
+        self.samples = (self.samples + [(delay, offset)])[-SYNC_WINDOW:]
+        best_delay, self.offset = min(self.samples)
+        t = self.clock()
+        # First estimate: step (nothing counted on this clock yet); afterwards slew
+        self._slew = (t, self.offset if self._slew is None else self.applied_offset(t), self.offset)
+        offsets = [o for _, o in self.samples]
+        mean = sum(offsets) / len(offsets)
+        self._last_reply = time.monotonic()
+        self.stats.update(synced=True, offset_ms=self.offset * 1e3, slew_ms=(self.offset - self._slew[1]) * 1e3,
+                          delay_ms=best_delay * 1e3,
+                          error_ms=best_delay / 2 * 1e3, received=self.stats["received"] + 1,
+                          jitter_ms=math.sqrt(sum((o - mean) ** 2 for o in offsets) / len(offsets)) * 1e3)
+
+    def _run(self):
+        n = 0
+        while not self._stop.is_set():
+            try:
+                sample = self._poll()
+            except OSError:
+                sample = None
+            if sample:
+                self._update(*sample)
+            if self._last_reply is None or time.monotonic() - self._last_reply > SYNC_LOST_S:
+                self.stats["synced"] = False
+            n += 1
+            self._stop.wait(SYNC_POLL_S / 10 if n < SYNC_BURST else SYNC_POLL_S)
+
+    def close(self):
+        self._stop.set()
+        self.sock.close()
+
+
+class SyncedScheduler(TkScheduler):
+    """TkScheduler whose clock is the authority's (MatchCore ticks on its seconds)."""
+
+    def __init__(self, widget, sync):
+        super().__init__(widget)
+        self.sync = sync
+
+    def now(self):
+        return self.sync.now()
+
+
+def _sync_demo_follower(port, skew, drift, delay, seconds, results):
+    """One stand-in ring PC: its clock is off by *skew* s and runs *drift* fast."""
+    t0 = time.perf_counter()
+    clock = lambda: sync_clock() + skew + (time.perf_counter() - t0) * drift
+    sync = ClockSync(f"127.0.0.1:{port}", clock=clock, delay=delay)
+    errors = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        time.sleep(0.25)
+        if sync.stats["received"]:
+            # Every process shares the machine's monotonic clock, so the true offset is known
+            true_offset = sync_clock() - clock()
+            errors.append(abs(sync.applied_offset() - true_offset) * 1e3)
+    sync.close()
+    results.put(dict(skew_ms=skew * 1e3, drift_ppm=drift * 1e6, delay_ms=delay * 1e3,
+                     est_offset_ms=sync.stats["offset_ms"], error_bound_ms=sync.stats["error_ms"],
+                     jitter_ms=sync.stats["jitter_ms"], replies=sync.stats["received"],
+                     max_err_ms=max(errors[len(errors) // 4:] or [float("nan")]),
+                     last_err_ms=errors[-1] if errors else float("nan")))
+
+def run_sync_demo(followers=3, seconds=10.0, port=0):
+    """Local stand-in for a multi-PC event: an authority plus *followers* processes
+    with skewed, drifting clocks and added network delay; reports the sync error."""
+    import multiprocessing, random
+    authority = ClockAuthority(port, host="127.0.0.1", delay=0.0005)
+    rng = random.Random(7)
+    results = multiprocessing.Queue()
+    procs = []
+    for _ in range(followers):
+        args = (authority.port, rng.uniform(-2.0, 2.0), rng.uniform(-100e-6, 100e-6),
+                rng.uniform(0.0, 0.002), seconds, results)
+        procs.append(multiprocessing.Process(target=_sync_demo_follower, args=args))
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    authority.close()
+    print(f"{'skew ms':>9} {'drift ppm':>9} {'+delay ms':>9} {'est. ms':>10} {'bound ms':>8} "
+          f"{'jitter':>7} {'max err':>8} {'last err':>8}")
+    ok = True
+    for r in rows:
+        print(f"{r['skew_ms']:>9.1f} {r['drift_ppm']:>9.1f} {r['delay_ms']:>9.2f} {r['est_offset_ms']:>10.3f} "
+              f"{r['error_bound_ms'] or 0:>8.3f} {r['jitter_ms']:>7.3f} {r['max_err_ms']:>8.3f} {r['last_err_ms']:>8.3f}")
+        ok = ok and r["replies"] > 0
+    return ok
+
+# ---------------- Async I/O ----------------
+# Coroutines (uploads, display sync, remote control) run on an asyncio loop
+# pumped from the Tk thread in short slices, so they may touch widgets
+# directly and can never hold up the clock or key handling for more than
+# AIO_SLICE_MS. Worker threads hand results back with call_in_ui(). With no
+# task alive and nothing delivered, the pump backs off to AIO_IDLE_MS (a
+# kiosk PC should not wake 100 times a second for nothing); submit() and
+# call_in_ui() wake it early.
+AIO_SLICE_MS = 8    # max time spent in asyncio per pump
+AIO_PUMP_MS = 10    # pump interval while tasks or callbacks are about
+AIO_IDLE_MS = 500   # longest interval when idle (doubling from AIO_PUMP_MS)
+
+_COUNTING_LOOP = None
+
+def counting_event_loop():
+    """A new event loop of the platform's default class that counts callbacks
+    scheduled (call_soon / call_soon_threadsafe) and run, so a pump can tell
+    whether work is pending without looking at loop internals."""
+    global _COUNTING_LOOP
+    if _COUNTING_LOOP is None:
+        probe = asyncio.new_event_loop()
+        base = type(probe)
+        probe.close()
+
+        class CountingEventLoop(base):
+            scheduled = ran = 0
+
+            def _counted(self, callback, *args):
+                self.ran += 1
+                return callback(*args)
+
+            def call_soon(self, callback, *args, context=None):
+                self.scheduled += 1
+                return super().call_soon(self._counted, callback, *args, context=context)
+
+            def call_soon_threadsafe(self, callback, *args, context=None):
+                self.scheduled += 1
+                return super().call_soon_threadsafe(self._counted, callback, *args, context=context)
+
+            def pending(self):
+                return self.scheduled - self.ran
+
+        _COUNTING_LOOP = CountingEventLoop
+    return _COUNTING_LOOP()
+
+class TkAsyncBridge:
+    """An asyncio event loop driven cooperatively by a Tk widget's after()."""
+
+    def __init__(self, widget, slice_ms=AIO_SLICE_MS, interval_ms=AIO_PUMP_MS, idle_ms=AIO_IDLE_MS):
+        self.widget = widget
+        self.slice_ms = slice_ms
+        self.interval_ms = interval_ms
+        self.idle_ms = idle_ms
+        self._interval = interval_ms
+        self._tk_thread = threading.get_ident()
+        # Other threads wake the pump with a virtual event; only a threaded Tcl
+        # lets them post one (otherwise they wait for the next idle pump)
+        try:
+            self._threaded = bool(widget.tk.call("info", "exists", "tcl_platform(threaded)"))
+        except Exception:
+            self._threaded = False
+        self._waking = False
+        widget.bind("<<AioWake>>", self._wake, add="+")
+        self.loop = counting_event_loop()
+        # Own pool, so close() can drop queued work instead of waiting for it
+        from concurrent.futures import ThreadPoolExecutor
+        self.executor = ThreadPoolExecutor(thread_name_prefix="aio")
+        self.loop.set_default_executor(self.executor)
+        self._ui = queue.SimpleQueue()  # (fn, args) from any thread
+        self._after_id = None
+        self.stats = dict(pumps=0, callbacks=0, overruns=0, idle_pumps=0, wakes=0, last_ms=0.0, max_ms=0.0)
+        self._schedule()
+
+    def _schedule(self):
+        self._after_id = self.widget.after(self._interval, self._pump)
+
+    def _wake(self, _=None):
+        """Pump now and at the short interval again (Tk thread only)."""
+        self._waking = False
+        self._interval = self.interval_ms
+        if self._after_id is not None and not self.loop.is_closed():  # None: inside _pump, or closed
+            self.widget.after_cancel(self._after_id)
+            self.stats["wakes"] += 1
+            self._after_id = self.widget.after(0, self._pump)
+
+    def _run_once(self):
+        # One pass over the ready callbacks (never blocks: the stop is itself ready)
+        ran = self.loop.ran
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if self.loop.ran - ran <= 1:
+            # Only the stop ran: nothing was ready, so any remaining count is
+            # handles cancelled before they ran
+            self.loop.scheduled = self.loop.ran
+
+    def _busy(self):
+        return self.loop.pending() > 0 or not self._ui.empty()
+
+    def _pump(self):
+        self._after_id = None
+        self._waking = False
+        callbacks = self.stats["callbacks"]
+        start = time.perf_counter()
+        deadline = start + self.slice_ms / 1000.0
+        while True:
+            while not self._ui.empty() and time.perf_counter() < deadline:
+                fn, args = self._ui.get_nowait()
+                self.stats["callbacks"] += 1
+                try:
+                    fn(*args)
+                except Exception:
+                    self.widget.report_callback_exception(*sys.exc_info())
+            self._run_once()
+            if time.perf_counter() >= deadline or not self._busy():
+                break
+        ms = (time.perf_counter() - start) * 1000.0
+        st = self.stats
+        st["pumps"] += 1
+        st["last_ms"] = ms
+        st["max_ms"] = max(st["max_ms"], ms)
+        if self._busy():
+            st["overruns"] += 1  # work left over: come back right after Tk's own events
+            self._interval = self.interval_ms
+            self._after_id = self.widget.after(1, self._pump)
+            return
+        if st["callbacks"] != callbacks or any(not t.done() for t in asyncio.all_tasks(self.loop)):
+            self._interval = self.interval_ms
+        else:
+            st["idle_pumps"] += 1
+            self._interval = min(self.idle_ms, self._interval * 2)
+        self._schedule()
+
+    def submit(self, coro):
+        """Start *coro* on the loop (call from the Tk thread); returns the Task."""
+        task = self.loop.create_task(coro)
+        task.add_done_callback(self._report)
+        self._wake()
+        return task
+
+    def submit_threadsafe(self, coro):
+        """Start *coro* from another thread; returns a concurrent.futures.Future."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._wake_from_thread()
+        return future
+
+    def call_in_ui(self, fn, *args):
+        """Run fn(*args) on the Tk thread at the next pump. Safe from any thread."""
+        self._ui.put((fn, args))
+        if threading.get_ident() == self._tk_thread:
+            self._wake()
+        else:
+            self._wake_from_thread()
+
+    def _wake_from_thread(self):
+        if not self._threaded or self._waking:
+            return  # the next (idle) pump picks the work up
+        self._waking = True
+        try:
+            self.widget.event_generate("<<AioWake>>", when="tail")
+        except Exception:  # Tk gone or its main loop not running
+            self._waking = False
+
+    async def run_blocking(self, fn, *args):
+        """Await fn(*args) on the default thread pool (blocking disk/network calls)."""
+        return await self.loop.run_in_executor(None, fn, *args)
+
+    def _report(self, task):
+        if not task.cancelled() and task.exception() is not None:
+            exc = task.exception()
+            self.widget.report_callback_exception(type(exc), exc, exc.__traceback__)
+
+    def close(self, timeout=0.5):
+        """Cancel pending tasks, give them *timeout* seconds to unwind and close the loop.
+        Executor jobs not started yet are dropped; running ones finish in the background."""
+        if self.loop.is_closed():
+            return
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        tasks = [t for t in asyncio.all_tasks(self.loop) if not t.done()]
+        for t in tasks:
+            t.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.wait(tasks, timeout=timeout))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.loop.close()
+
+# ---------------- Match core ----------------
+def final_reason_text(reason):
+    """Win reason as worded on the final screen (and on result cards)."""
+    if reason in ("HALOL", "POINT ADVANTAGE"):
+        return f'WINS BY "{reason}"'
+    return reason or ""
+
+def copy_state(v):
+    return list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v
+
+class MatchCore:
+    """Timer and scoring rules of one bout, without any widgets.
+
+    The scoreboard renders from this state (`on_change` marks it dirty) and the
+    scenario runner drives it on a VirtualScheduler.
+    `final` is None, ("WINNER", side, reason) or ("TIE",); `ribbon` is the mid
+    ribbon as (text, bg, fg). `on_event(kind, t, data)` receives the bout
+    events (t = seconds of bout clock elapsed), e.g. for BoutAnalytics.
+    """
+
+    def __init__(self, cfg, sched, on_change=None, on_buzz=None, on_event=None):
+        self.cfg = cfg
+        self.sched = sched
+        self.on_change = on_change
+        self.on_buzz = on_buzz
+        self.on_event = on_event
+        self.after_id = None
+        self._tick_due = 0.0
+        self.bout = 0
+        self._auto_winner_after_id = None
+        self.load(cfg)
+
+    def load(self, cfg):
+        """Fresh bout with *cfg*'s names and bout time."""
+        self.cfg = cfg
+        self.halt()
+        self.bout += 1
+        self.time_left = cfg["mm"]*60 + cfg["ss"]
         self.total_match_time = self.time_left
+        self.running = False
+        self.blue = [0]*SCORE_COUNT; self.green = [0]*SCORE_COUNT
+        self.timeout_counts = {"BLUE": 0, "GREEN": 0}
         self.jaza_active = False
         self.jaza_consumed = False
         self.final_reason = ""
-        self.scale=1.0
-        self.zoom=DEFAULT_ZOOM  # default zoom (you can adjust in-app)
         self.match_over = False  # lock scoring once the match is finished
-        self.final_frame = None  # placeholder for full-screen overlay
-        self._winner_flag_img = None
+        self.final = None
+        self.winner = ""
+        self.ribbon = ("", "black", "black")
         self._event_counter = 0
         self._last_cy_event = None  # (side, label, seq)
         self._last_dt_event = None  # (side, label, seq)
         self._pending_auto_winner = None
-        self._auto_winner_after_id = None
         self.auto_deciding = False
+        self._time_up = False  # the clock ran out: the time-up rules decide this bout
         # Track origin of C points: direct vs from opponent's T penalties
         self._direct_c = {"BLUE": 0, "GREEN": 0}
         self._penalty_c = {"BLUE": 0, "GREEN": 0}
+        self._emit("load", cfg=cfg)
+        self._changed()
+
+    # Everything a RemoteCore renders, plus the rule bookkeeping restore() needs
+    SNAPSHOT_FIELDS = ("bout", "time_left", "total_match_time", "running", "blue", "green",
+                       "timeout_counts", "jaza_active", "jaza_consumed", "final_reason", "match_over",
+                       "final", "winner", "ribbon", "auto_deciding", "_event_counter", "_last_cy_event",
+                       "_last_dt_event", "_pending_auto_winner", "_direct_c", "_penalty_c", "_time_up")
+
+    def snapshot(self):
+        """Plain-data copy of the bout state (picklable / JSON-able)."""
+        snap = {k: copy_state(getattr(self, k)) for k in self.SNAPSHOT_FIELDS}
+        snap["cfg"] = dict(self.cfg)
+        snap["time_left_ms"] = self.time_left_ms()
+        return snap
+
+    def restore(self, snap):
+        """Continue the bout in *snap* (e.g. from a journal). The clock comes back
+        stopped; a pending automatic decision restarts its 5 s window."""
+        self.halt()
+        self.cfg = dict(snap["cfg"])
+        for k in self.SNAPSHOT_FIELDS:
+            v = snap.get(k, getattr(self, k))  # fields added since *snap* was journaled keep their default
+            setattr(self, k, tuple(v) if isinstance(v, list) and k not in ("blue", "green") else copy_state(v))
+        self.running = False
+        pending, self._pending_auto_winner, self.auto_deciding = self._pending_auto_winner, None, False
+        if pending and not self.match_over:
+            self._schedule_auto_win(*pending)
+        self._changed()
 
-        # Named fonts (resize together)
-        self.f_time    = tkfont.Font(family="Arial", weight="bold", size=BASE["TIME"])
-        self.f_digit   = tkfont.Font(family="Arial", weight="bold", size=BASE["DIGIT"])
-        self.f_code    = tkfont.Font(family="Arial", weight="bold", size=BASE["CODE"])
-        self.f_topmeta = tkfont.Font(family="Arial", weight="bold", size=BASE["TOPMETA"])
-        self.f_label   = tkfont.Font(family="Arial", weight="bold", size=BASE["LABEL"])
-        self.f_name    = tkfont.Font(family="Arial", weight="bold", size=BASE["NAME"])
-        self.f_winner  = tkfont.Font(family="Arial", weight="bold", size=BASE["WINNER"])
-        self.f_submeta = tkfont.Font(family="Arial", weight="normal", size=BASE["SUBMETA"])
-
-        self._blue_flag_img=None; self._green_flag_img=None
-        self._ika_logo_img=None
-        self._build(); self._bind(); self._update_time()
-        # Apply initial scale
-        self._apply_scale()
-        self.bind("<Configure>", self._on_resize)
-        self.protocol("WM_DELETE_WINDOW", self._close)
-        self.deiconify(); self.focus_force()
-        # Start fullscreen by default (F11/Esc still work)
-        self.after(0, lambda: self._toggle_fullscreen(True))
+    def halt(self):
+        """Stop every pending timer (window closing / New Match)."""
+        self.running = False
+        self._cancel_tick()
+        self._cancel_pending_auto_winner()
 
+    def _changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def _emit(self, kind, **data):
+        if self.on_event:
+            self.on_event(kind, self.total_match_time - self.time_left, data)
+
+    def _schedule_tick(self, chained=False):
+        """Next clock second. Chained ticks keep to whole seconds after the start
+        instead of 1000 ms after this callback ran, so callback latency never
+        accumulates (and a synced scheduler's seconds are the authority's)."""
+        now = self.sched.now()
+        self._tick_due = self._tick_due + 1.0 if chained else now + 1.0
+        self.after_id = self.sched.after(max(0, round((self._tick_due - now) * 1000)), self._tick)
+
+    def time_left_ms(self):
+        """Remaining time including the part of the running second already elapsed."""
+        if not self.running or self.after_id is None or self.time_left <= 0:
+            return self.time_left * 1000
+        frac = min(1.0, max(0.0, self._tick_due - self.sched.now()))
+        return (self.time_left - 1) * 1000 + int(frac * 1000)
+
+    def _cancel_tick(self):
+        if self.after_id:
+            self.sched.cancel(self.after_id)
+            self.after_id = None
 
-    # ---------- scaling ----------
-    def _calc_scale(self):
-        s_win = min(max(self.winfo_width(),1)/BASE_W, max(self.winfo_height(),1)/BASE_H)
-        try:
-            dpi = self.winfo_fpixels('1i')
-            s_dpi = max(1.0, dpi/96.0)
-        except Exception:
-            s_dpi = 1.0
-        if not RESPECT_DPI:
-            s_dpi = 1.0
-        return s_win * s_dpi * self.zoom
+    def _set_ribbon(self, text="", bg="black", fg="black"):
+        self.ribbon = (text, bg, fg)
+        self._changed()
 
-    def _apply_scale(self):
-        # Include DPI in media scale, but exclude it from font/layout scaling to avoid double DPI
-        s_media = self._calc_scale()
-        try:
-            dpi = self.winfo_fpixels('1i')
-            s_dpi = max(1.0, dpi/96.0)
-        except Exception:
-            s_dpi = 1.0
-        if not RESPECT_DPI:
-            s_dpi = 1.0
+    # ---------- timer ----------
+    def _tick(self):
+        if not self.running:
+            return
 
-        s_ui = max(0.1, s_media / s_dpi)
-        self.scale = s_ui
+        # clear previous handle; we'll set a new one if needed
+        self.after_id = None
 
-        def setsize(fontobj, base): fontobj.configure(size=max(10, int(base*s_ui)))
-        setsize(self.f_time,   BASE["TIME"])
-        setsize(self.f_digit,  BASE["DIGIT"])
-        setsize(self.f_code,   BASE["CODE"])
-        setsize(self.f_topmeta,BASE["TOPMETA"])
-        setsize(self.f_label,  BASE["LABEL"])
-        setsize(self.f_name,   BASE["NAME"])
-        setsize(self.f_winner, BASE["WINNER"])
-        setsize(self.f_submeta,BASE["SUBMETA"])
+        if self.time_left > 0:
+            self.time_left -= 1
+            self._emit("tick")
+            self._changed()
+            if self.time_left <= 0:
+                self._handle_time_expired()
+                return
+            if self._maybe_trigger_jaza_pause():
+                return
+            self._schedule_tick(chained=True)
+        else:
+            self._handle_time_expired()
 
-        self._refresh_flags()
-        self._refresh_logo()
-        self._sync_name_column_width()
+    def _handle_time_expired(self):
+        """Stop timer immediately and show final result."""
+        if self.time_left < 0:
+            self.time_left = 0
+        self._cancel_tick()
+        self._time_up = True
 
-        pad = max(12, int(24*s_ui))
-        for cell in getattr(self, "b_cells", []): cell.grid_configure(padx=pad)
-        for cell in getattr(self, "g_cells", []): cell.grid_configure(padx=pad)
-        self._update_timeout_widgets()
-        # Relayout control buttons on scale/resize
-        if hasattr(self, "_layout_control_buttons"):
-            self._layout_control_buttons()
+        self.running = False
+        self.jaza_active = False
+        self.final_reason = ""
+        self._changed()
+        if self.on_buzz:
+            self.on_buzz()
 
-    def _zoom_in(self):  self.zoom = min(3.0, self.zoom*1.08); self._apply_scale()
-    def _zoom_out(self): self.zoom = max(0.35, self.zoom/1.08); self._apply_scale()
-    def _zoom_reset(self): self.zoom = DEFAULT_ZOOM; self._apply_scale()
+        # decide winner and show full-screen overlay
+        winner = self._winner_by_point_advantage()
+        if winner:
+            self._schedule_auto_win(winner, "POINT ADVANTAGE")
+        else:
+            resolved = self._resolve_draw_by_last_event()
+            if resolved:
+                w, reason = resolved
+                self._schedule_auto_win(w, reason)
+            else:
+                self._show_tie()
 
-    def _sync_name_column_width(self):
-        frames = [getattr(self, "blue_id", None), getattr(self, "green_id", None)]
-        if not all(frames):
+    def toggle_timer(self):
+        if self.jaza_active:
             return
-        try:
-            self.update_idletasks()
-        except Exception:
-            pass
-
-        names = [self.blue_name.cget("text"), self.green_name.cget("text")]
-        codes = [self.blue_code.cget("text"), self.green_code.cget("text")]
-        name_widths = [self.f_name.measure(txt) if txt else 0 for txt in names]
-        code_widths = [self.f_code.measure(txt) if txt else 0 for txt in codes]
-
-        pad = max(40, int(48 * self.scale))
-        target_width = max(
-            int(BASE_NAME_FRAME_WIDTH * self.scale),
-            max(name_widths + [0]) + pad,
-            max(code_widths + [0]) + pad // 2
-        )
+        self.running = not self.running
+        if self.running: self._schedule_tick()
+        else: self._cancel_tick()
+        self._changed()  # a remote board interpolates the clock while `running`
 
-        name_heights = [self.blue_name.winfo_reqheight(), self.green_name.winfo_reqheight()]
-        code_heights = [self.blue_code.winfo_reqheight(), self.green_code.winfo_reqheight()]
-        content_height = max(name_heights + [0]) + max(code_heights + [0])
-        if content_height <= 0:
-            try:
-                name_ls = self.f_name.metrics("linespace")
-                code_ls = self.f_code.metrics("linespace")
-            except Exception:
-                name_ls = code_ls = 40
-            content_height = int((name_ls + code_ls) * 1.2)
+    def reset_time(self):
+        self.running = False
+        self._cancel_tick()
+        self.time_left = self.cfg["mm"]*60 + self.cfg["ss"]
+        self.total_match_time = self.time_left
+        if self.jaza_active:
+            self.show_winner("")
+        self.jaza_active = False
+        self.jaza_consumed = False
+        self.final_reason = ""
+        self._time_up = False
+        self._changed()
 
-        for frame in frames:
-            frame.config(width=target_width, height=content_height)
+    def reset_all(self):
+        self.blue = [0]*SCORE_COUNT
+        self.green = [0]*SCORE_COUNT
+        self.timeout_counts = {"BLUE": 0, "GREEN": 0}
+        self._direct_c = {"BLUE": 0, "GREEN": 0}
+        self._penalty_c = {"BLUE": 0, "GREEN": 0}
+        self.match_over = False
+        self.final = None
+        self.winner = ""
+        self.reset_time()
+        self.show_winner("")  # clear mini ribbon
+        self._event_counter = 0
+        self._last_cy_event = None
+        self._last_dt_event = None
+        self._cancel_pending_auto_winner()
+        self._emit("load", cfg=self.cfg)
 
-    # ---------- assets ----------
-    def _load_flag_image(self, code, w, h):
-        for ext in (".jpg", ".png", ".jpeg"):
-            p = os.path.join(FLAGS_DIR, f"{code.upper()}{ext}")
-            if os.path.exists(p):
-                try:
-                    with Image.open(p) as im:
-                        resized = im.resize((w, h), RESAMPLE)
-                        return ImageTk.PhotoImage(resized)
-                except Exception:
-                    return None
-        return None
- 
-    def _refresh_flags(self):
-        if not self.cfg.get("show_flags"):
-            return
-
-        # make flags scale with zoom/DPI AND boosted by FLAG_BOOST
-        fw = max(30, int(FLAG_W * self.scale * FLAG_BOOST))
-        fh = max(20, int(FLAG_H * self.scale * FLAG_BOOST))
-
-        img = self._load_flag_image(self.cfg["code1"], fw, fh)
-        if img:
-            self._blue_flag_img = img
-            self.blue_flag.config(image=self._blue_flag_img)
-
-        img = self._load_flag_image(self.cfg["code2"], fw, fh)
-        if img:
-            self._green_flag_img = img
-            self.green_flag.config(image=self._green_flag_img)
+    # ---------- JAZZO ----------
+    def _maybe_trigger_jaza_pause(self) -> bool:
+        if self._should_trigger_jaza_pause():
+            self._enter_jaza_pause()
+            return True
+        return False
 
+    def _should_trigger_jaza_pause(self) -> bool:
+        if self.jaza_active or self.jaza_consumed or self.match_over:
+            return False
+        if self.total_match_time <= 0:
+            return False
+        if self.time_left > self.total_match_time / 2:
+            return False
+        if any(self.blue) or any(self.green):
+            return False
+        return True
 
-    def _refresh_logo(self):
-        if not hasattr(self, "ika_logo"):
+    def _enter_jaza_pause(self):
+        if self.jaza_active or self.auto_deciding:
             return
+        self._cancel_tick()
+        self.running = False
+        self.jaza_active = True
+        self.jaza_consumed = True
+        self._emit("jazzo")
+        self._set_ribbon("JAZZO", "#ffe000", "black")
 
-        if not os.path.exists(IKA_LOGO_PATH):
+    def resume_from_jaza(self):
+        if self.match_over:
             return
+        if self.auto_deciding:
+            self._cancel_pending_auto_winner()
+        if not self.jaza_active:
+            return
+        self.jaza_active = False
+        self.show_winner("")
+        self._emit("resume")
+        self.running = True
+        self._schedule_tick()
 
-        # target logo roughly same height and double width of athlete flags
-        flag_w = max(30, int(FLAG_W * self.scale * FLAG_BOOST))
-        flag_h = max(20, int(FLAG_H * self.scale * FLAG_BOOST))
-        max_w = max(40, int(flag_w * 1.0))
-        max_h = max(20, int(flag_h * 1.0))
-
-        try:
-            with Image.open(IKA_LOGO_PATH) as img:
-                ow, oh = img.size
-                if ow == 0 or oh == 0:
-                    return
-                scale = min(max_w / ow, max_h / oh)
-                new_size = (max(10, int(ow * scale)), max(10, int(oh * scale)))
-                resized = img.resize(new_size, RESAMPLE)
-                self._ika_logo_img = ImageTk.PhotoImage(resized)
-                self.ika_logo.config(image=self._ika_logo_img)
-        except Exception:
-            pass
-
-
-    def _sound_file(self): return os.path.join(SOUNDS_DIR, f"Ring{int(self.cfg.get('ring',1)):02d}.wav")
-    def _buzz(self):
-        path=self._sound_file()
-        try:
-            if os.name=="nt":
-                import winsound
-                if os.path.exists(path): winsound.PlaySound(path, winsound.SND_FILENAME|winsound.SND_ASYNC)
-                else: winsound.MessageBeep(winsound.MB_ICONEXCLAMATION); return
-                return
-            if os.path.exists(path):
-                if sys.platform=="darwin" and shutil.which("afplay"): subprocess.Popen(["afplay",path]); return
-                if sys.platform.startswith("linux") and shutil.which("aplay"): subprocess.Popen(["aplay","-q",path]); return
-                try:
-                    import simpleaudio as sa; sa.WaveObject.from_wave_file(path).play(); return
-                except Exception: pass
-            self.bell()
-        except Exception: self.bell()
-
-    # ---------- build ----------
-    def _build(self):
-        # Top bar grid L/C/R
-        top = tk.Frame(self, bg="black"); top.pack(fill="x", pady=(8,0))
-        top.grid_columnconfigure(0, weight=1)
-        top.grid_columnconfigure(1, weight=2)
-        top.grid_columnconfigure(2, weight=1)
-
-        self.top_left_meta = tk.Label(top, text=self.cfg.get("event_left",""),
-                                      fg="white", bg="black", font=self.f_topmeta)
-        self.top_left_meta.grid(row=0, column=0, sticky="w", padx=20)
+    # ---------- scoring ----------
+    def delta(self, side, idx, d):
+        """Operator +/- on one bucket of BLUE or GREEN."""
+        if self.match_over or self.auto_deciding: return
+        scores = self.blue if side == "BLUE" else self.green
+        prev = scores[idx]
+        new_val = clamp(prev + d)
+        delta = new_val - prev
+        if delta == 0:
+            return
 
-        left_detail = f"{self.cfg['gender']}   {self.cfg['weight']}"
-        self.top_left_detail = tk.Label(top, text=left_detail, fg="#cccccc", bg="black", font=self.f_submeta)
-        self.top_left_detail.grid(row=1, column=0, sticky="w", padx=20, pady=(0,0))
+        scores[idx] = new_val
+        # Bookkeep direct C changes when operator edits C bucket
+        if SCORE_LABELS[idx] == "C":
+            if delta > 0:
+                self._direct_c[side] += delta
+            else:
+                take = min(-delta, self._direct_c[side])
+                self._direct_c[side] -= take
+                # If operator reduced more than direct, trim penalty-tagged C as well
+                rem = -delta - take
+                if rem > 0:
+                    self._penalty_c[side] = max(0, self._penalty_c[side] - rem)
+                # Keep within total C
+                total_c = scores[LABEL_TO_INDEX["C"]]
+                self._direct_c[side] = min(self._direct_c[side], total_c)
+                self._penalty_c[side] = min(self._penalty_c[side], total_c - self._direct_c[side])
+        self._record_score_event(side, SCORE_LABELS[idx], delta)
+        self._apply_penalty_side_effects(is_blue=(side == "BLUE"), idx=idx, delta=delta)
+        if delta < 0:
+            self._emit("correction", side=side, label=SCORE_LABELS[idx], delta=delta)
+        self._emit("lead", leader=self._winner_by_point_advantage())
+        self._changed()
+        self._check_penalty_end()
+
+    def reset_bucket(self, side, idx):
+        scores = self.blue if side == "BLUE" else self.green
+        prev, scores[idx] = scores[idx], 0
+        if SCORE_LABELS[idx] == "C":
+            self._direct_c[side] = self._penalty_c[side] = 0
+        if prev:
+            self._emit("correction", side=side, label=SCORE_LABELS[idx], delta=-prev)
+            self._emit("lead", leader=self._winner_by_point_advantage())
+        self._changed()
+
+    def timeout(self, side: str):
+        if self.match_over:
+            return
 
-        self.time_lbl = tk.Label(top, text="00:00", fg="red", bg="black", font=self.f_time)
-        self.time_lbl.grid(row=0, column=1, rowspan=2, sticky="n", pady=(0,4))
+        current = self.timeout_counts.get(side, 0)
+        if current >= MAX_TIMEOUTS:
+            opponent = "GREEN" if side == "BLUE" else "BLUE"
+            self._schedule_auto_win(opponent, "Time out")
+            return
 
-        self.ika_logo = tk.Label(top, bg="black")
-        self.ika_logo.grid(row=0, column=2, rowspan=2, sticky="e", padx=20)
-        self._refresh_logo()
+        self.timeout_counts[side] = current + 1
+        self._emit("timeout", side=side)
+        self._changed()
 
-        # Middle area
-        mid = tk.Frame(self, bg="black"); mid.pack(expand=True, fill="both", pady=6)
+    def halol(self, side: str):
+        if self.match_over:
+            return
+        self._finish_match_with_winner(side, reason="HALOL")
 
-        # ----- BLUE row (centered) -----
-        blue_row = tk.Frame(mid, bg="black"); blue_row.pack(fill="x", pady=4)
-        tk.Frame(blue_row, bg="black").pack(side="left", expand=True)
+    def _record_score_event(self, side: str, label: str, delta: int, mirrored=False):
+        if delta <= 0:
+            return
+        self._emit("score", side=side, label=label, delta=delta, mirrored=mirrored)
+        self._event_counter += 1
+        seq = self._event_counter
+        if label in ("C", "Y"):
+            self._last_cy_event = (side, label, seq)
+        elif label in ("D", "T"):
+            self._last_dt_event = (side, label, seq)
 
-        # Flag
-        self.blue_flag = tk.Label(blue_row, bg="black")
-        if self.cfg.get("show_flags"): self.blue_flag.pack(side="left", padx=(20,10))
+    def _apply_penalty_side_effects(self, is_blue: bool, idx: int, delta: int):
+        """Mirror T/D penalties to the opponent (gives them C or Y)."""
+        if delta == 0:
+            return
 
-        # NEW: vertical stack for name (blue box) + code
-        self.blue_id = tk.Frame(blue_row, bg="black")
-        self.blue_id.pack(side="left", padx=(0,30))
-        self.blue_id.pack_propagate(False)
+        opponent = self.green if is_blue else self.blue
+        opponent_side = "GREEN" if is_blue else "BLUE"
 
-        self.blue_name = tk.Label(
-            self.blue_id, text=self.cfg.get("name1",""),
-            bg="#1976d2", fg="white", font=self.f_name, padx=12, pady=4,
-            anchor="w", justify="left"
-        )
-        self.blue_name.pack(side="top", fill="x")
+        label = SCORE_LABELS[idx]
+        if label == "G":
+            winner = "GREEN" if is_blue else "BLUE"
+            self._schedule_auto_win(winner, "G PENALTY")
+            return
+        if label == "T":  # T gives opponent a C (or removes if delta<0)
+            c_idx = LABEL_TO_INDEX["C"]
+            before_c = opponent[c_idx]
+            new_c = clamp(before_c + delta)
+            opponent[c_idx] = new_c
+            gained_c = new_c - before_c
+            # Maintain bookkeeping of penalty-awarded C for opponent
+            if delta > 0:
+                self._penalty_c[opponent_side] = max(0, self._penalty_c[opponent_side] + delta)
+            elif delta < 0:
+                take = min(-delta, self._penalty_c[opponent_side])
+                self._penalty_c[opponent_side] -= take
+                # Ensure consistency: penalty C cannot exceed total C
+                self._penalty_c[opponent_side] = min(self._penalty_c[opponent_side], opponent[c_idx])
 
-        self.blue_code = tk.Label(
-            self.blue_id, text=self.cfg["code1"],
-            fg="white", bg="black", font=self.f_code, anchor="w", justify="left"
-        )
-        self.blue_code.pack(side="top", fill="x")
+            if gained_c > 0:
+                self._record_score_event(opponent_side, "C", gained_c, mirrored=True)
+        elif label == "D":  # D gives opponent a Y and removes any mirrored C from previous T
+            y_idx = LABEL_TO_INDEX["Y"]
+            before_y = opponent[y_idx]
+            new_y = clamp(before_y + delta)
+            opponent[y_idx] = new_y
+            gained_y = new_y - before_y
+            if gained_y > 0:
+                self._record_score_event(opponent_side, "Y", gained_y, mirrored=True)
+                c_idx = LABEL_TO_INDEX["C"]
+                # Remove one mirrored C if present
+                opponent[c_idx] = clamp(opponent[c_idx] - 1)
+                if self._penalty_c[opponent_side] > 0:
+                    self._penalty_c[opponent_side] -= 1
+                # Ensure consistency bounds
+                self._penalty_c[opponent_side] = max(0, min(self._penalty_c[opponent_side], opponent[c_idx]))
+                penalized = self.blue if is_blue else self.green
+                t_idx = LABEL_TO_INDEX["T"]
+                if penalized[t_idx] > 0:
+                    penalized[t_idx] = clamp(penalized[t_idx] - 1)
 
-        # digits + labels in one grid
-        self.b_digits_frame = tk.Frame(blue_row, bg="black"); self.b_digits_frame.pack(side="left")
-        self.b_digits, self.b_cells = [], []
-        for i, letter in enumerate(SCORE_LABELS):
-            cell = tk.Frame(self.b_digits_frame, bg="#222"); cell.grid(row=0, column=i, padx=24)
-            digit_color = "#ff5252" if letter in ("D","T") else "white"
-            lbl  = tk.Label(cell, text="0", fg=digit_color, bg="#222", font=self.f_digit, width=2); lbl.pack()
-            self.b_cells.append(cell); self.b_digits.append(lbl)
-            # NEW: make the box clickable for Blue
-            self._attach_score_clicks(cell, lbl, is_blue=True, idx=i)
+    def _check_penalty_end(self):
+        """End the match if penalty thresholds reached."""
+        if self.match_over or self.auto_deciding:
+            return True
+        # Immediate end if any side reaches 2×Y (treat as POINT ADVANTAGE wording)
+        y_idx = LABEL_TO_INDEX["Y"]
+        if self.blue[y_idx] >= 2:
+            self._finish_match_with_winner("BLUE", reason="POINT ADVANTAGE")
+            return True
+        if self.green[y_idx] >= 2:
+            self._finish_match_with_winner("GREEN", reason="POINT ADVANTAGE")
+            return True
+        return False
 
-            fg = LABEL_COLORS.get(letter, "#ffe000")
-            tk.Label(self.b_digits_frame, text=letter,
-                    fg=fg, bg="black", font=self.f_label).grid(row=1, column=i, pady=(8,0))
-        
-        self._create_timeout_control(blue_row, is_blue=True)
+    # ---------- decisions ----------
+    def _winner_by_point_advantage(self) -> str:
+        """Compare scores with Y outranking any number of C points.
 
-        tk.Frame(blue_row, bg="black").pack(side="left", expand=True)
+        Returns "BLUE", "GREEN", or "" if equal by Y and C (true draw).
+        """
+        y_idx = LABEL_TO_INDEX["Y"]
+        c_idx = LABEL_TO_INDEX["C"]
+        blue_pair = (self.blue[y_idx], self.blue[c_idx])
+        green_pair = (self.green[y_idx], self.green[c_idx])
+        if blue_pair > green_pair:
+            return "BLUE"
+        if green_pair > blue_pair:
+            return "GREEN"
+        # If Y and C are equal, prefer side with more DIRECT C (not from penalties)
+        if blue_pair[1] > 0 or green_pair[1] > 0:
+            b_dc = self._direct_c.get("BLUE", 0)
+            g_dc = self._direct_c.get("GREEN", 0)
+            if b_dc != g_dc:
+                return "BLUE" if b_dc > g_dc else "GREEN"
+        return ""
 
+    def _resolve_draw_by_last_event(self):
+        latest = None
+        if self._last_cy_event:
+            side, label, seq = self._last_cy_event
+            latest = ("CY", side, label, seq)
+        if self._last_dt_event:
+            side, label, seq = self._last_dt_event
+            if not latest or seq > latest[3]:
+                latest = ("DT", side, label, seq)
+        if not latest:
+            return None
 
-        # Winner ribbon (center)
-        self.winner_area = tk.Frame(mid, bg="black")
-        self.winner_area.pack(fill="x", pady=6)
+        kind, side, label, _ = latest
+        if kind == "CY":
+            if label == "Y":
+                return side, 'Last "Y" score'
+            if label == "C":
+                return side, 'Last "C" score'
+            return side, f"Last {label}"
 
-        self.winner_lbl = tk.Label(
-            self.winner_area, text="",
-            font=self.f_winner, fg="black", bg="black",
-            padx=30, pady=10
-        )
-        self.winner_lbl.pack()
+        winner = "GREEN" if side == "BLUE" else "BLUE"
+        if label == "D":
+            return winner, 'Last "Y" score'
+        if label == "T":
+            return winner, 'Last "C" score'
+        return winner, f"LAST {label} PENALTY"
 
+    def _cancel_pending_auto_winner(self):
+        if self._auto_winner_after_id:
+            self.sched.cancel(self._auto_winner_after_id)
+            self._auto_winner_after_id = None
+        self._pending_auto_winner = None
+        self.auto_deciding = False
 
-        # ----- GREEN row (centered) -----
-        green_row = tk.Frame(mid, bg="black"); green_row.pack(fill="x", pady=4)
-        tk.Frame(green_row, bg="black").pack(side="left", expand=True)
+    def _schedule_auto_win(self, winner: str, reason: str = ""):
+        """Stop the bout and delay automatic winner for 5s to allow overrides."""
+        if not winner:
+            return
+        existing = self._pending_auto_winner
+        if self.auto_deciding and existing and existing[0] == winner and existing[1] == reason:
+            return
 
-        # Flag
-        self.green_flag = tk.Label(green_row, bg="black")
-        if self.cfg.get("show_flags"): self.green_flag.pack(side="left", padx=(20,10))
+        self._cancel_pending_auto_winner()
+        self.auto_deciding = True
+        self.final_reason = reason or ""
 
-        # NEW: vertical stack for code + name (green box)
-        self.green_id = tk.Frame(green_row, bg="black")
-        self.green_id.pack(side="left", padx=(0,30))
-        self.green_id.pack_propagate(False)
+        # Halt timers / pauses
+        self._cancel_tick()
+        self.running = False
+        self.jaza_active = False
+        self.final = None
 
-        self.green_code = tk.Label(
-            self.green_id, text=self.cfg["code2"],
-            fg="white", bg="black", font=self.f_code, anchor="w", justify="left"
-        )
-        self.green_code.pack(side="top", fill="x")
+        self._pending_auto_winner = (winner, reason)
+        self._set_ribbon()
+        self._auto_winner_after_id = self.sched.after(5000, self._apply_pending_auto_winner)
 
-        self.green_name = tk.Label(
-            self.green_id, text=self.cfg.get("name2",""),
-            bg="#2e7d32", fg="white", font=self.f_name, padx=12, pady=4,
-            anchor="w", justify="left"
-        )
-        self.green_name.pack(side="top", fill="x")
+    def _apply_pending_auto_winner(self):
+        pending = self._pending_auto_winner
+        self._cancel_pending_auto_winner()
+        if not pending or self.match_over:
+            return
+        winner, reason = pending
+        self._finish_match_with_winner(winner, reason)
 
-        # digits + labels in one grid
-        self.g_digits_frame = tk.Frame(green_row, bg="black"); self.g_digits_frame.pack(side="left")
-        self.g_digits, self.g_cells = [], []
-        for i, letter in enumerate(SCORE_LABELS):
-            cell = tk.Frame(self.g_digits_frame, bg="#222"); cell.grid(row=0, column=i, padx=24)
-            digit_color = "#ff5252" if letter in ("D","T") else "white"
-            lbl  = tk.Label(cell, text="0", fg=digit_color, bg="#222", font=self.f_digit, width=2); lbl.pack()
-            self.g_cells.append(cell); self.g_digits.append(lbl)
+    def _finish_match_with_winner(self, winner: str, reason: str = ""):
+        """Stop the match immediately and declare the winner."""
+        if self.match_over:
+            return
+        self._cancel_pending_auto_winner()
+        self.running = False
+        self._cancel_tick()
+        self.jaza_active = False
+        self.final_reason = reason or ""
+        self.match_over = True
+        self.show_winner(winner, reason)
 
-            # Make the green box clickable as well
-            self._attach_score_clicks(cell, lbl, is_blue=False, idx=i)
+    def _show_tie(self):
+        self.match_over = True
+        self.final = ("TIE",)
+        self._emit_end()
+        self._changed()
+
+    def _emit_end(self):
+        self._emit("end", winner=self.winner, reason=self.final_reason, tie=self.final == ("TIE",),
+                   blue=list(self.blue), green=list(self.green), timeouts=dict(self.timeout_counts),
+                   direct_c=dict(self._direct_c), last_cy=self._last_cy_event, last_dt=self._last_dt_event,
+                   time_up=self._time_up)
+
+    def show_winner(self, who: str, reason: str = ""):
+        """Operator/auto winner: ribbon mid-match, final screen once the bout is decided."""
+        was_auto_deciding = self.auto_deciding
+        if who:
+            self._cancel_pending_auto_winner()
+        if not who:
+            self._set_ribbon()
+            self.final_reason = ""
+            return
 
-            fg = LABEL_COLORS.get(letter, "#ffe000")
-            tk.Label(self.g_digits_frame, text=letter,
-                    fg=fg, bg="black", font=self.f_label).grid(row=1, column=i, pady=(8,0))
+        self.final_reason = reason or ""
+        reason_display = self.final_reason
 
-        self._create_timeout_control(green_row, is_blue=False)
+        if who == "BLUE":
+            if reason_display == "HALOL":
+                text = 'Blue competitor wins by "HALOL"'
+            elif reason_display == "POINT ADVANTAGE":
+                text = 'Blue competitor wins by "POINT ADVANTAGE"'
+            else:
+                text = f"{self.cfg['name1']} WINS"
+            self._set_ribbon(text, "#1976d2", "white")
+        elif who == "GREEN":
+            if reason_display == "HALOL":
+                text = 'Green competitor wins by "HALOL"'
+            elif reason_display == "POINT ADVANTAGE":
+                text = 'Green competitor wins by "POINT ADVANTAGE"'
+            else:
+                text = f"{self.cfg['name2']} WINS"
+            self._set_ribbon(text, "#00e676", "black")
 
-        tk.Frame(green_row, bg="black").pack(side="left", expand=True)
+        # If match already ended (or you just want to force the final screen), show overlay too
+        if was_auto_deciding:
+            self.match_over = True
+        if (not self.running and self.time_left == 0) or self.match_over or was_auto_deciding:
+            self.match_over = True
+            self.winner = who
+            self.final = ("WINNER", who, reason_display) if who in ("BLUE", "GREEN") else ("TIE",)
+            self._emit_end()
+            self._changed()
+
+# ---------------- Bout analytics ----------------
+# Coaching numbers are aggregated while the bout runs, from MatchCore events.
+# Each event costs O(1). When the bout ends, one compact summary goes to
+# `on_summary` (`--analytics FILE` appends it as a JSON line).
+class BoutAnalytics:
+    """Incremental per-bout aggregates: first score, scoring rate, penalty
+    timeline, time leading and what happened after JAZZO."""
+
+    def __init__(self, on_summary=None):
+        self.on_summary = on_summary
+        self.bouts = 0
+        self._reset({})
+
+    def _reset(self, cfg):
+        self.cfg = cfg
+        self.first_score = None              # (t, side, label)
+        self.scores = {"BLUE": 0, "GREEN": 0}  # C/Y awards, incl. mirrored from penalties
+        self.penalties = []                  # [t, side, label]
+        self.timeouts = []                   # [t, side]
+        self.corrections = 0
+        self.leader = ""
+        self.lead_s = {"BLUE": 0, "GREEN": 0, "": 0}
+        self.lead_changes = 0
+        self.elapsed = 0
+        self.jazzo = None                    # {"at", "resumed_at", "first_score_after_s", "scores_after"}
+        self.ended = None                    # last summary of this bout (re-sent if the decision changes)
+        self.timeline = []                   # [t, kind, data] of every event but ticks
+
+    def event(self, kind, t, data):
+        """MatchCore.on_event hook."""
+        self.elapsed = max(self.elapsed, t)
+        if kind not in ("tick", "load"):
+            self.timeline.append([t, kind, data])
+        if kind == "tick":
+            self.lead_s[self.leader] += 1
+        elif kind == "score":
+            side, label = data["side"], data["label"]
+            if label in ("C", "Y"):
+                self.scores[side] += data["delta"]
+                if self.first_score is None:
+                    self.first_score = (t, side, label)
+                jz = self.jazzo
+                if jz and jz["resumed_at"] is not None:
+                    jz["scores_after"][side] += data["delta"]
+                    if jz["first_score_after_s"] is None:
+                        jz["first_score_after_s"] = t - jz["resumed_at"]
+            elif not data["mirrored"]:
+                self.penalties.append([t, side, label])
+        elif kind == "correction":
+            self.corrections += 1
+        elif kind == "lead":
+            if data["leader"] != self.leader:
+                self.leader = data["leader"]
+                self.lead_changes += 1
+        elif kind == "timeout":
+            self.timeouts.append([t, data["side"]])
+        elif kind == "jazzo":
+            self.jazzo = {"at": t, "resumed_at": None, "first_score_after_s": None,
+                          "scores_after": {"BLUE": 0, "GREEN": 0}}
+        elif kind == "resume":
+            if self.jazzo and self.jazzo["resumed_at"] is None:
+                self.jazzo["resumed_at"] = t
+        elif kind == "end":
+            self._end(data)
+        elif kind == "load":
+            self._reset(data["cfg"])
+
+    def _end(self, data):
+        if self.ended is None:
+            self.bouts += 1
+        minutes = self.elapsed / 60.0
+        cfg = self.cfg
+        summary = {
+            "bout": self.bouts,
+            "codes": [cfg.get("code1", ""), cfg.get("code2", "")],
+            "names": [cfg.get("name1", ""), cfg.get("name2", "")],
+            "event": cfg.get("event_left", ""), "weight": cfg.get("weight", ""),
+            "bout_s": cfg.get("mm", 0) * 60 + cfg.get("ss", 0),
+            "elapsed_s": self.elapsed,
+            "winner": data["winner"], "reason": data["reason"], "tie": data["tie"],
+            "first_score": None if self.first_score is None else
+                dict(zip(("t", "side", "label"), self.first_score)),
+            "scores": dict(self.scores),
+            "rate_per_min": {s: round(n / minutes, 2) if minutes else 0.0 for s, n in self.scores.items()},
+            "penalties": self.penalties,
+            "timeouts": self.timeouts,
+            "corrections": self.corrections,
+            "lead_s": {"BLUE": self.lead_s["BLUE"], "GREEN": self.lead_s["GREEN"], "level": self.lead_s[""]},
+            "lead_changes": self.lead_changes,
+            "jazzo": self.jazzo,
+            "buckets": {"BLUE": dict(zip(SCORE_LABELS, data["blue"])),
+                        "GREEN": dict(zip(SCORE_LABELS, data["green"]))},
+            "direct_c": data["direct_c"],
+            "last_events": {"cy": data["last_cy"], "dt": data["last_dt"]},
+            "time_up": data.get("time_up", False),
+        }
+        if self.ended is not None:
+            summary["amended"] = True  # e.g. operator picked a winner on the tie screen
+        self.ended = summary
+        if self.on_summary:
+            self.on_summary(summary)
+
+def append_jsonl(path, record):
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+# ---------------- Core process ----------------
+# With --core-process the MatchCore runs in its own process (main.py
+# --core-server) on a LoopScheduler, so Tk stalls (dialogs, big resizes,
+# relayouts) cannot delay the clock or the 5 s auto decision. The board talks
+# to it through RemoteCore: commands go out, state snapshots / events / the
+# buzzer come back. The server outlives a crashed UI; a restarted board
+# re-attaches and continues the bout. Every command, event and state change
+# is journaled, so a restarted server resumes the last bout (clock stopped);
+# past CORE_JOURNAL_BYTES the journal is compacted to the current state.
+CORE_PORT_BASE = 47800          # ring N listens on 127.0.0.1:(CORE_PORT_BASE + N)
+CORE_AUTHKEY = b"kurash-core"
+CORE_COMMANDS = frozenset(("load", "halt", "toggle_timer", "reset_time", "reset_all", "resume_from_jaza",
+                           "delta", "reset_bucket", "timeout", "halol", "show_winner"))
+CORE_CONNECT_S = 5.0
+CORE_REPLY_S = 3.0              # attach → first state snapshot, before the board falls back in-process
+CORE_ACCEPT_FAILURES = 20       # consecutive accept() errors before the server gives up
+CORE_JOURNAL_BYTES = 1 << 20    # compacted to its last state snapshot beyond this
+# cfg keys that belong to the bout (a re-attached board takes them from the server)
+BOUT_FIELDS = ("name1", "code1", "name2", "code2", "event_left", "gender", "weight", "ring", "mm", "ss")
+
+def core_address(spec="", ring=1):
+    """'' → this ring's default port; 'PORT' or 'HOST:PORT' otherwise."""
+    host, _, port = (spec or "").rpartition(":")
+    return (host or "127.0.0.1", int(port) if port else CORE_PORT_BASE + int(ring or 1))
+
+def last_journal_state(path):
+    """Last state snapshot in a core journal, or None."""
+    state = None
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith('{"state"'):
+                    try:
+                        state = json.loads(line)["state"]
+                    except ValueError:
+                        pass  # torn last line of a killed server
+    except OSError:
+        return None
+    return state
+
+
+class CoreServer:
+    """MatchCore behind a local socket; one UI client at a time (the newest wins)."""
+
+    def __init__(self, address, journal=None):
+        self.address = address
+        self.sched = LoopScheduler()
+        self.core = None
+        self.conn = None
+        self.dirty = False
+        self.stopped = False
+        self._conns = queue.Queue()
+        self._journal_path = journal
+        self._journal = open(journal, "a", encoding="utf-8") if journal else None
+        state = last_journal_state(journal) if journal else None
+        if state and not state["match_over"]:
+            self._make_core(state["cfg"], state)
+
+    def _make_core(self, cfg, state=None):
+        """New core for *cfg*, continuing the bout in *state* if given (no "load" event then)."""
+        self.core = MatchCore(cfg, self.sched, on_change=self._changed, on_buzz=self._buzz,
+                              on_event=None if state else self._event)
+        if state:
+            self.core.restore(state)
+            self.core.on_event = self._event
+            self._log(restored=state["bout"])
+
+    def _log(self, **record):
+        if self._journal:
+            record["at"] = round(time.time(), 3)
+            self._journal.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._journal.flush()
+            if self._journal.tell() > CORE_JOURNAL_BYTES and self.core is not None:
+                self._compact_journal()
+
+    def _compact_journal(self):
+        """Restart the journal from the current state: all a restarted server needs."""
+        self._journal.close()
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self._journal_path)), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(dict(state=self.core.snapshot(), compacted=True, at=round(time.time(), 3)),
+                                ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(tmp, self._journal_path)
+        self._journal = open(self._journal_path, "a", encoding="utf-8")
+
+    def _send(self, msg):
+        if self.conn is None:
+            return
+        try:
+            self.conn.send(msg)
+        except (OSError, EOFError):
+            self.conn = None  # UI went away; keep the clock running for the next one
 
-        # Controls (also add small helpers for fullscreen/zoom)
-        # Controls (centered row, responsive wrap)
-        self.ctrl = tk.Frame(self, bg="black"); self.ctrl.pack(fill="x", pady=6)
+    def _changed(self):
+        self.dirty = True
 
-        # Container for buttons; we will grid them responsively in multiple rows
-        self.ctrl_btns = tk.Frame(self.ctrl, bg="black")
-        self.ctrl_btns.pack()
+    def _buzz(self):
+        self._send(("buzz",))
+
+    def _event(self, kind, t, data):
+        self._log(event=kind, t=t, data=data)
+        self._send(("event", kind, t, data))
+
+    def _flush(self):
+        if self.dirty and self.core is not None:
+            self.dirty = False
+            snap = self.core.snapshot()
+            self._log(state=snap)
+            self._send(("state", snap))
+
+    def _accept(self, listener):
+        failures = 0
+        while not self.stopped:
+            try:
+                self._conns.put(listener.accept())
+                failures = 0
+            except Exception as e:
+                if self.stopped:
+                    return
+                # Bad handshakes are normal now and then; a broken listener is not
+                failures += 1
+                if failures >= CORE_ACCEPT_FAILURES:
+                    print(f"match core: giving up after {failures} failed accepts ({e})", file=sys.stderr, flush=True)
+                    self.stopped = True  # a new board restarts the server, which resumes from the journal
+                    return
+                time.sleep(min(2.0, 0.05 * 2 ** failures))
+
+    def _handle(self, msg):
+        op, args = msg[0], msg[1:]
+        if op == "attach":
+            # A fresh server starts the UI's bout, or continues the one the UI
+            # last saw (a re-attach after this server was restarted without a
+            # journal); a running one keeps its own
+            if self.core is None:
+                state = args[1] if len(args) > 1 else None
+                self._make_core(args[0], state if state and not state["match_over"] else None)
+            self.dirty = True
+        elif op == "shutdown":
+            self.stopped = True
+        elif op in CORE_COMMANDS and self.core is not None:
+            self._log(cmd=op, args=args)
+            getattr(self.core, op)(*args)
+
+    def serve(self):
+        from multiprocessing.connection import Listener
+        with Listener(self.address, authkey=CORE_AUTHKEY) as listener:
+            threading.Thread(target=self._accept, args=(listener,), name="core-accept", daemon=True).start()
+            print(f"match core listening on {self.address[0]}:{self.address[1]}", flush=True)
+            while not self.stopped:
+                self.sched.run_due()
+                self._flush()
+                try:
+                    while True:
+                        conn = self._conns.get_nowait()
+                        if self.conn is not None:
+                            self.conn.close()
+                        self.conn, self.dirty = conn, True
+                except queue.Empty:
+                    pass
+                wait = self.sched.wait(0.05)
+                if self.conn is None:
+                    time.sleep(wait)
+                    continue
+                try:
+                    if self.conn.poll(wait):
+                        self._handle(self.conn.recv())
+                except (OSError, EOFError):
+                    self.conn = None
+            self.stopped = True
+            if self.conn is not None:
+                self.conn.close()  # the board sees the server go (RemoteCore.on_lost)
+                self.conn = None
+        if self.core is not None:
+            self.core.halt()
+        if self._journal:
+            self._journal.close()
+
+
+def spawn_core_server(address, journal=None):
+    """Start `main.py --core-server` detached from this UI process."""
+    cmd = [sys.executable] if getattr(sys, "frozen", False) else [sys.executable, os.path.abspath(__file__)]
+    cmd += ["--core-server", f"{address[0]}:{address[1]}"]
+    if journal:
+        cmd += ["--core-journal", journal]
+    kw = {}
+    if sys.platform == "win32":
+        kw["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+    else:
+        kw["start_new_session"] = True  # a UI crash / Ctrl+C must not take the clock with it
+    return subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, **kw)
+
+
+class RemoteCore:
+    """MatchCore's interface for the board, backed by a core server.
+
+    Attributes mirror the last state snapshot; commands are sent as is. Replies
+    arrive on a reader thread and are handed to the Tk thread via *deliver*
+    (TkAsyncBridge.call_in_ui), so on_change/on_buzz/on_event run there, and so
+    does on_lost(error) if the server or the connection goes away. *state* (a
+    snapshot()) is the bout a freshly started server should continue.
+    """
+
+    def __init__(self, cfg, address, deliver, on_change=None, on_buzz=None, on_event=None,
+                 on_lost=None, journal=None, spawn=True, state=None):
+        from multiprocessing.connection import Client
+        self.deliver = deliver
+        self.on_change = on_change
+        self.on_buzz = on_buzz
+        self.on_event = on_event
+        self.on_lost = on_lost
+        self.address = address
+        self.process = None
+        self._closing = False
+        deadline = time.monotonic() + CORE_CONNECT_S
+        while True:
+            try:
+                self.conn = Client(address, authkey=CORE_AUTHKEY)
+                break
+            except ConnectionRefusedError:
+                if spawn and self.process is None:
+                    self.process = spawn_core_server(address, journal)
+                elif time.monotonic() > deadline or (self.process and self.process.poll() is not None):
+                    raise ConnectionRefusedError(f"no match core at {address[0]}:{address[1]}")
+                time.sleep(0.05)
+        self._lock = threading.Lock()
+        self.conn.send(("attach", dict(cfg), state))
+        # First snapshot synchronously, so the board builds from real state; a
+        # hung or incompatible server must not freeze the Tk thread
+        deadline = time.monotonic() + CORE_REPLY_S
+        try:
+            while True:
+                if not self.conn.poll(max(0.0, deadline - time.monotonic())):
+                    raise TimeoutError(f"match core at {address[0]}:{address[1]} did not answer")
+                msg = self.conn.recv()
+                if not isinstance(msg, tuple) or not msg:
+                    raise ValueError(f"match core at {address[0]}:{address[1]} speaks another protocol")
+                if msg[0] == "state":
+                    self._apply(msg[1])
+                    break
+                self._dispatch(msg)  # e.g. the "load" event of a fresh bout
+        except BaseException:
+            self.conn.close()
+            raise
+        self._reader = threading.Thread(target=self._read, name="core-reader", daemon=True)
+        self._reader.start()
+
+    def _apply(self, snap):
+        self._snapshot = snap
+        snap = dict(snap)
+        self._server_ms = snap.pop("time_left_ms")
+        self.__dict__.update(snap)
+        self._received = time.perf_counter()
+
+    def snapshot(self):
+        """The last state received (what MatchCore.restore() needs to take over)."""
+        return dict(self._snapshot)
+
+    def _read(self):
+        try:
+            while True:
+                self._dispatch(self.conn.recv())
+        except Exception as e:
+            # Server gone or connection dropped; close() ends this thread the same way
+            if not self._closing and self.on_lost:
+                self.deliver(self.on_lost, e)
+
+    def _dispatch(self, msg):
+        if msg[0] == "state":
+            self.deliver(self._on_state, msg[1])
+        elif msg[0] == "event":
+            if self.on_event:
+                self.deliver(self.on_event, *msg[1:])
+        elif msg[0] == "buzz" and self.on_buzz:
+            self.deliver(self.on_buzz)
+
+    def _on_state(self, snap):
+        self._apply(snap)
+        if self.on_change:
+            self.on_change()
+
+    def _call(self, op, *args):
+        with self._lock:
+            try:
+                self.conn.send((op,) + args)
+            except (OSError, EOFError):
+                pass
 
-        self._control_buttons = []
-        def add_btn(text, cmd):
-            b = tk.Button(self.ctrl_btns, text=text, command=cmd)
-            self._control_buttons.append(b)
-            return b
+    def time_left_ms(self):
+        """Server's value interpolated by the local clock since it arrived."""
+        if not self.running:
+            return self.time_left * 1000
+        left = self._server_ms - int((time.perf_counter() - self._received) * 1000)
+        return max(0, (self.time_left - 1) * 1000, left)
+
+    def close(self, shutdown=True):
+        """Detach; *shutdown* also stops the server (a normal window close)."""
+        self._closing = True
+        if shutdown:
+            self._call("shutdown")
+        try:
+            self.conn.close()
+        except OSError:
+            pass
 
-        add_btn("Start/Pause (Space)", self._toggle_timer)
-        add_btn("Reset Time (t)", self._reset_time)
-        add_btn("All Reset (0)", self._reset_all)
-        add_btn("New Match",     self._new_match)
-        add_btn("Blue WINNER (b)",  lambda: self._show_winner("BLUE"))
-        add_btn("Green WINNER (g)", lambda: self._show_winner("GREEN"))
-        add_btn("Blue HALOL (Shift+B)",  lambda: self._handle_halal_hotkey("BLUE"))
-        add_btn("Green HALOL (Shift+G)", lambda: self._handle_halal_hotkey("GREEN"))
-        add_btn("Resume JAZZO (J)",  self._resume_from_jaza)
-        add_btn("Fullscreen (F11)", lambda: self._toggle_fullscreen())
-        add_btn("Zoom +",           self._zoom_in)
-        add_btn("Zoom -",           self._zoom_out)
-        add_btn("Zoom 100% (Ctrl+0)", self._zoom_reset)
 
-        # Initial responsive layout
-        self._layout_control_buttons()
+for _op in CORE_COMMANDS:
+    setattr(RemoteCore, _op, functools.partialmethod(RemoteCore._call, _op))
+del _op
+
+# ---------------- Results export ----------------
+# --export DIR writes every finished bout for federation reporting: bouts as
+# JSON lines (summary + event timeline) and CSV, and one CSV row per event.
+# The Tk thread only enqueues; a writer thread formats, batches and writes,
+# so a winner screen never waits for a disk or network share. Files are per
+# session and ring ("<session>-ring<N>-bouts.csv", ...), rotated at
+# EXPORT_ROTATE_BYTES and when the pipeline closes, then gzipped. Only files
+# this process wrote are touched: rings in other processes may share DIR.
+EXPORT_QUEUE = 256
+EXPORT_OVERFLOW_WARN = 4 * EXPORT_QUEUE  # results held in memory beyond the queue before on_error hears of it
+EXPORT_BATCH = 64
+EXPORT_ROTATE_BYTES = 16 << 20
+BOUT_CSV_FIELDS = (["session", "ring", "bout", "amended", "event", "weight", "code1", "name1", "code2", "name2",
+                    "winner", "reason", "tie", "bout_s", "elapsed_s"] +
+                   [f"{side}_{label}" for side in ("blue", "green") for label in SCORE_LABELS] +
+                   ["timeouts_blue", "timeouts_green", "corrections", "lead_changes"])
+EVENT_CSV_FIELDS = ["session", "ring", "bout", "t", "kind", "side", "label", "delta", "mirrored"]
+EXPORT_FILE_RE = re.compile(r".+-ring\d+-(bouts|events)\.(csv|jsonl)$")  # only these are rotated / compressed
+
+class ExportPipeline:
+    """Bounded queue drained by one writer thread; shared by the boards of a
+    process (see export_pipeline). stats holds the back-pressure metrics.
+
+    When the queue is full, items spill into an overflow list that the writer
+    drains after the queue, so results are neither dropped nor allowed to
+    block the Tk thread. Past EXPORT_OVERFLOW_WARN spilled items on_error gets
+    an ExportBacklog (once, until the writer has caught up)."""
+
+    def __init__(self, directory, session, on_error=None):
+        self.directory = directory
+        self.session = session
+        self.on_error = on_error
+        self.stats = dict(submitted=0, written=0, batches=0, max_batch=0, depth=0, max_depth=0,
+                          full=0, overflow=0, max_overflow=0, bytes=0, rotated=0, errors=0, write_ms=0.0)
+        self._q = queue.Queue(maxsize=EXPORT_QUEUE)
+        self._overflow = deque()  # newer than everything in _q while non-empty
+        self._backlog_warned = False
+        self._files = {}  # path -> open handle (buffered; flushed per batch)
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+        self._thread.start()
+
+    # ---- producer side (Tk thread) ----
+    def _push(self, item):
+        # Once spilling, keep spilling until the writer has caught up: order is kept
+        if not self._overflow:
+            try:
+                self._q.put_nowait(item)
+                return
+            except queue.Full:
+                self.stats["full"] += 1
+        self._overflow.append(item)
+
+    def _submit(self, item):
+        st = self.stats
+        st["submitted"] += 1
+        self._push(item)
+        depth, spilled = self._q.qsize(), len(self._overflow)
+        st["depth"], st["overflow"] = depth, spilled
+        st["max_depth"] = max(st["max_depth"], depth)
+        st["max_overflow"] = max(st["max_overflow"], spilled)
+        if not spilled:
+            self._backlog_warned = False
+        elif spilled >= EXPORT_OVERFLOW_WARN and not self._backlog_warned:
+            self._backlog_warned = True
+            if self.on_error:
+                self.on_error(ExportBacklog(f"the export writer is {depth + spilled} results behind "
+                                            f"(is {self.directory} slow or unreachable?); they are kept in memory"))
+
+    def bout(self, ring, summary, timeline):
+        self._submit(("bout", (ring, summary, list(timeline))))
+
+    def append_jsonl(self, path, record):
+        """Any JSON-lines record (e.g. --analytics) through the same writer."""
+        self._submit(("jsonl", (path, record)))
+
+    # ---- writer thread ----
+    def _path(self, ring, stream, ext):
+        return os.path.join(self.directory, f"{self.session}-ring{ring}-{stream}.{ext}")
+
+    def _open(self, path, header=None):
+        fh = self._files.get(path)
+        if fh is None:
+            new = not os.path.exists(path) or os.path.getsize(path) == 0
+            fh = self._files[path] = open(path, "a", encoding="utf-8", newline="", buffering=1 << 16)
+            if header and new:
+                fh.write(",".join(header) + "\r\n")
+        return fh
+
+    def _rotate(self, path, fh, force=False):
+        if not EXPORT_FILE_RE.match(os.path.basename(path)) or (fh.tell() < EXPORT_ROTATE_BYTES and not force):
+            return
+        fh.close()
+        del self._files[path]
+        stem, ext = os.path.splitext(path)
+        n = 1
+        while os.path.exists(f"{stem}.{n}{ext}.gz"):
+            n += 1
+        os.replace(path, f"{stem}.{n}{ext}")
+        gzip_file(f"{stem}.{n}{ext}")
+        self.stats["rotated"] += 1
+
+    def _csv_row(self, fh, fields, row):
+        import csv
+        csv.DictWriter(fh, fields, extrasaction="ignore").writerow(row)
+
+    def _write_bout(self, ring, summary, timeline):
+        base = dict(session=self.session, ring=ring, bout=summary["bout"])
+        line = json.dumps(dict(summary, session=self.session, ring=ring, timeline=timeline),
+                          ensure_ascii=False, separators=(",", ":"))
+        self._open(self._path(ring, "bouts", "jsonl")).write(line + "\n")
+        row = dict(base, amended=bool(summary.get("amended")), event=summary["event"], weight=summary["weight"],
+                   code1=summary["codes"][0], name1=summary["names"][0], code2=summary["codes"][1],
+                   name2=summary["names"][1], winner=summary["winner"], reason=summary["reason"],
+                   tie=summary["tie"], bout_s=summary["bout_s"], elapsed_s=summary["elapsed_s"],
+                   timeouts_blue=sum(1 for _, s in summary["timeouts"] if s == "BLUE"),
+                   timeouts_green=sum(1 for _, s in summary["timeouts"] if s == "GREEN"),
+                   corrections=summary["corrections"], lead_changes=summary["lead_changes"])
+        for side in ("BLUE", "GREEN"):
+            for label, n in summary["buckets"][side].items():
+                row[f"{side.lower()}_{label}"] = n
+        self._csv_row(self._open(self._path(ring, "bouts", "csv"), BOUT_CSV_FIELDS), BOUT_CSV_FIELDS, row)
+        if not summary.get("amended"):  # an amended decision repeats the same timeline
+            fh = self._open(self._path(ring, "events", "csv"), EVENT_CSV_FIELDS)
+            for t, kind, data in timeline:
+                self._csv_row(fh, EVENT_CSV_FIELDS, dict(base, t=t, kind=kind, **{
+                    k: data[k] for k in ("side", "label", "delta", "mirrored") if k in data}))
+
+    def _handle(self, kind, payload):
+        if kind == "bout":
+            self._write_bout(*payload)
+        elif kind == "jsonl":
+            path, record = payload
+            self._open(path).write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def _next_batch(self):
+        if self._overflow and self._q.empty():
+            batch = []
+            while self._overflow and len(batch) < EXPORT_BATCH:
+                batch.append(self._overflow.popleft())
+            return batch
+        batch = [self._q.get()]
+        while len(batch) < EXPORT_BATCH:
+            try:
+                batch.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        st = self.stats
+        while True:
+            batch = self._next_batch()
+            start = time.perf_counter()
+            stop = False
+            for kind, payload in batch:
+                if kind == "stop":
+                    stop = True
+                    continue
+                try:
+                    self._handle(kind, payload)
+                    st["written"] += 1
+                except Exception as e:
+                    st["errors"] += 1
+                    if self.on_error:
+                        self.on_error(e)
+            for path, fh in list(self._files.items()):
+                try:
+                    fh.flush()
+                    self._rotate(path, fh)
+                except OSError as e:
+                    st["errors"] += 1
+                    if self.on_error:
+                        self.on_error(e)
+            st["batches"] += 1
+            st["max_batch"] = max(st["max_batch"], len(batch))
+            st["write_ms"] = (time.perf_counter() - start) * 1000.0
+            st["bytes"] = sum(fh.tell() for fh in self._files.values())
+            st["depth"], st["overflow"] = self._q.qsize(), len(self._overflow)
+            if stop:
+                break
+        # This session's files are finished: compress them like rotated ones
+        for path, fh in list(self._files.items()):
+            try:
+                fh.flush()
+                self._rotate(path, fh, force=True)
+            except OSError as e:
+                st["errors"] += 1
+                if self.on_error:
+                    self.on_error(e)
+        for fh in self._files.values():
+            fh.close()
+        self._files.clear()
+
+    def close(self, timeout=5.0):
+        """Write out everything queued, then stop the writer."""
+        if self._thread.is_alive():
+            self._push(("stop", None))
+            self._thread.join(timeout)
+
+
+class ExportBacklog(RuntimeError):
+    """Results are piling up in memory faster than the writer stores them."""
+
+
+def gzip_file(path):
+    """Compress *path* to path.gz and remove the original."""
+    import gzip
+    with open(path, "rb") as src, gzip.open(path + ".gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+
+_EXPORT_PIPELINES = {}
+
+def export_pipeline(directory, session=None, on_error=None):
+    """The process-wide pipeline for *directory* (created on first use, drained at exit).
+    Errors go to the latest caller's *on_error* (the board now open)."""
+    key = os.path.abspath(directory)
+    pipe = _EXPORT_PIPELINES.get(key)
+    if pipe is None:
+        import atexit
+        pipe = _EXPORT_PIPELINES[key] = ExportPipeline(directory, session or time.strftime("%Y%m%d-%H%M%S"),
+                                                       on_error)
+        atexit.register(pipe.close)
+    else:
+        pipe.on_error = on_error
+    return pipe
 
+# ---------------- Config ----------------
+class ConfigWindow(tk.Tk):
+    def __init__(self, options=None):
+        super().__init__()
+        self.options = dict(options or {})  # command-line options, passed through to cfg
+        self.aio = TkAsyncBridge(self)  # coroutines for network/disk features (see Async I/O)
+        if self.options.get("watch_flags"):
+            self.after(FLAG_WATCH_MS, self._poll_flags)
+        self.title(f"{APP_TITLE} – Config"); self.geometry("980x720"); self.resizable(True, True)
+        self.show_flags = tk.BooleanVar(value=True)
+        self.show_names = tk.BooleanVar(value=False)
+        self.country1 = tk.StringVar(value="Turkmenistan (TKM)")
+        self.country2 = tk.StringVar(value="Uzbekistan (UZB)")
+        self.name1 = tk.StringVar(value="")
+        self.name2 = tk.StringVar(value="")
+        self.event_left = tk.StringVar(value="G-1 / No.48   Final")
+        self.gender = tk.StringVar(value="Men")
+        self.weight = tk.StringVar(value="-81Kg")
+        self.ring = tk.IntVar(value=1)
+        self.m_m = tk.IntVar(value=DEFAULT_MEN_MMSS[0]); self.m_s = tk.IntVar(value=DEFAULT_MEN_MMSS[1])
+        self.w_m = tk.IntVar(value=DEFAULT_WOMEN_MMSS[0]); self.w_s = tk.IntVar(value=DEFAULT_WOMEN_MMSS[1])
+        self._build()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)  # route the close box through destroy() too
 
+    def _build(self):
+        pad={"padx":10,"pady":8}
+        lf = ttk.Labelframe(self, text="Event / Meta"); lf.pack(fill="x", padx=12, pady=12)
+        ttk.Label(lf,text="Top-left text:").grid(row=0,column=0,sticky="w",**pad)
+        ttk.Entry(lf,width=32,textvariable=self.event_left).grid(row=0,column=1,**pad)
+        ttk.Label(lf,text="Gender:").grid(row=1,column=0,sticky="w",**pad)
+        ttk.Combobox(lf,width=12,textvariable=self.gender,values=["Men","Women","Boys","Girls"]).grid(row=1,column=1,sticky="w",**pad)
+        ttk.Label(lf,text="Weight:").grid(row=2,column=0,sticky="w",**pad)
+        ttk.Combobox(lf,width=12,textvariable=self.weight,values=WEIGHTS,state="readonly").grid(row=2,column=1,sticky="w",**pad)
+        ttk.Checkbutton(lf,text="Show flags",variable=self.show_flags).grid(row=3,column=0,sticky="w",**pad)
+        ttk.Checkbutton(lf,text="Show names (under codes)",variable=self.show_names).grid(row=3,column=1,sticky="w",**pad)
 
-        self._apply_scale()  # initial
+        cf = ttk.Labelframe(self, text="Competitors"); cf.pack(fill="x", padx=12, pady=6)
+        ttk.Label(cf,text="Blue country:").grid(row=0,column=0,sticky="w",**pad)
+        self._country_combo(cf,self.country1).grid(row=0,column=1,sticky="w",**pad)
+        ttk.Label(cf,text="Blue name:").grid(row=1,column=0,sticky="w",**pad)
+        ttk.Entry(cf,width=28,textvariable=self.name1).grid(row=1,column=1,sticky="w",**pad)
+        ttk.Label(cf,text="Green country:").grid(row=2,column=0,sticky="w",**pad)
+        self._country_combo(cf,self.country2).grid(row=2,column=1,sticky="w",**pad)
+        ttk.Label(cf,text="Green name:").grid(row=3,column=0,sticky="w",**pad)
+        ttk.Entry(cf,width=28,textvariable=self.name2).grid(row=3,column=1,sticky="w",**pad)
 
-    # ---------- timer / scoring ----------
-    def _update_time(self):
-        m,s = divmod(self.time_left,60)
-        self.time_lbl.config(text=f"{m:02d}:{s:02d}")
+        bf = ttk.Frame(self); bf.pack(fill="x", padx=12, pady=8)
+        tb = ttk.Labelframe(bf, text="Time Preset"); tb.pack(side="left", padx=6)
+        ttk.Label(tb,text="Men (MM:SS)").grid(row=0,column=0,sticky="w",**pad)
+        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.m_m).grid(row=0,column=1,**pad)
+        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.m_s).grid(row=0,column=2,**pad)
+        ttk.Label(tb,text="Women (MM:SS)").grid(row=1,column=0,sticky="w",**pad)
+        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.w_m).grid(row=1,column=1,**pad)
+        ttk.Spinbox(tb,from_=0,to=59,width=3,textvariable=self.w_s).grid(row=1,column=2,**pad)
 
-    def _tick(self):
-        if not self.running:
-            return
+        rg = ttk.Labelframe(bf, text="Ring / Actions"); rg.pack(side="left", padx=12)
+        ttk.Radiobutton(rg,text="Ring 1",variable=self.ring,value=1).grid(row=0,column=0,sticky="w",**pad)
+        ttk.Radiobutton(rg,text="Ring 2",variable=self.ring,value=2).grid(row=0,column=1,sticky="w",**pad)
+        ttk.Button(rg,text="About",command=lambda:messagebox.showinfo("About","Responsive photo-style score")).grid(row=1,column=0,**pad)
+        ttk.Button(rg,text="Start",command=self._start).grid(row=1,column=1,**pad)
+        ttk.Button(rg,text="Exit",command=self.destroy).grid(row=1,column=2,**pad)
 
-        # clear previous handle; we'll set a new one if needed
-        self.after_id = None
+    def _poll_flags(self):
+        FLAGS.poll()
+        self.after(FLAG_WATCH_MS, self._poll_flags)
 
-        if self.time_left > 0:
-            self.time_left -= 1
-            self._update_time()
-            if self.time_left <= 0:
-                self._handle_time_expired()
+    def _country_combo(self, parent, var):
+        """Editable combobox whose list filters by name or IOC code as you type."""
+        cb = ttk.Combobox(parent, width=28, values=country_values(), textvariable=var)
+        def on_key(event):
+            if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
                 return
-            if self._maybe_trigger_jaza_pause():
+            cb["values"] = COUNTRY_REGISTRY.search(var.get())
+        def on_commit(_=None):
+            # Normalize "uzb" / "Uzbekistan" to the canonical "Uzbekistan (UZB)"
+            code = COUNTRY_REGISTRY.code_for(var.get())
+            if code:
+                var.set(COUNTRY_REGISTRY.value_for(code))
+            cb["values"] = country_values()
+        cb.bind("<KeyRelease>", on_key)
+        cb.bind("<FocusOut>", on_commit)
+        cb.bind("<Return>", on_commit)
+        cb.bind("<<ComboboxSelected>>", on_commit)
+        return cb
+
+    def _start(self):
+        codes = []
+        for side, var in (("Blue", self.country1), ("Green", self.country2)):
+            code = COUNTRY_REGISTRY.code_for(var.get())
+            if code is None:  # free text would show an unknown code without a flag
+                messagebox.showwarning("Country", f"{side} country {var.get().strip()!r} is not in the list.\n"
+                                       "Type a country name or IOC code and pick it from the list.", parent=self)
                 return
-            self.after_id = self.after(1000, self._tick)
+            codes.append(code)
+        mm, ss = (self.m_m.get(),self.m_s.get()) if self.gender.get().lower()=="men" else (self.w_m.get(),self.w_s.get())
+        cfg=dict(self.options)
+        cfg.update(
+            show_flags=self.show_flags.get(),show_names=self.show_names.get(),
+            code1=codes[0],code2=codes[1],
+            name1=self.name1.get().strip(),name2=self.name2.get().strip(),
+            event_left=self.event_left.get().strip(),gender=self.gender.get(),weight=self.weight.get(),
+            ring=int(self.ring.get()),mm=clamp(mm,0,59),ss=clamp(ss,0,59),
+        )
+        self.attributes("-topmost", False)
+        board = self._live_board()
+        if board is not None and int(board.cfg.get("ring", 1)) == cfg["ring"]:
+            self.withdraw(); board.reload(cfg)  # reuse the open window: no rebuild, no flicker
         else:
-            self._handle_time_expired()
-
-
-    def _handle_time_expired(self):
-        """Stop timer immediately and show final result."""
-        if self.time_left < 0:
-            self.time_left = 0
-
-        if self.after_id:
-            try:
-                self.after_cancel(self.after_id)
-            except Exception:
-                pass
-            self.after_id = None
+            # Another ring: its core server, shm names, ports and metrics label differ
+            if board is not None:
+                board._close()
+            self.withdraw(); self.board = ScoreboardWindow(self,cfg)
+
+    def _live_board(self):
+        board = getattr(self, "board", None)
+        return board if board is not None and board.winfo_exists() else None
+
+    def destroy(self):
+        # A board kept open by New Match owns shm segments, output threads and
+        # maybe a core server; release them as its own close would
+        board = self._live_board()
+        if board is not None:
+            board._close()
+        self.aio.close()
+        super().destroy()
 
-        self.running = False
-        self.jaza_active = False
-        self.final_reason = ""
-        self._update_time()
-        self._buzz()
+# ---------------- Scoreboard ----------------
+def flag_resized(code, w, h, fast=False):
+    """PIL image of *code*'s flag at w×h, or None. Pure Pillow, safe off the Tk thread.
+    *fast*: draft-mode source and RESAMPLE_FAST, for frames during a resize/zoom burst."""
+    src = FLAGS.preview(code, w, h) if fast else FLAGS.image(code)
+    if src is None:
+        return None
+    try:
+        if fast:
+            return src.resize((w, h), RESAMPLE_FAST, reducing_gap=2.0)
+        return src.resize((w, h), RESAMPLE)
+    except Exception:
+        return None
 
-        # decide winner and show full-screen overlay
-        winner = self._winner_by_point_advantage()
-        if winner:
-            self._schedule_auto_win(winner, "POINT ADVANTAGE")
-        else:
-            resolved = self._resolve_draw_by_last_event()
-            if resolved:
-                w, reason = resolved
-                self._schedule_auto_win(w, reason)
-            else:
-                self._show_tie_screen()
+class ScoreboardWindow(tk.Toplevel):
+    def __init__(self, root, cfg, sched=None):
+        super().__init__(root)
+        self.root=root; self.cfg=cfg
+        self.title(APP_TITLE); self.configure(bg="black")
+        self.geometry(f"{BASE_W}x{BASE_H}"); self.minsize(900,600)
+        self._fullscreen=False
 
+        self.auto_winner = tk.BooleanVar(value=True)
+        self.timeout_widgets = {}
+        self.scale=1.0
+        self._scale_ctx = None  # see _scale_context / _check_monitor
+        self._font_k = 1.0      # board font points → points at Tk's DPI (see _font_scale)
+        self._tk_dpi = None
+        self._win_pos = None
+        self._monitor_after = None
+        self._scale_idle = None
+        self.layout = self._load_layout(cfg.get("layout") or LAYOUT_DEFAULT)
+        self.zoom = self.layout["table"]["zoom"]  # the profile's zoom (you can adjust in-app)
+        self._sizes = self.layout["table"]
+        self.final_frame = None  # placeholder for full-screen overlay
 
-    def _toggle_timer(self,_=None):
-        if self.jaza_active:
-            return
-        self.running = not self.running
-        if self.running: self.after_id = self.after(1000, self._tick)
-        elif self.after_id: self.after_cancel(self.after_id); self.after_id=None
+        # Render loop: widgets are written from _view_model() at most once per frame
+        self._render_fps = max(1, int(cfg.get("render_fps") or RENDER_FPS))
+        self._frame_after_id = None
+        self._frame_deadline = 0.0
+        self._last_frame_at = 0.0
+        self._applied_view = {}
+        # Optional digit-sprite mode: timer/bucket digits are cached images
+        self.digit_sprites = DigitSprites(self) if cfg.get("digit_sprites") else None
+        self._sprite_px = (BASE["TIME"], BASE["DIGIT"])
+        self._time_char_imgs = [None] * 5
+        self.render_stats = dict(frames=0, requests=0, coalesced=0, skipped=0,
+                                 last_ms=0.0, max_ms=0.0, avg_ms=0.0)
+        # Rules live in MatchCore; the board only renders it and forwards input
+        self.clock_sync = ClockSync(cfg["clock_sync"]) if cfg.get("clock_sync") else None
+        self.sched = sched or (SyncedScheduler(self, self.clock_sync) if self.clock_sync else TkScheduler(self))
+        self.export = None
+        if cfg.get("export"):
+            self._on_export_error = lambda e: root.aio.call_in_ui(self._export_failed, e)
+            self.export = export_pipeline(cfg["export"], cfg.get("export_session"), on_error=self._on_export_error)
+        self.analytics = BoutAnalytics(self._write_analytics) if cfg.get("analytics") or self.export else None
+        # Stamped on --analytics lines so a file shared by rings / sessions keys each bout uniquely
+        self.session = self.export.session if self.export else cfg.get("export_session") or time.strftime("%Y%m%d-%H%M%S")
+        self.metrics = None
+        if cfg.get("metrics") is not None:
+            try:
+                self.metrics = board_metrics(cfg["metrics"], cfg.get("ring", 1))
+                self.metrics.sources = dict(render=self.render_stats, export=self.export and self.export.stats,
+                                            sync=self.clock_sync and self.clock_sync.stats)
+            except OSError as e:
+                messagebox.showwarning("Metrics", f"Metrics endpoint disabled:\n{e}", parent=self)
+        taps = [tap.event for tap in (self.analytics, self.metrics) if tap]
+        self._on_core_event = (lambda kind, t, data: [tap(kind, t, data) for tap in taps]) if taps else None
+        self.core = None
+        self._core_task = None
+        if cfg.get("core_process") is not None:
+            try:
+                self.core = self._remote_core(cfg)
+                # A server that outlived a crashed UI keeps its bout: show that one
+                cfg.update((k, self.core.cfg[k]) for k in BOUT_FIELDS if k in self.core.cfg)
+            except Exception as e:
+                messagebox.showwarning("Match core", f"Core process unavailable, running in-process:\n{e}",
+                                       parent=self)
+        if self.core is None:
+            self.core = MatchCore(cfg, self.sched, on_change=self._invalidate, on_buzz=self._buzz,
+                                  on_event=self._on_core_event)
+        # Optional live state for local tools (kurash_shm.StateReader), refreshed every frame
+        self.state_shm = None
+        if cfg.get("state_shm") is not None:
+            try:
+                import kurash_shm
+                self.state_shm = kurash_shm.StateWriter(cfg["state_shm"] or kurash_shm.default_name(cfg.get("ring", 1)))
+            except Exception as e:
+                messagebox.showwarning("State output", f"Shared-memory state disabled:\n{e}", parent=self)
 
-    def _reset_time(self,_=None):
-        self.running=False
-        if self.after_id: self.after_cancel(self.after_id); self.after_id=None
-        self.time_left = self.cfg["mm"]*60 + self.cfg["ss"]
-        self.total_match_time = self.time_left
-        if self.jaza_active:
-            self._show_winner("")
-        self.jaza_active = False
-        self.jaza_consumed = False
-        self.final_reason = ""
-        self._update_time()
+        # Named fonts (resize together)
+        self.f_time    = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["TIME"])
+        self.f_digit   = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["DIGIT"])
+        self.f_code    = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["CODE"])
+        self.f_topmeta = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["TOPMETA"])
+        self.f_label   = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["LABEL"])
+        self.f_name    = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["NAME"])
+        self.f_winner  = tkfont.Font(family="Arial", weight="bold", size=self.layout["fonts"]["WINNER"])
+        self.f_submeta = tkfont.Font(family="Arial", weight="normal", size=self.layout["fonts"]["SUBMETA"])
+        # Pooled overlay fonts/widgets: the final screens are built once and reused
+        self.f_ov_name = tkfont.Font(family="Arial", weight="bold", size=48)
+        self.f_ov_code = tkfont.Font(family="Arial", weight="bold", size=40)
+        self.f_ov_big  = tkfont.Font(family="Arial", weight="bold", size=60)
+        self.f_ov_mid  = tkfont.Font(family="Arial", weight="bold", size=40)
+        self.f_ov_hint = tkfont.Font(family="Arial", weight="bold", size=24)
+        # Pre-rendered outcome overlays ("BLUE", "GREEN", "TIE"), kept ready at the current scale
+        self._overlays = {}
+        self._overlay_key = None      # what the prepared overlays show (see _overlay_state)
+        self._overlay_after = None
+        self._overlay_task = None
+
+        self._blue_flag_img=None; self._green_flag_img=None
+        self._media_fast = False    # True during a resize/zoom burst (see _media_burst)
+        self._refine_after = None
+        self._flag_photos = OrderedDict()  # (code, w, h) -> PhotoImage, LRU
+        self._label_chrome_px = {}
+        FLAGS.subscribe(self._on_flags_changed)
+        self._ika_logo_img=None
+        self.perf = None
+        if cfg.get("perf_capture") is not None:
+            self._toggle_perf_capture()  # from the start, so the first layout/scale passes are included
+            if cfg["perf_capture"] > 0:
+                self.after(int(cfg["perf_capture"] * 1000), lambda: self.perf and self._toggle_perf_capture())
+        self._build(); self._bind()
+        self._render_frame()  # first frame synchronously so layout sees real content
+        self.broadcast = None
+        if cfg.get("broadcast"):
+            try:
+                self.broadcast = BroadcastOutput(self, cfg["broadcast"], cfg.get("broadcast_size") or "1080p",
+                                                 cfg.get("broadcast_fps") or BROADCAST_FPS)
+            except Exception as e:
+                messagebox.showwarning("Broadcast output", f"Broadcast output disabled:\n{e}", parent=self)
+        self.led = None
+        if cfg.get("led"):
+            try:
+                self.led = LedOutput(self, cfg["led"], cfg.get("led_size") or LED_SIZE, cfg.get("led_fps") or LED_MAX_FPS)
+            except Exception as e:
+                messagebox.showwarning("LED output", f"LED panel output disabled:\n{e}", parent=self)
+        # Apply initial scale
+        self._apply_scale()
+        self.bind("<Configure>", self._on_resize)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        if self.clock_sync:
+            self._sync_after = self.after(SYNC_REPORT_MS, self._report_sync)
+        self.deiconify(); self.focus_force()
+        # Start fullscreen by default (F11/Esc still work)
+        if cfg.get("fullscreen", True):
+            self.after(0, lambda: self._toggle_fullscreen(True))
 
-    def _refresh_digits(self):
-        for i,l in enumerate(self.b_digits): l.config(text=str(self.blue[i]))
-        for i,l in enumerate(self.g_digits): l.config(text=str(self.green[i]))
 
-    def _cancel_pending_auto_winner(self):
-        if self._auto_winner_after_id:
+    # ---------- scaling ----------
+    def _scale_context(self):
+        """Monitor and DPI the board scales for (measured once, see _check_monitor)."""
+        if self._scale_ctx is None:
+            self._scale_ctx = monitor_context(self)
+            self._font_k = self._font_scale(self._scale_ctx)
+        return self._scale_ctx
+
+    def _font_scale(self, ctx):
+        """Factor on this window's font points so they render at *ctx*'s DPI.
+        Tk's own scaling is app-wide (config window too), so it is left alone."""
+        if self._tk_dpi is None:
             try:
-                self.after_cancel(self._auto_winner_after_id)
+                self._tk_dpi = self.winfo_fpixels('1i')
             except Exception:
-                pass
-            self._auto_winner_after_id = None
-        self._pending_auto_winner = None
-        self.auto_deciding = False
+                self._tk_dpi = ctx.dpi
+        return ctx.dpi / self._tk_dpi if RESPECT_DPI and self._tk_dpi else 1.0
 
-    def _record_score_event(self, side: str, label: str, delta: int):
-        if delta <= 0:
+    def _pt(self, size):
+        return max(1, round(size * self._font_k))
+
+    def _schedule_monitor_check(self, event):
+        """Window moved: look for a monitor/DPI change once it has settled."""
+        pos = (event.x, event.y)
+        if pos == self._win_pos:
             return
-        self._event_counter += 1
-        seq = self._event_counter
-        if label in ("C", "Y"):
-            self._last_cy_event = (side, label, seq)
-        elif label in ("D", "T"):
-            self._last_dt_event = (side, label, seq)
+        self._win_pos = pos
+        if self._monitor_after is not None:
+            self.after_cancel(self._monitor_after)
+        self._monitor_after = self.after(MEDIA_SETTLE_MS, self._check_monitor)
+
+    def _check_monitor(self):
+        """Rescale only if the window is now on another monitor or at another DPI."""
+        self._monitor_after = None
+        old = self._scale_context()
+        new = monitor_context(self)
+        if (new.monitor, new.dpi) == (old.monitor, old.dpi):
+            return
+        self._scale_ctx = new
+        self._font_k = self._font_scale(new)
+        # Everything rasterized or measured for the old monitor
+        _TEXT_METRICS.clear()
+        self._label_chrome_px.clear()
+        self._flag_photos.clear()
+        if self.digit_sprites:
+            self.digit_sprites.clear()
+            self._sprite_px = (0, 0)
+        self._overlay_key = None
+        # A fit profile was compiled for the old screen; keep a zoom the operator chose
+        at_profile_zoom = abs(self.zoom - self.layout["table"]["zoom"]) < 1e-9
+        self.layout = self._load_layout(self.layout["name"])
+        if at_profile_zoom:
+            self.zoom = self.layout["table"]["zoom"]
+        self._sizes = self.layout["table"]
+        self._apply_scale()
 
-    def _attach_score_clicks(self, cell_widget, lbl_widget, is_blue: bool, idx: int):
-        """Bind mouse actions to a score cell (and its label)."""
-        def flash(bg="#444"):
-            old = cell_widget.cget("bg")
-            cell_widget.config(bg=bg)
-            cell_widget.after(120, lambda: cell_widget.config(bg=old))
+    def _load_layout(self, name):
+        ctx = self._scale_context()
+        try:
+            return load_layout(name, ctx.screen, ctx.dpi, tk_font_metrics(self, self._font_k))
+        except KeyError as e:
+            messagebox.showwarning("Layout", f"{e.args[0]}; using {LAYOUT_DEFAULT!r}.", parent=self)
+            return load_layout(LAYOUT_DEFAULT, (BASE_W, BASE_H), ctx.dpi, None)
 
-        def inc(_=None):
-            self._blue_delta(idx, +1) if is_blue else self._green_delta(idx, +1)
-            flash("#3a3a3a")
+    def _calc_scale(self):
+        s_win = min(max(self.winfo_width(),1)/BASE_W, max(self.winfo_height(),1)/BASE_H)
+        return s_win * self._scale_context().s_dpi * self.zoom
 
-        def dec(_=None):
-            self._blue_delta(idx, -1) if is_blue else self._green_delta(idx, -1)
-            flash("#2a2a2a")
+    def _apply_scale(self):
+        # Include DPI in media scale, but exclude it from font/layout scaling to avoid double DPI
+        s_media = self._calc_scale()
+        s_ui = max(0.1, s_media / self._scale_context().s_dpi)
+        self.scale = s_ui
+        if self.metrics:
+            self.metrics.relayout()
+        # At the compiled screen size the profile's table applies as is
+        table = self.layout["table"]
+        self._sizes = table if abs(s_ui - table["scale"]) < 1e-9 else layout_sizes(self.layout, s_ui)
+        pt = self._sizes["fonts"]
+        for fontobj, key in ((self.f_time, "TIME"), (self.f_digit, "DIGIT"), (self.f_code, "CODE"),
+                             (self.f_topmeta, "TOPMETA"), (self.f_label, "LABEL"), (self.f_name, "NAME"),
+                             (self.f_winner, "WINNER"), (self.f_submeta, "SUBMETA")):
+            fontobj.configure(size=self._pt(pt[key]))
 
-        def reset_bucket(_=None):
-            if is_blue:
-                self.blue[idx] = 0
-            else:
-                self.green[idx] = 0
-            self._refresh_digits()
-            flash("#1f1f1f")
+        self._refresh_flags()
+        self._refresh_logo()
+        self._refresh_digit_sprites()
+        self._sync_name_column_width()
 
-        # Bind on the cell AND the inner label so either area works
-        for w in (cell_widget, lbl_widget):
-            w.bind("<Button-1>", inc)          # left click  +1
-            w.bind("<Control-Button-1>", dec)  # ctrl+click -1
-            w.bind("<Double-Button-1>", reset_bucket)  # double-left resets this bucket
+        pad = self._sizes["cell_pad"]
+        for cell in getattr(self, "b_cells", []): cell.grid_configure(padx=pad)
+        for cell in getattr(self, "g_cells", []): cell.grid_configure(padx=pad)
+        self._update_timeout_widgets()
+        # Relayout control buttons on scale/resize
+        if hasattr(self, "_layout_control_buttons"):
+            self._layout_control_buttons()
+        self._schedule_overlay_prewarm()
+
+    def _zoom_in(self):  self.zoom = min(3.0, self.zoom*1.08); self._media_burst(); self._apply_scale()
+    def _zoom_out(self): self.zoom = max(min(0.35, self.layout["table"]["zoom"]), self.zoom/1.08); self._media_burst(); self._apply_scale()
+    def _zoom_reset(self): self.zoom = self.layout["table"]["zoom"]; self._apply_scale()
+
+    def _media_burst(self):
+        """Resize/zoom input: cheap media until it has been quiet for MEDIA_SETTLE_MS."""
+        self._media_fast = True
+        if self._refine_after is not None:
+            self.after_cancel(self._refine_after)
+        self._refine_after = self.after(MEDIA_SETTLE_MS, self._refine_media)
+
+    def _refine_media(self):
+        """Input settled: redraw flags and logo once at full quality."""
+        self._refine_after = None
+        self._media_fast = False
+        self._refresh_flags()
+        self._refresh_logo()
 
+    def _sync_name_column_width(self):
+        """Size both name columns from cached text metrics (no layout flush, no widget queries)."""
+        frames = [getattr(self, "blue_id", None), getattr(self, "green_id", None)]
+        if not all(frames):
+            return
+        names = [(lbl, text_metrics(self.f_name, lbl.cget("text"))) for lbl in (self.blue_name, self.green_name)]
+        codes = [(lbl, text_metrics(self.f_code, lbl.cget("text"))) for lbl in (self.blue_code, self.green_code)]
+        name_widths = [w for _, (w, _) in names]
+        code_widths = [w for _, (w, _) in codes]
 
-    def _create_timeout_control(self, parent, is_blue: bool):
-        """Create the circular timeout control for a competitor."""
-        holder = tk.Frame(parent, bg="black")
-        holder.pack(side="left", padx=(20, 10))
+        pad = max(40, int(48 * self.scale))
+        target_width = max(
+            self._sizes["name_col"],
+            max(name_widths + [0]) + pad,
+            max(code_widths + [0]) + pad // 2
+        )
 
-        canvas = tk.Canvas(holder, width=80, height=80, bg="black", highlightthickness=0, cursor="hand2")
-        canvas.pack()
+        # What winfo_reqheight would report once laid out: text plus the label's padding/border
+        name_heights = [h + self._label_chrome(lbl) for lbl, (_, h) in names]
+        code_heights = [h + self._label_chrome(lbl) for lbl, (_, h) in codes]
+        content_height = max(name_heights) + max(code_heights)
 
-        color = "#1976d2" if is_blue else "#00e676"
-        circle = canvas.create_oval(10, 10, 70, 70, outline=color, width=4)
-        font = tkfont.Font(family="Arial", weight="bold", size=32)
-        text = canvas.create_text(40, 40, text="+", fill=color, font=font, anchor="center")
+        for frame in frames:
+            frame.config(width=target_width, height=content_height)
 
-        side = "BLUE" if is_blue else "GREEN"
-        data = {
-            "canvas": canvas,
-            "circle": circle,
-            "text": text,
-            "font": font,
-            "color": color,
-            "holder": holder,
-            "side": side,
-        }
-        self.timeout_widgets[side] = data
+    def _label_chrome(self, label):
+        """Vertical pady + border + highlight of *label* in pixels (fixed, so read once)."""
+        px = self._label_chrome_px.get(str(label))
+        if px is None:
+            px = self._label_chrome_px[str(label)] = 2 * sum(
+                label.winfo_pixels(label.cget(opt)) for opt in ("pady", "borderwidth", "highlightthickness"))
+        return px
 
-        canvas.bind("<Button-1>", lambda e, s=side: self._handle_timeout_click(s))
-        canvas.bind("<Return>", lambda e, s=side: self._handle_timeout_click(s))
-        self._update_timeout_widget(side)
+    # ---------- assets ----------
+    def _load_flag_image(self, code, w, h, resized=None, fast=False):
+        """Cached PhotoImage of *code* at w×h; *resized* is a ready PIL image (see flag_resized).
+        *fast* images (resize bursts) are not cached: _refine_media replaces them shortly."""
+        key = (code.upper(), w, h)
+        cache = self._flag_photos
+        if self.metrics:
+            self.metrics.cache(key in cache)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        img = resized if resized is not None else flag_resized(code, w, h, fast)
+        if img is None:
+            return None
+        try:
+            photo = ImageTk.PhotoImage(img, master=self)
+        except Exception:
+            return None
+        if fast:
+            return photo
+        cache[key] = photo
+        while len(cache) > FLAG_PHOTO_CACHE:
+            cache.popitem(last=False)
+        return photo
+
+    def _on_flags_changed(self, codes):
+        """A flag file was added/replaced during the event: drop stale images and redraw."""
+        for key in [k for k in self._flag_photos if k[0] in codes]:
+            del self._flag_photos[key]
+        if "IKA" in codes:
+            self._refresh_logo()
+        if codes & {self.cfg["code1"].upper(), self.cfg["code2"].upper()}:
+            self._overlay_key = None
+            self._schedule_overlay_prewarm()
+            self._refresh_flags()
+            if self.broadcast:
+                self.broadcast.renderer.set_cfg(self.cfg)
+ 
+    def _refresh_flags(self):
+        if not self.cfg.get("show_flags"):
+            return
 
+        # flags scale with zoom/DPI (the profile's flag size includes FLAG_BOOST)
+        fw, fh = self._sizes["flag"]
 
-    def _timeout_display_text(self, side: str) -> str:
-        count = self.timeout_counts.get(side, 0)
-        return "+" if count == 0 else str(count)
+        img = self._load_flag_image(self.cfg["code1"], fw, fh, fast=self._media_fast)
+        if img:
+            self._blue_flag_img = img
+            self.blue_flag.config(image=self._blue_flag_img)
+
+        img = self._load_flag_image(self.cfg["code2"], fw, fh, fast=self._media_fast)
+        if img:
+            self._green_flag_img = img
+            self.green_flag.config(image=self._green_flag_img)
 
 
-    def _update_timeout_widget(self, side: str):
-        data = self.timeout_widgets.get(side)
-        if not data:
+    def _refresh_logo(self):
+        if not hasattr(self, "ika_logo"):
             return
 
-        canvas = data["canvas"]
-        size = max(64, int(120 * self.scale))
-        margin = max(6, int(size * 0.12))
-        canvas.config(width=size, height=size)
-        canvas.coords(data["circle"], margin, margin, size - margin, size - margin)
+        logo = FLAGS.image("IKA")
+        if logo is None:
+            return
 
-        font_size = max(18, int(size * 0.4))
-        data["font"].configure(size=font_size)
-        canvas.itemconfig(data["text"],
-                          text=self._timeout_display_text(side),
-                          font=data["font"],
-                          fill=data["color"])
-        canvas.coords(data["text"], size/2, size/2)
-        canvas.itemconfig(data["circle"],
-                          outline=data["color"],
-                          width=max(3, int(size * 0.08)))
+        # target logo roughly same height and double width of athlete flags
+        flag_w, flag_h = self._sizes["flag"]
+        max_w = max(40, int(flag_w * 1.0))
+        max_h = max(20, int(flag_h * 1.0))
 
+        try:
+            ow, oh = logo.size
+            if ow == 0 or oh == 0:
+                return
+            scale = min(max_w / ow, max_h / oh)
+            new_size = (max(10, int(ow * scale)), max(10, int(oh * scale)))
+            if self._media_fast:
+                resized = logo.resize(new_size, RESAMPLE_FAST, reducing_gap=2.0)
+            else:
+                resized = logo.resize(new_size, RESAMPLE)
+            self._ika_logo_img = ImageTk.PhotoImage(resized)
+            self.ika_logo.config(image=self._ika_logo_img)
+        except Exception:
+            pass
 
-    def _update_timeout_widgets(self):
-        for side in ("BLUE", "GREEN"):
-            self._update_timeout_widget(side)
 
+    def _report_sync(self):
+        s = self.clock_sync.stats
+        status = f"clock ±{s['error_ms']:.1f} ms" if s["synced"] else "clock NOT SYNCED"
+        self.title(f"{APP_TITLE} — {status}")
+        self._sync_after = self.after(SYNC_REPORT_MS, self._report_sync)
 
-    def _handle_timeout_click(self, side: str):
-        if self.match_over:
+    def _write_analytics(self, summary):
+        """With --export the writer thread takes the bout (never blocks on disk);
+        --analytics alone appends its line directly."""
+        summary = dict(summary, session=self.session, ring=int(self.cfg.get("ring", 1)))
+        if not self.export:
+            try:
+                append_jsonl(self.cfg["analytics"], summary)
+            except OSError as e:
+                messagebox.showwarning("Analytics", f"Could not write bout summary:\n{e}", parent=self)
             return
+        if self.cfg.get("analytics"):
+            self.export.append_jsonl(self.cfg["analytics"], summary)
+        self.export.bout(int(self.cfg.get("ring", 1)), summary, self.analytics.timeline)
 
-        current = self.timeout_counts.get(side, 0)
-        if current >= MAX_TIMEOUTS:
-            opponent = "GREEN" if side == "BLUE" else "BLUE"
-            self._schedule_auto_win(opponent, "Time out")
+    def _export_failed(self, e):
+        if isinstance(e, ExportBacklog):
+            messagebox.showwarning("Export", f"Bout results are not being written in time:\n{e}", parent=self)
+        else:
+            messagebox.showwarning("Export", f"Could not write bout results:\n{e}", parent=self)
+
+    # ---------- core process ----------
+    def _remote_core(self, cfg, state=None):
+        return RemoteCore(cfg, core_address(cfg["core_process"], cfg.get("ring", 1)), self.root.aio.call_in_ui,
+                          on_change=self._invalidate, on_buzz=self._buzz, on_event=self._on_core_event,
+                          on_lost=self._core_lost, journal=cfg.get("core_journal"), state=state)
+
+    def _core_lost(self, error):
+        """The core server died or the connection dropped: re-attach (a restarted
+        server resumes from its journal, or from this board's last snapshot), and
+        if that fails continue the bout in-process from the snapshot."""
+        lost = self.core
+        if not isinstance(lost, RemoteCore) or self._core_task is not None:
             return
+        lost.close(shutdown=False)
+        self.title(f"{APP_TITLE} — MATCH CORE LOST, reconnecting…")
+        self.bell()
+        self._core_task = self.root.aio.submit(self._reattach_core(lost.snapshot(), error))
 
-        self.timeout_counts[side] = current + 1
-        self._update_timeout_widget(side)
+    async def _reattach_core(self, state, error):
+        try:
+            core = await self.root.aio.run_blocking(self._remote_core, self.cfg, state)
+            status = "match core reconnected"
+        except Exception as e:
+            core = MatchCore(self.cfg, self.sched, on_change=self._invalidate, on_buzz=self._buzz)
+            core.restore(state)
+            core.on_event = self._on_core_event
+            status = "match core lost, running in-process (clock stopped)"
+            messagebox.showwarning("Match core", f"Lost the match core ({error or 'connection closed'}) "
+                                   f"and could not reconnect:\n{e}\n\nThe bout continues in this window; "
+                                   f"the clock is stopped.", parent=self)
+        finally:
+            self._core_task = None
+        self.core = core
+        self.title(f"{APP_TITLE} — {status}")
+        self._invalidate()
+
+    def _sound_file(self): return os.path.join(SOUNDS_DIR, f"Ring{int(self.cfg.get('ring',1)):02d}.wav")
+    def _buzz(self):
+        if self.cfg.get("mute"): return
+        path=asset_file(self._sound_file())
+        try:
+            if os.name=="nt":
+                import winsound
+                if path: winsound.PlaySound(path, winsound.SND_FILENAME|winsound.SND_ASYNC)
+                else: winsound.MessageBeep(winsound.MB_ICONEXCLAMATION); return
+                return
+            if path:
+                if sys.platform=="darwin" and shutil.which("afplay"): subprocess.Popen(["afplay",path]); return
+                if sys.platform.startswith("linux") and shutil.which("aplay"): subprocess.Popen(["aplay","-q",path]); return
+                try:
+                    import simpleaudio as sa; sa.WaveObject.from_wave_file(path).play(); return
+                except Exception: pass
+            self.bell()
+        except Exception: self.bell()
+
+    # ---------- build ----------
+    def _build(self):
+        # Top bar grid L/C/R
+        top = tk.Frame(self, bg="black"); top.pack(fill="x", pady=(8,0))
+        top.grid_columnconfigure(0, weight=1)
+        top.grid_columnconfigure(1, weight=2)
+        top.grid_columnconfigure(2, weight=1)
 
+        self.top_left_meta = tk.Label(top, text=self.cfg.get("event_left",""),
+                                      fg="white", bg="black", font=self.f_topmeta)
+        self.top_left_meta.grid(row=0, column=0, sticky="w", padx=20)
 
-    def _handle_halal_hotkey(self, side: str, event=None):
-        if self.match_over:
-            return "break" if event is not None else None
-        winner = "BLUE" if side == "BLUE" else "GREEN"
-        self._finish_match_with_winner(winner, reason="HALOL")
-        return "break" if event is not None else None
+        left_detail = f"{self.cfg['gender']}   {self.cfg['weight']}"
+        self.top_left_detail = tk.Label(top, text=left_detail, fg="#cccccc", bg="black", font=self.f_submeta)
+        self.top_left_detail.grid(row=1, column=0, sticky="w", padx=20, pady=(0,0))
 
+        self.time_lbl = tk.Label(top, text="00:00", fg="red", bg="black", font=self.f_time)
+        if self.digit_sprites:
+            # Sprite mode: one image label per timer character (MM:SS)
+            self.time_holder = tk.Frame(top, bg="black")
+            self.time_chars = [tk.Label(self.time_holder, bg="black", bd=0) for _ in range(5)]
+            for ch_lbl in self.time_chars: ch_lbl.pack(side="left")
+            self.time_holder.grid(row=0, column=1, rowspan=2, sticky="n", pady=(0,4))
+        else:
+            self.time_lbl.grid(row=0, column=1, rowspan=2, sticky="n", pady=(0,4))
 
+        self.ika_logo = tk.Label(top, bg="black")
+        self.ika_logo.grid(row=0, column=2, rowspan=2, sticky="e", padx=20)
+        self._refresh_logo()
 
+        # Middle area
+        mid = tk.Frame(self, bg="black"); mid.pack(expand=True, fill="both", pady=6)
 
-    def _maybe_trigger_jaza_pause(self) -> bool:
-        if self._should_trigger_jaza_pause():
-            self._enter_jaza_pause()
-            return True
-        return False
+        # ----- BLUE row (centered) -----
+        blue_row = tk.Frame(mid, bg="black"); blue_row.pack(fill="x", pady=4)
+        tk.Frame(blue_row, bg="black").pack(side="left", expand=True)
 
+        # Flag
+        self.blue_flag = tk.Label(blue_row, bg="black")
+        if self.cfg.get("show_flags"): self.blue_flag.pack(side="left", padx=(20,10))
 
-    def _should_trigger_jaza_pause(self) -> bool:
-        if self.jaza_active or self.jaza_consumed or self.match_over:
-            return False
-        if self.total_match_time <= 0:
-            return False
-        if self.time_left > self.total_match_time / 2:
-            return False
-        if any(self.blue) or any(self.green):
-            return False
-        return True
+        # NEW: vertical stack for name (blue box) + code
+        self.blue_id = tk.Frame(blue_row, bg="black")
+        self.blue_id.pack(side="left", padx=(0,30))
+        self.blue_id.pack_propagate(False)
 
+        self.blue_name = tk.Label(
+            self.blue_id, text=self.cfg.get("name1",""),
+            bg="#1976d2", fg="white", font=self.f_name, padx=12, pady=4,
+            anchor="w", justify="left"
+        )
+        self.blue_name.pack(side="top", fill="x")
 
-    def _enter_jaza_pause(self):
-        if self.jaza_active or self.auto_deciding:
-            return
-        if self.after_id:
-            try:
-                self.after_cancel(self.after_id)
-            except Exception:
-                pass
-            self.after_id = None
-        self.running = False
-        self.jaza_active = True
-        self.jaza_consumed = True
-        self.winner_lbl.config(text="JAZZO", bg="#ffe000", fg="black")
+        self.blue_code = tk.Label(
+            self.blue_id, text=self.cfg["code1"],
+            fg="white", bg="black", font=self.f_code, anchor="w", justify="left"
+        )
+        self.blue_code.pack(side="top", fill="x")
+
+        # digits + labels in one grid
+        self.b_digits_frame = tk.Frame(blue_row, bg="black"); self.b_digits_frame.pack(side="left")
+        self.b_digits, self.b_cells = [], []
+        for i, letter in enumerate(SCORE_LABELS):
+            cell = tk.Frame(self.b_digits_frame, bg="#222"); cell.grid(row=0, column=i, padx=24)
+            digit_color = "#ff5252" if letter in ("D","T") else "white"
+            lbl  = tk.Label(cell, text="0", fg=digit_color, bg="#222", font=self.f_digit,
+                            width=0 if self.digit_sprites else 2); lbl.pack()
+            self.b_cells.append(cell); self.b_digits.append(lbl)
+            # NEW: make the box clickable for Blue
+            self._attach_score_clicks(cell, lbl, is_blue=True, idx=i)
 
+            fg = LABEL_COLORS.get(letter, "#ffe000")
+            tk.Label(self.b_digits_frame, text=letter,
+                    fg=fg, bg="black", font=self.f_label).grid(row=1, column=i, pady=(8,0))
+        
+        self._create_timeout_control(blue_row, is_blue=True)
 
-    def _resume_from_jaza(self):
-        if self.match_over:
-            return
-        if self.auto_deciding:
-            self._cancel_pending_auto_winner()
-        if not self.jaza_active:
-            return
-        self.jaza_active = False
-        self._show_winner("")
-        self.running = True
-        self.after_id = self.after(1000, self._tick)
+        tk.Frame(blue_row, bg="black").pack(side="left", expand=True)
 
-    def _schedule_auto_win(self, winner: str, reason: str = ""):
-        """Stop the bout and delay automatic winner for 5s to allow overrides."""
-        if not winner:
-            return
-        existing = self._pending_auto_winner
-        if self.auto_deciding and existing and existing[0] == winner and existing[1] == reason:
-            return
 
-        self._cancel_pending_auto_winner()
-        self.auto_deciding = True
-        self.final_reason = reason or ""
+        # Winner ribbon (center)
+        self.winner_area = tk.Frame(mid, bg="black")
+        self.winner_area.pack(fill="x", pady=6)
 
-        # Halt timers / pauses
-        if self.after_id:
-            try:
-                self.after_cancel(self.after_id)
-            except Exception:
-                pass
-            self.after_id = None
-        self.running = False
-        self.jaza_active = False
-        self._clear_final_screen()
+        self.winner_lbl = tk.Label(
+            self.winner_area, text="",
+            font=self.f_winner, fg="black", bg="black",
+            padx=30, pady=10
+        )
+        self.winner_lbl.pack()
 
-        self._pending_auto_winner = (winner, reason)
 
-        name = self.cfg["name1"] if winner == "BLUE" else self.cfg["name2"]
-        bg = "#1976d2" if winner == "BLUE" else "#00e676"
-        fg = "white" if winner == "BLUE" else "black"
-        reason_text = reason or "AUTO DECISION"
-        self.winner_lbl.config(text="", bg="black", fg="black")
-        self._auto_winner_after_id = self.after(5000, self._apply_pending_auto_winner)
+        # ----- GREEN row (centered) -----
+        green_row = tk.Frame(mid, bg="black"); green_row.pack(fill="x", pady=4)
+        tk.Frame(green_row, bg="black").pack(side="left", expand=True)
 
-    def _apply_pending_auto_winner(self):
-        pending = self._pending_auto_winner
-        self._cancel_pending_auto_winner()
-        if not pending or self.match_over:
-            return
-        winner, reason = pending
-        self._finish_match_with_winner(winner, reason)
+        # Flag
+        self.green_flag = tk.Label(green_row, bg="black")
+        if self.cfg.get("show_flags"): self.green_flag.pack(side="left", padx=(20,10))
 
+        # NEW: vertical stack for code + name (green box)
+        self.green_id = tk.Frame(green_row, bg="black")
+        self.green_id.pack(side="left", padx=(0,30))
+        self.green_id.pack_propagate(False)
 
-    def _apply_penalty_side_effects(self, is_blue: bool, idx: int, delta: int):
-        """Mirror T/D penalties to the opponent (gives them C or Y)."""
-        if delta == 0:
-            return
+        self.green_code = tk.Label(
+            self.green_id, text=self.cfg["code2"],
+            fg="white", bg="black", font=self.f_code, anchor="w", justify="left"
+        )
+        self.green_code.pack(side="top", fill="x")
 
-        opponent = self.green if is_blue else self.blue
-        opponent_side = "GREEN" if is_blue else "BLUE"
+        self.green_name = tk.Label(
+            self.green_id, text=self.cfg.get("name2",""),
+            bg="#2e7d32", fg="white", font=self.f_name, padx=12, pady=4,
+            anchor="w", justify="left"
+        )
+        self.green_name.pack(side="top", fill="x")
 
-        label = SCORE_LABELS[idx]
-        if label == "G":
-            winner = "GREEN" if is_blue else "BLUE"
-            self._schedule_auto_win(winner, "G PENALTY")
-            return
-        if label == "T":  # T gives opponent a C (or removes if delta<0)
-            c_idx = LABEL_TO_INDEX["C"]
-            before_c = opponent[c_idx]
-            new_c = clamp(before_c + delta)
-            opponent[c_idx] = new_c
-            gained_c = new_c - before_c
-            # Maintain bookkeeping of penalty-awarded C for opponent
-            if delta > 0:
-                self._penalty_c[opponent_side] = max(0, self._penalty_c[opponent_side] + delta)
-            elif delta < 0:
-                take = min(-delta, self._penalty_c[opponent_side])
-                self._penalty_c[opponent_side] -= take
-                # Ensure consistency: penalty C cannot exceed total C
-                self._penalty_c[opponent_side] = min(self._penalty_c[opponent_side], opponent[c_idx])
+        # digits + labels in one grid
+        self.g_digits_frame = tk.Frame(green_row, bg="black"); self.g_digits_frame.pack(side="left")
+        self.g_digits, self.g_cells = [], []
+        for i, letter in enumerate(SCORE_LABELS):
+            cell = tk.Frame(self.g_digits_frame, bg="#222"); cell.grid(row=0, column=i, padx=24)
+            digit_color = "#ff5252" if letter in ("D","T") else "white"
+            lbl  = tk.Label(cell, text="0", fg=digit_color, bg="#222", font=self.f_digit,
+                            width=0 if self.digit_sprites else 2); lbl.pack()
+            self.g_cells.append(cell); self.g_digits.append(lbl)
 
-            if gained_c > 0:
-                self._record_score_event(opponent_side, "C", gained_c)
-        elif label == "D":  # D gives opponent a Y and removes any mirrored C from previous T
-            y_idx = LABEL_TO_INDEX["Y"]
-            before_y = opponent[y_idx]
-            new_y = clamp(before_y + delta)
-            opponent[y_idx] = new_y
-            gained_y = new_y - before_y
-            if gained_y > 0:
-                self._record_score_event(opponent_side, "Y", gained_y)
-                c_idx = LABEL_TO_INDEX["C"]
-                # Remove one mirrored C if present
-                opponent[c_idx] = clamp(opponent[c_idx] - 1)
-                if self._penalty_c[opponent_side] > 0:
-                    self._penalty_c[opponent_side] -= 1
-                # Ensure consistency bounds
-                self._penalty_c[opponent_side] = max(0, min(self._penalty_c[opponent_side], opponent[c_idx]))
-                penalized = self.blue if is_blue else self.green
-                t_idx = LABEL_TO_INDEX["T"]
-                if penalized[t_idx] > 0:
-                    penalized[t_idx] = clamp(penalized[t_idx] - 1)
+            # Make the green box clickable as well
+            self._attach_score_clicks(cell, lbl, is_blue=False, idx=i)
+
+            fg = LABEL_COLORS.get(letter, "#ffe000")
+            tk.Label(self.g_digits_frame, text=letter,
+                    fg=fg, bg="black", font=self.f_label).grid(row=1, column=i, pady=(8,0))
 
+        self._create_timeout_control(green_row, is_blue=False)
 
-    def _finish_match_with_winner(self, winner: str, reason: str = ""):
-        """Stop the match immediately and declare the winner."""
-        if self.match_over:
-            return
-        self._cancel_pending_auto_winner()
-        self.running = False
-        if self.after_id:
-            try:
-                self.after_cancel(self.after_id)
-            except Exception:
-                pass
-            self.after_id = None
-        self.jaza_active = False
-        self.final_reason = reason or ""
-        self.match_over = True
-        self._show_winner(winner, reason)
+        tk.Frame(green_row, bg="black").pack(side="left", expand=True)
 
+        # Controls (also add small helpers for fullscreen/zoom)
+        # Controls (centered row, responsive wrap)
+        self.ctrl = tk.Frame(self, bg="black"); self.ctrl.pack(fill="x", pady=6)
 
-    def _check_penalty_end(self):
-        """End the match if penalty thresholds reached."""
-        if self.match_over or self.auto_deciding:
-            return True
-        # Immediate end if any side reaches 2×Y (treat as POINT ADVANTAGE wording)
-        y_idx = LABEL_TO_INDEX["Y"]
-        if self.blue[y_idx] >= 2:
-            self._finish_match_with_winner("BLUE", reason="POINT ADVANTAGE")
-            return True
-        if self.green[y_idx] >= 2:
-            self._finish_match_with_winner("GREEN", reason="POINT ADVANTAGE")
-            return True
-        return False
+        # Container for buttons; we will grid them responsively in multiple rows
+        self.ctrl_btns = tk.Frame(self.ctrl, bg="black")
+        self.ctrl_btns.pack()
 
+        self._control_buttons = []
+        def add_btn(text, cmd):
+            b = tk.Button(self.ctrl_btns, text=text, command=cmd)
+            self._control_buttons.append(b)
+            return b
 
-    def _winner_by_point_advantage(self) -> str:
-        """Compare scores with Y outranking any number of C points.
+        add_btn("Start/Pause (Space)", self._toggle_timer)
+        add_btn("Reset Time (t)", self._reset_time)
+        add_btn("All Reset (0)", self._reset_all)
+        add_btn("New Match",     self._new_match)
+        add_btn("Blue WINNER (b)",  lambda: self._show_winner("BLUE"))
+        add_btn("Green WINNER (g)", lambda: self._show_winner("GREEN"))
+        add_btn("Blue HALOL (Shift+B)",  lambda: self._handle_halal_hotkey("BLUE"))
+        add_btn("Green HALOL (Shift+G)", lambda: self._handle_halal_hotkey("GREEN"))
+        add_btn("Resume JAZZO (J)",  self._resume_from_jaza)
+        add_btn("Fullscreen (F11)", lambda: self._toggle_fullscreen())
+        add_btn("Zoom +",           self._zoom_in)
+        add_btn("Zoom -",           self._zoom_out)
+        add_btn("Zoom 100% (Ctrl+0)", self._zoom_reset)
 
-        Returns "BLUE", "GREEN", or "" if equal by Y and C (true draw).
-        """
-        y_idx = LABEL_TO_INDEX["Y"]
-        c_idx = LABEL_TO_INDEX["C"]
-        blue_pair = (self.blue[y_idx], self.blue[c_idx])
-        green_pair = (self.green[y_idx], self.green[c_idx])
-        if blue_pair > green_pair:
-            return "BLUE"
-        if green_pair > blue_pair:
-            return "GREEN"
-        # If Y and C are equal, prefer side with more DIRECT C (not from penalties)
-        if blue_pair[1] > 0 or green_pair[1] > 0:
-            b_dc = self._direct_c.get("BLUE", 0)
-            g_dc = self._direct_c.get("GREEN", 0)
-            if b_dc != g_dc:
-                return "BLUE" if b_dc > g_dc else "GREEN"
-        return ""
+        # Initial responsive layout
+        self._layout_control_buttons()
 
 
-    def _resolve_draw_by_last_event(self):
-        latest = None
-        if self._last_cy_event:
-            side, label, seq = self._last_cy_event
-            latest = ("CY", side, label, seq)
-        if self._last_dt_event:
-            side, label, seq = self._last_dt_event
-            if not latest or seq > latest[3]:
-                latest = ("DT", side, label, seq)
-        if not latest:
-            return None
 
-        kind, side, label, _ = latest
-        if kind == "CY":
-            if label == "Y":
-                return side, 'Last "Y" score'
-            if label == "C":
-                return side, 'Last "C" score'
-            return side, f"Last {label}"
+        self._apply_scale()  # initial
 
-        winner = "GREEN" if side == "BLUE" else "BLUE"
-        if label == "D":
-            return winner, 'Last "Y" score'
-        if label == "T":
-            return winner, 'Last "C" score'
-        return winner, f"LAST {label} PENALTY"
+    # ---------- timer / scoring ----------
+    def _toggle_timer(self, _=None): self.core.toggle_timer()
+    def _reset_time(self, _=None): self.core.reset_time()
+    def _resume_from_jaza(self, _=None): self.core.resume_from_jaza()
+    def _show_winner(self, who: str, reason: str = ""): self.core.show_winner(who, reason)
+
+    def _handle_halal_hotkey(self, side: str, event=None):
+        self.core.halol(side)
+        return "break" if event is not None else None
 
+    def _reset_all(self, _=None):
+        self.core.reset_all()
+        # Relayout control buttons on scale/resize
+        self._layout_control_buttons()
 
-    def _clear_final_screen(self):
-        """Remove final overlay if present."""
-        if getattr(self, "final_frame", None):
+    # ---------- render loop ----------
+    def _view_model(self):
+        """Consolidated snapshot of everything the render loop writes to widgets."""
+        core = self.core
+        m, s = divmod(max(0, core.time_left), 60)
+        vm = {"time": f"{m:02d}:{s:02d}", "ribbon": core.ribbon, "final": core.final}
+        for i in range(SCORE_COUNT):
+            vm[("digit", "BLUE", i)] = str(core.blue[i])
+            vm[("digit", "GREEN", i)] = str(core.green[i])
+        for side in ("BLUE", "GREEN"):
+            vm[("timeout", side)] = self._timeout_display_text(side)
+        return vm
+
+    def _invalidate(self):
+        """Mark the board dirty; the next frame (capped at render_fps) applies it."""
+        self.render_stats["requests"] += 1
+        if self._frame_after_id is not None:
+            self.render_stats["coalesced"] += 1
+            return
+        now = time.perf_counter()
+        self._frame_deadline = max(now, self._last_frame_at + 1.0 / self._render_fps)
+        delay_ms = int(round((self._frame_deadline - now) * 1000))
+        self._frame_after_id = self.after(delay_ms, self._render_frame)
+
+    def _render_frame(self):
+        self._cancel_render()  # no-op when fired by the loop; drops a pending frame when flushed directly
+        start = time.perf_counter()
+        period = 1.0 / self._render_fps
+        stats = self.render_stats
+        late = start - self._frame_deadline if self._frame_deadline else 0.0
+        if late > period:
+            # Frame slots that passed while the Tk thread was busy elsewhere
+            stats["skipped"] += int(late // period)
+
+        vm = self._view_model()
+        applied = self._applied_view
+        for key, value in vm.items():
+            if applied.get(key) != value:
+                self._apply_view(key, value)
+        self._applied_view = vm
+        if self.state_shm:
+            self._publish_state()
+
+        ms = (time.perf_counter() - start) * 1000.0
+        stats["frames"] += 1
+        stats["last_ms"] = ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+        stats["avg_ms"] += (ms - stats["avg_ms"]) / stats["frames"]
+        self._last_frame_at = start
+        if self.metrics:
+            self.metrics.frame()
+
+    def _publish_state(self):
+        core = self.core
+        self.state_shm.publish(
+            core.time_left_ms(), core.total_match_time * 1000, core.blue, core.green,
+            (core.timeout_counts["BLUE"], core.timeout_counts["GREEN"]),
+            running=core.running, jazzo=core.jaza_active, over=core.match_over,
+            deciding=core.auto_deciding, tie=core.final == ("TIE",), winner=core.winner,
+            code1=self.cfg.get("code1", ""), code2=self.cfg.get("code2", ""), bout=core.bout)
+
+    def _apply_view(self, key, value):
+        if key == "time":
+            if self.digit_sprites:
+                self._apply_time_sprites(value)
+            else:
+                self.time_lbl.config(text=value)
+        elif key == "ribbon":
+            text, bg, fg = value
+            self.winner_lbl.config(text=text, bg=bg, fg=fg)
+        elif key == "final":
+            if value is None:
+                self._clear_final_screen()
+            elif value[0] == "WINNER":
+                self._show_final_winner_screen(value[1], value[2])
+            else:
+                self._show_tie_screen()
+        elif key[0] == "digit":
+            digits = self.b_digits if key[1] == "BLUE" else self.g_digits
+            if self.digit_sprites:
+                fg = "#ff5252" if SCORE_LABELS[key[2]] in ("D", "T") else "white"
+                digits[key[2]].config(image=self.digit_sprites.image(value, self._sprite_px[1], fg, "#222", min_chars=2))
+            else:
+                digits[key[2]].config(text=value)
+        elif key[0] == "timeout":
+            data = self.timeout_widgets.get(key[1])
+            if data:
+                data["canvas"].itemconfig(data["text"], text=value)
+
+    def _apply_time_sprites(self, text):
+        # Only the characters whose sprite changed are touched (usually just the last digit)
+        for i, ch in enumerate(text[:len(self.time_chars)]):
+            img = self.digit_sprites.image(ch, self._sprite_px[0], "red", "black")
+            if self._time_char_imgs[i] is not img:
+                self._time_char_imgs[i] = img
+                self.time_chars[i].config(image=img)
+
+    def _refresh_digit_sprites(self):
+        """Point sprite mode at the glyph set for the current font sizes."""
+        if not self.digit_sprites:
+            return
+        self._scale_context()
+        px_per_pt = self._tk_dpi / 72.0  # font sizes already carry _font_k; Tk renders them at its DPI
+        sizes = (max(8, round(self.f_time.cget("size") * px_per_pt)),
+                 max(8, round(self.f_digit.cget("size") * px_per_pt)))
+        if sizes == self._sprite_px:
+            return
+        self._sprite_px = sizes
+        # Force the next frame to re-apply every sprite at the new size
+        for key in [k for k in self._applied_view if k == "time" or k[0] == "digit"]:
+            del self._applied_view[key]
+        self._invalidate()
+
+    def _cancel_render(self):
+        if self._frame_after_id is not None:
             try:
-                self.final_frame.destroy()
+                self.after_cancel(self._frame_after_id)
             except Exception:
                 pass
-        self.final_frame = None
-        self._winner_flag_img = None
+            self._frame_after_id = None
+
+    def _attach_score_clicks(self, cell_widget, lbl_widget, is_blue: bool, idx: int):
+        """Bind mouse actions to a score cell (and its label)."""
+        side = "BLUE" if is_blue else "GREEN"
+
+        def flash(bg="#444"):
+            old = cell_widget.cget("bg")
+            cell_widget.config(bg=bg)
+            self.sched.after(120, lambda: cell_widget.config(bg=old))
+
+        def inc(_=None):
+            self.core.delta(side, idx, +1)
+            flash("#3a3a3a")
 
+        def dec(_=None):
+            self.core.delta(side, idx, -1)
+            flash("#2a2a2a")
 
-    def _show_final_winner_screen(self, who: str, reason: str = ""):
-        """Cover the UI with a full-screen winner card."""
-        self.match_over = True
-        self._clear_final_screen()
+        def reset_bucket(_=None):
+            self.core.reset_bucket(side, idx)
+            flash("#1f1f1f")
 
-        if who == "BLUE":
-            bg, fg = "#1976d2", "white"
-            name, code = self.cfg.get("name1",""), self.cfg.get("code1","")
-        elif who == "GREEN":
-            bg, fg = "#00e676", "black"
-            name, code = self.cfg.get("name2",""), self.cfg.get("code2","")
-        else:
-            # Fallback to tie screen if unknown
-            return self._show_tie_screen()
+        # Bind on the cell AND the inner label so either area works
+        for w in (cell_widget, lbl_widget):
+            w.bind("<Button-1>", inc)          # left click  +1
+            w.bind("<Control-Button-1>", dec)  # ctrl+click -1
+            w.bind("<Double-Button-1>", reset_bucket)  # double-left resets this bucket
 
-        s = self._calc_scale()
-        name_font = tkfont.Font(family="Arial", weight="bold", size=max(48, int(BASE["TIME"] * 0.7 * s)))
-        code_font = tkfont.Font(family="Arial", weight="bold", size=max(40, int(BASE["TIME"] * 0.45 * s)))
-        hint_font = tkfont.Font(family="Arial", weight="bold", size=max(24, int(28 * s)))
 
-        self._winner_flag_img = None
-        self.final_frame = tk.Frame(self, bg=bg)
-        self.final_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+    def _create_timeout_control(self, parent, is_blue: bool):
+        """Create the circular timeout control for a competitor."""
+        holder = tk.Frame(parent, bg="black")
+        holder.pack(side="left", padx=(20, 10))
 
-        tk.Label(self.final_frame, text="WINNER", bg=bg, fg=fg, font=code_font, pady=10).pack(pady=(30, 10))
-        info = tk.Frame(self.final_frame, bg=bg)
-        info.pack(pady=(10, 10))
+        canvas = tk.Canvas(holder, width=80, height=80, bg="black", highlightthickness=0, cursor="hand2")
+        canvas.pack()
 
-        tk.Label(info, text=name, bg=bg, fg=fg, font=name_font).pack(pady=(0, 6))
+        color = "#1976d2" if is_blue else "#00e676"
+        circle = canvas.create_oval(10, 10, 70, 70, outline=color, width=4)
+        font = tkfont.Font(family="Arial", weight="bold", size=32)
+        text = canvas.create_text(40, 40, text="+", fill=color, font=font, anchor="center")
 
-        code_row = tk.Frame(info, bg=bg)
-        code_row.pack()
+        side = "BLUE" if is_blue else "GREEN"
+        data = {
+            "canvas": canvas,
+            "circle": circle,
+            "text": text,
+            "font": font,
+            "color": color,
+            "holder": holder,
+            "side": side,
+        }
+        self.timeout_widgets[side] = data
 
-        if self.cfg.get("show_flags"):
-            flag_w = max(40, int(FLAG_W * self.scale * FLAG_BOOST))
-            flag_h = max(28, int(FLAG_H * self.scale * FLAG_BOOST))
-            flag_img = self._load_flag_image(code, flag_w, flag_h)
-            if flag_img:
-                self._winner_flag_img = flag_img
-                tk.Label(code_row, image=self._winner_flag_img, bg=bg).pack(side="left", padx=(0, 16))
+        canvas.bind("<Button-1>", lambda e, s=side: self.core.timeout(s))
+        canvas.bind("<Return>", lambda e, s=side: self.core.timeout(s))
+        self._update_timeout_widget(side)
 
-        tk.Label(code_row, text=code, bg=bg, fg=fg, font=code_font).pack(side="left")
 
-        if reason == "HALOL":
-            tk.Label(self.final_frame, text='WINS BY "HALOL"', bg=bg, fg=fg, font=code_font).pack(pady=(10, 0))
-        elif reason == "POINT ADVANTAGE":
-            tk.Label(self.final_frame, text='WINS BY "POINT ADVANTAGE"', bg=bg, fg=fg, font=code_font).pack(pady=(10, 0))
-        elif reason:
-            tk.Label(self.final_frame, text=reason, bg=bg, fg=fg, font=code_font).pack(pady=(10, 0))
+    def _timeout_display_text(self, side: str) -> str:
+        count = self.core.timeout_counts.get(side, 0)
+        return "+" if count == 0 else str(count)
 
-        tk.Label(self.final_frame, text="Press 0 to reset", bg=bg, fg=fg, font=hint_font).pack(pady=(20, 10))
 
+    def _update_timeout_widget(self, side: str):
+        data = self.timeout_widgets.get(side)
+        if not data:
+            return
 
-    def _show_tie_screen(self):
-        """Show neutral screen for tie; lets you pick winner with keys w/m or reset with 0."""
-        self.match_over = True
-        self._clear_final_screen()
+        canvas = data["canvas"]
+        size = max(64, int(120 * self.scale))
+        margin = max(6, int(size * 0.12))
+        canvas.config(width=size, height=size)
+        canvas.coords(data["circle"], margin, margin, size - margin, size - margin)
 
-        s = self._calc_scale()
-        big_font  = tkfont.Font(family="Arial", weight="bold", size=max(60, int(BASE["TIME"] * 0.8 * s)))
-        mid_font  = tkfont.Font(family="Arial", weight="bold", size=max(40, int(BASE["TIME"] * 0.4 * s)))
-        hint_font = tkfont.Font(family="Arial", weight="bold", size=max(24, int(28 * s)))
+        font_size = max(18, int(size * 0.4))
+        data["font"].configure(size=font_size)
+        canvas.itemconfig(data["text"],
+                          font=data["font"],
+                          fill=data["color"])
+        canvas.coords(data["text"], size/2, size/2)
+        canvas.itemconfig(data["circle"],
+                          outline=data["color"],
+                          width=max(3, int(size * 0.08)))
 
-        bg, fg, acc = "black", "#ffe000", "#cccccc"
-        self.final_frame = tk.Frame(self, bg=bg)
-        self.final_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
 
-        tk.Label(self.final_frame, text="TIME UP - TIE", bg=bg, fg=fg, font=big_font).pack(pady=(40, 20))
-        tk.Label(self.final_frame, text=f"{self.cfg.get('name1','')} ({self.cfg.get('code1','')})",
-                bg=bg, fg=acc, font=mid_font).pack(pady=5)
-        tk.Label(self.final_frame, text=f"{self.cfg.get('name2','')} ({self.cfg.get('code2','')})",
-                bg=bg, fg=acc, font=mid_font).pack(pady=5)
-        tk.Label(self.final_frame, text="Press B for Blue win, G for Green win, or 0 to reset.",
-                bg=bg, fg=fg, font=hint_font).pack(pady=(20, 10))
+    def _update_timeout_widgets(self):
+        for side in ("BLUE", "GREEN"):
+            self._update_timeout_widget(side)
 
-    def _blue_delta(self, idx, d):
-        if self.match_over or self.auto_deciding: return
-        prev = self.blue[idx]
-        new_val = clamp(prev + d)
-        delta = new_val - prev
-        if delta == 0:
-            return
 
-        self.blue[idx] = new_val
-        # Bookkeep direct C changes for BLUE when operator edits C bucket
-        if SCORE_LABELS[idx] == "C" and delta != 0:
-            if delta > 0:
-                self._direct_c["BLUE"] += delta
-            else:
-                take = min(-delta, self._direct_c["BLUE"])
-                self._direct_c["BLUE"] -= take
-                # If operator reduced more than direct, trim penalty-tagged C as well
-                rem = -delta - take
-                if rem > 0:
-                    self._penalty_c["BLUE"] = max(0, self._penalty_c["BLUE"] - rem)
-                # Keep within total C
-                total_c = self.blue[LABEL_TO_INDEX["C"]]
-                self._direct_c["BLUE"] = min(self._direct_c["BLUE"], total_c)
-                self._penalty_c["BLUE"] = min(self._penalty_c["BLUE"], total_c - self._direct_c["BLUE"])
-        self._record_score_event("BLUE", SCORE_LABELS[idx], delta)
-        self._apply_penalty_side_effects(is_blue=True, idx=idx, delta=delta)
-        self._refresh_digits()
-        if self._check_penalty_end():
-            return
+    def _clear_final_screen(self):
+        """Hide the final overlay if present (the pooled frames are kept for reuse)."""
+        if getattr(self, "final_frame", None):
+            try:
+                self.final_frame.place_forget()
+            except Exception:
+                pass
+            self.final_frame = None
+            if self._overlay_key != self._overlay_state():
+                self._schedule_overlay_prewarm()  # a prewarm skipped the fonts while it was shown
+        self.final_frame = None
 
-    def _green_delta(self, idx, d):
-        if self.match_over or self.auto_deciding: return
-        prev = self.green[idx]
-        new_val = clamp(prev + d)
-        delta = new_val - prev
-        if delta == 0:
+    def _size_overlay_fonts(self):
+        s, base = self._calc_scale(), self.layout["fonts"]["TIME"]
+        self.f_ov_name.configure(size=self._pt(max(48, int(base * 0.7 * s))))
+        self.f_ov_code.configure(size=self._pt(max(40, int(base * 0.45 * s))))
+        self.f_ov_big.configure(size=self._pt(max(60, int(base * 0.8 * s))))
+        self.f_ov_mid.configure(size=self._pt(max(40, int(base * 0.4 * s))))
+        self.f_ov_hint.configure(size=self._pt(max(24, int(28 * s))))
+
+    def _build_winner_overlay(self, side):
+        bg, fg = SIDE_COLORS[side]
+        ov = {"frame": tk.Frame(self, bg=bg)}
+        ov["title"] = tk.Label(ov["frame"], text="WINNER", font=self.f_ov_code, pady=10, bg=bg, fg=fg)
+        ov["title"].pack(pady=(30, 10))
+        ov["info"] = tk.Frame(ov["frame"], bg=bg); ov["info"].pack(pady=(10, 10))
+        ov["name"] = tk.Label(ov["info"], font=self.f_ov_name, bg=bg, fg=fg); ov["name"].pack(pady=(0, 6))
+        ov["code_row"] = tk.Frame(ov["info"], bg=bg); ov["code_row"].pack()
+        ov["flag"] = tk.Label(ov["code_row"], bg=bg)  # packed only when a flag is shown
+        ov["code"] = tk.Label(ov["code_row"], font=self.f_ov_code, bg=bg, fg=fg); ov["code"].pack(side="left")
+        ov["reason"] = tk.Label(ov["frame"], font=self.f_ov_code, bg=bg, fg=fg)
+        ov["reason"].pack(pady=(10, 0))
+        ov["hint"] = tk.Label(ov["frame"], text="Press 0 to reset", font=self.f_ov_hint, bg=bg, fg=fg)
+        ov["hint"].pack(pady=(20, 10))
+        ov["flag_img"] = None
+        return ov
+
+    def _build_tie_overlay(self):
+        bg, fg, acc = "black", "#ffe000", "#cccccc"
+        ov = {"frame": tk.Frame(self, bg=bg)}
+        tk.Label(ov["frame"], text="TIME UP - TIE", bg=bg, fg=fg, font=self.f_ov_big).pack(pady=(40, 20))
+        ov["blue"] = tk.Label(ov["frame"], bg=bg, fg=acc, font=self.f_ov_mid); ov["blue"].pack(pady=5)
+        ov["green"] = tk.Label(ov["frame"], bg=bg, fg=acc, font=self.f_ov_mid); ov["green"].pack(pady=5)
+        tk.Label(ov["frame"], text="Press B for Blue win, G for Green win, or 0 to reset.",
+                 bg=bg, fg=fg, font=self.f_ov_hint).pack(pady=(20, 10))
+        return ov
+
+    def _overlay_state(self):
+        cfg = self.cfg
+        return (self._calc_scale(), self.scale, bool(cfg.get("show_flags")),
+                cfg.get("name1", ""), cfg.get("code1", ""), cfg.get("name2", ""), cfg.get("code2", ""))
+
+    def _overlay_flag_size(self):
+        fw, fh = self._sizes["flag"]
+        return max(40, fw), max(28, fh)
+
+    def _prepare_winner_overlay(self, side, flag_img):
+        if side not in self._overlays:
+            self._overlays[side] = self._build_winner_overlay(side)
+        ov = self._overlays[side]
+        i = "1" if side == "BLUE" else "2"
+        ov["name"].config(text=self.cfg.get("name" + i, ""))
+        ov["code"].config(text=self.cfg.get("code" + i, ""))
+        ov["flag_img"] = flag_img
+        if flag_img:
+            ov["flag"].config(image=flag_img)
+            ov["flag"].pack(side="left", padx=(0, 16), before=ov["code"])
+        else:
+            ov["flag"].config(image="")
+            ov["flag"].pack_forget()
+
+    def _prepare_tie_overlay(self):
+        if "TIE" not in self._overlays:
+            self._overlays["TIE"] = self._build_tie_overlay()
+        ov = self._overlays["TIE"]
+        ov["blue"].config(text=f"{self.cfg.get('name1','')} ({self.cfg.get('code1','')})")
+        ov["green"].config(text=f"{self.cfg.get('name2','')} ({self.cfg.get('code2','')})")
+
+    def _schedule_overlay_prewarm(self):
+        """Re-prepare the outcome overlays once scale/cfg have settled."""
+        if self._overlay_after is not None:
+            self.after_cancel(self._overlay_after)
+        self._overlay_after = self.after(OVERLAY_PREWARM_MS, self._start_overlay_prewarm)
+
+    def _start_overlay_prewarm(self):
+        self._overlay_after = None
+        key = self._overlay_state()
+        if key == self._overlay_key:
             return
-
-        self.green[idx] = new_val
-        # Bookkeep direct C changes for GREEN when operator edits C bucket
-        if SCORE_LABELS[idx] == "C" and delta != 0:
-            if delta > 0:
-                self._direct_c["GREEN"] += delta
-            else:
-                take = min(-delta, self._direct_c["GREEN"])
-                self._direct_c["GREEN"] -= take
-                rem = -delta - take
-                if rem > 0:
-                    self._penalty_c["GREEN"] = max(0, self._penalty_c["GREEN"] - rem)
-                total_c = self.green[LABEL_TO_INDEX["C"]]
-                self._direct_c["GREEN"] = min(self._direct_c["GREEN"], total_c)
-                self._penalty_c["GREEN"] = min(self._penalty_c["GREEN"], total_c - self._direct_c["GREEN"])
-        self._record_score_event("GREEN", SCORE_LABELS[idx], delta)
-        self._apply_penalty_side_effects(is_blue=False, idx=idx, delta=delta)
-        self._refresh_digits()
-        if self._check_penalty_end():
+        if self._overlay_task is not None:
+            self._overlay_task.cancel()
+        self._overlay_task = self.root.aio.submit(self._prewarm_overlays(key))
+
+    async def _prewarm_overlays(self, key):
+        """Build/refresh all three outcome overlays in small steps between Tk events;
+        flag resizing runs on the executor."""
+        aio = self.root.aio
+        # The overlay fonts are shared: never resize them under a card on screen
+        fonts_sized = self.final_frame is None
+        if fonts_sized:
+            self._size_overlay_fonts()
+        w, h = self._overlay_flag_size()
+        for side, code in (("BLUE", self.cfg.get("code1", "")), ("GREEN", self.cfg.get("code2", ""))):
+            flag_img = None
+            if key[2]:
+                resized = None
+                if (code.upper(), w, h) not in self._flag_photos:
+                    resized = await aio.run_blocking(flag_resized, code, w, h)
+                    if self._overlay_state() != key:
+                        return  # rescaled or reloaded meanwhile; a newer prewarm follows
+                flag_img = self._load_flag_image(code, w, h, resized)
+            self._prepare_winner_overlay(side, flag_img)
+            await asyncio.sleep(0)  # give the Tk thread back between overlays
+            if self._overlay_state() != key:
+                return
+        self._prepare_tie_overlay()
+        if fonts_sized:
+            self._overlay_key = key  # else _clear_final_screen prewarms again
+
+    def _ensure_overlays(self):
+        """Make the overlays current right now (only when the prewarm has not caught up)."""
+        key = self._overlay_state()
+        if key == self._overlay_key:
             return
+        if self._overlay_task is not None:
+            self._overlay_task.cancel()
+            self._overlay_task = None
+        self._size_overlay_fonts()
+        w, h = self._overlay_flag_size()
+        for side, code in (("BLUE", self.cfg.get("code1", "")), ("GREEN", self.cfg.get("code2", ""))):
+            self._prepare_winner_overlay(side, self._load_flag_image(code, w, h) if key[2] else None)
+        self._prepare_tie_overlay()
+        self._overlay_key = key
 
+    def _show_final_winner_screen(self, who: str, reason: str = ""):
+        """Cover the UI with the pre-built winner card."""
+        if who not in SIDE_COLORS:
+            # Fallback to tie screen if unknown
+            return self._show_tie_screen()
+        self._clear_final_screen()
+        self._ensure_overlays()
+        ov = self._overlays[who]
+        ov["reason"].config(text=final_reason_text(reason))
+        self.final_frame = ov["frame"]
+        self.final_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.final_frame.lift()
 
-    def _reset_all(self, _=None):
-        self.blue = [0]*SCORE_COUNT
-        self.green = [0]*SCORE_COUNT
-        self.timeout_counts = {"BLUE": 0, "GREEN": 0}
-        self._direct_c = {"BLUE": 0, "GREEN": 0}
-        self._penalty_c = {"BLUE": 0, "GREEN": 0}
-        self.match_over = False
+    def _show_tie_screen(self):
+        """Show neutral screen for tie; lets you pick winner with keys w/m or reset with 0."""
         self._clear_final_screen()
-        self._reset_time()
-        self._refresh_digits()
-        self._update_timeout_widgets()
-        # Relayout control buttons on scale/resize
-        self._layout_control_buttons()
+        self._ensure_overlays()
+        self.final_frame = self._overlays["TIE"]["frame"]
+        self.final_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.final_frame.lift()
 
     def _layout_control_buttons(self):
         """Lay out control buttons in multiple rows to fit available width.
@@ -1193,22 +3758,17 @@ class ScoreboardWindow(tk.Toplevel):
             b.grid(row=row, column=col, padx=pad, pady=(pad//2))
             col += 1
             curw += bw
-        self.final_reason = ""
-        self._show_winner("")  # clear mini ribbon
-        self._event_counter = 0
-        self._last_cy_event = None
-        self._last_dt_event = None
-        self._cancel_pending_auto_winner()
 
 
     def _new_match(self):
+        core = self.core
         baseline_time = self.cfg["mm"]*60 + self.cfg["ss"]
-        in_progress = self.running or (
-            not self.match_over and (
-                any(self.blue) or any(self.green) or
-                self.timeout_counts.get("BLUE", 0) or
-                self.timeout_counts.get("GREEN", 0) or
-                self.time_left != baseline_time
+        in_progress = core.running or (
+            not core.match_over and (
+                any(core.blue) or any(core.green) or
+                core.timeout_counts.get("BLUE", 0) or
+                core.timeout_counts.get("GREEN", 0) or
+                core.time_left != baseline_time
             )
         )
         if in_progress:
@@ -1218,52 +3778,69 @@ class ScoreboardWindow(tk.Toplevel):
             )
             if not confirm:
                 return
-        self._close()
-
-
-    def _auto_winner(self):
-        w = self._winner_by_point_advantage()
-        self._show_winner(w)
-
-    def _show_winner(self, who: str, reason: str = ""):
-        # Keep small ribbon (if you still want it mid-match)
-        was_auto_deciding = self.auto_deciding
-        if who:
-            self._cancel_pending_auto_winner()
-        if not who:
-            self.winner_lbl.config(text="", bg="black", fg="black")
-            self.final_reason = ""
-            return
-
-        self.final_reason = reason or ""
-        reason_display = self.final_reason
+        # Keep the board (and its fonts, widgets and cached images) on screen; the
+        # operator picks the next bout in the config window and Start reloads in place.
+        core.halt()
+        self.root.deiconify()
+        self.root.attributes("-topmost", True)
+        self.root.lift()
+        self.root.focus_force()
 
-        if who == "BLUE":
-            if reason_display == "HALOL":
-                text = 'Blue competitor wins by "HALOL"'
-            elif reason_display == "POINT ADVANTAGE":
-                text = 'Blue competitor wins by "POINT ADVANTAGE"'
-            else:
-                text = f"{self.cfg['name1']} WINS"
-            self.winner_lbl.config(text=text, bg="#1976d2", fg="white")
-        elif who == "GREEN":
-            if reason_display == "HALOL":
-                text = 'Green competitor wins by "HALOL"'
-            elif reason_display == "POINT ADVANTAGE":
-                text = 'Green competitor wins by "POINT ADVANTAGE"'
+    def reload(self, cfg):
+        """Start a new bout in this window: apply *cfg* and reset the match state,
+        touching only the widgets whose content changed."""
+        old, self.cfg = self.cfg, cfg
+
+        for widget, text in ((self.top_left_meta, cfg.get("event_left", "")),
+                             (self.top_left_detail, f"{cfg['gender']}   {cfg['weight']}"),
+                             (self.blue_name, cfg.get("name1", "")), (self.blue_code, cfg["code1"]),
+                             (self.green_name, cfg.get("name2", "")), (self.green_code, cfg["code2"])):
+            if widget.cget("text") != text:
+                widget.config(text=text)
+
+        if bool(cfg.get("show_flags")) != bool(old.get("show_flags")):
+            if cfg.get("show_flags"):
+                self.blue_flag.pack(side="left", padx=(20,10), before=self.blue_id)
+                self.green_flag.pack(side="left", padx=(20,10), before=self.green_id)
+                self._refresh_flags()
             else:
-                text = f"{self.cfg['name2']} WINS"
-            self.winner_lbl.config(text=text, bg="#00e676", fg="black")
+                self.blue_flag.pack_forget(); self.green_flag.pack_forget()
+        elif (cfg["code1"], cfg["code2"]) != (old["code1"], old["code2"]):
+            self._refresh_flags()  # resized flags come from the per-window cache when seen before
 
-        # If match already ended (or you just want to force the final screen), show overlay too
-        if was_auto_deciding:
-            self.match_over = True
-        if (not self.running and self.time_left == 0) or self.match_over or was_auto_deciding:
-            self._show_final_winner_screen(who, reason_display)
+        if any(cfg.get(k) != old.get(k) for k in ("name1", "name2", "code1", "code2")):
+            self._sync_name_column_width()
+        if self.broadcast:
+            self.broadcast.renderer.set_cfg(cfg)
 
+        self.core.load(cfg)
+        self._layout_control_buttons()
+        self._render_frame()  # apply the new bout's digits/timer in this same Tk frame
+        self._schedule_overlay_prewarm()
+        self.deiconify(); self.lift(); self.focus_force()
 
 
     # ---------- fullscreen / keys ----------
+    def _toggle_perf_capture(self, _=None):
+        if self.perf is None:
+            self.perf = PerfCapture(self, self.cfg.get("perf_dir") or PERF_DIR)
+            self.title(f"{APP_TITLE} — perf capture running")
+            self.bell()
+        else:
+            path = self._stop_perf_capture()
+            self.title(APP_TITLE)
+            if path:
+                messagebox.showinfo("Perf capture", f"Capture written to:\n{path}", parent=self)
+
+    def _stop_perf_capture(self):
+        """Stop the running capture and write it; its folder, or None (after a warning)."""
+        perf, self.perf = self.perf, None
+        try:
+            return perf.stop()
+        except Exception as e:
+            messagebox.showwarning("Perf capture", f"Could not write the capture to {perf.out}:\n{e}", parent=self)
+            return None
+
     def _toggle_fullscreen(self, force=None):
         cur = bool(self.attributes("-fullscreen"))
         new = (not cur) if force is None else bool(force)
@@ -1272,8 +3849,10 @@ class ScoreboardWindow(tk.Toplevel):
         self.after(60, self._apply_scale)
 
     def _bind(self):
-        # bind_all so keys work regardless of focus
-        b = self.bind_all
+        # bind_all so keys work regardless of focus; remembered so _close can release them
+        self._bound_keys = []
+        def b(seq, fn):
+            self.bind_all(seq, self._metered(fn) if self.metrics else fn); self._bound_keys.append(seq)
 
         # Timer / reset
         b("<space>", self._toggle_timer)
@@ -1284,6 +3863,7 @@ class ScoreboardWindow(tk.Toplevel):
 
         # Fullscreen
         b("<F11>", lambda e: self._toggle_fullscreen())
+        b("<F9>", self._toggle_perf_capture)  # start/stop profiling (see Perf capture)
         b("<Alt-Return>", lambda e: self._toggle_fullscreen())
         b("<Escape>", lambda e: (self._toggle_fullscreen(False) if self.attributes("-fullscreen") else self._close()))
 
@@ -1301,17 +3881,20 @@ class ScoreboardWindow(tk.Toplevel):
         idx_d = LABEL_TO_INDEX["D"]
         idx_t = LABEL_TO_INDEX["T"]
 
-        b("r", lambda e: self._blue_delta(idx_y,+1)); b("R", lambda e: self._blue_delta(idx_y,-1))
-        b("h", lambda e: self._blue_delta(idx_y,+1)); b("H", lambda e: self._blue_delta(idx_y,-1))
-        b("y", lambda e: self._blue_delta(idx_c,+1)); b("Y", lambda e: self._blue_delta(idx_c,-1))
-        b("c", lambda e: self._blue_delta(idx_d,+1)); b("C", lambda e: self._blue_delta(idx_d,-1))
-        b("v", lambda e: self._blue_delta(idx_t,+1)); b("V", lambda e: self._blue_delta(idx_t,-1))
+        # Looked up per key press: the core is replaced if its server is lost
+        blue = lambda idx, d: self.core.delta("BLUE", idx, d)
+        green = lambda idx, d: self.core.delta("GREEN", idx, d)
+        b("r", lambda e: blue(idx_y,+1)); b("R", lambda e: blue(idx_y,-1))
+        b("h", lambda e: blue(idx_y,+1)); b("H", lambda e: blue(idx_y,-1))
+        b("y", lambda e: blue(idx_c,+1)); b("Y", lambda e: blue(idx_c,-1))
+        b("c", lambda e: blue(idx_d,+1)); b("C", lambda e: blue(idx_d,-1))
+        b("v", lambda e: blue(idx_t,+1)); b("V", lambda e: blue(idx_t,-1))
 
         # Green +/- (Y C D T)
-        b("n", lambda e: self._green_delta(idx_y,+1)); b("N", lambda e: self._green_delta(idx_y,-1))
-        b("k", lambda e: self._green_delta(idx_c,+1)); b("K", lambda e: self._green_delta(idx_c,-1))
-        b("l", lambda e: self._green_delta(idx_d,+1)); b("L", lambda e: self._green_delta(idx_d,-1))
-        b(";", lambda e: self._green_delta(idx_t,+1)); b(":", lambda e: self._green_delta(idx_t,-1))
+        b("n", lambda e: green(idx_y,+1)); b("N", lambda e: green(idx_y,-1))
+        b("k", lambda e: green(idx_c,+1)); b("K", lambda e: green(idx_c,-1))
+        b("l", lambda e: green(idx_d,+1)); b("L", lambda e: green(idx_d,-1))
+        b(";", lambda e: green(idx_t,+1)); b(":", lambda e: green(idx_t,-1))
 
         # Winner & auto
         b("b", lambda e: self._show_winner("BLUE"))
@@ -1324,20 +3907,1823 @@ class ScoreboardWindow(tk.Toplevel):
 
        
 
-    def _on_resize(self, _): self.after_idle(self._apply_scale)
+    def _metered(self, fn):
+        """Key handler that feeds the input latency metrics (press → frame showing it)."""
+        def handler(e):
+            self.metrics.input()
+            result = fn(e)
+            # Nothing to redraw: done now. A remote core's change arrives later, with its frame
+            if self._frame_after_id is None and not isinstance(self.core, RemoteCore):
+                self.metrics.frame()
+            return result
+        return handler
+
+    def _on_resize(self, event):
+        # Children's Configure events (bubbling up via the toplevel's bindtag) do
+        # not change the scale, which only follows this window's size
+        if event.widget is not self:
+            return
+        self._schedule_monitor_check(event)
+        self._media_burst()
+        if self._scale_idle is None:
+            self._scale_idle = self.after_idle(self._apply_scale_idle)
+
+    def _apply_scale_idle(self):
+        self._scale_idle = None
+        self._apply_scale()
     def _close(self):
-        if self.after_id:
+        if self.perf:
+            self._stop_perf_capture()  # never raises: the rest of the cleanup must run
+        self.core.halt()
+        if self._core_task is not None:
+            self._core_task.cancel()
+            self._core_task = None
+        if isinstance(self.core, RemoteCore):
+            self.core.close()
+        if self._overlay_after is not None:
+            self.after_cancel(self._overlay_after)
+            self._overlay_after = None
+        if self._overlay_task is not None:
+            self._overlay_task.cancel()
+            self._overlay_task = None
+        self._cancel_render()
+        if self._refine_after is not None:
+            self.after_cancel(self._refine_after)
+            self._refine_after = None
+        if self._monitor_after is not None:
+            self.after_cancel(self._monitor_after)
+            self._monitor_after = None
+        if self._scale_idle is not None:
+            self.after_cancel(self._scale_idle)
+            self._scale_idle = None
+        FLAGS.unsubscribe(self._on_flags_changed)
+        if self.broadcast:
+            self.broadcast.close()
+            self.broadcast = None
+        if self.led:
+            self.led.close()
+            self.led = None
+        if self.clock_sync:
+            self.after_cancel(self._sync_after)
+            self.clock_sync.close()
+        if self.state_shm:
+            self.state_shm.close()
+            self.state_shm = None
+        if self.export and self.export.on_error is self._on_export_error:
+            self.export.on_error = None  # the pipeline outlives this window
+        if self.metrics:
+            self.metrics.sources = {}  # the endpoint stays up for the next board
+        # Global bindings would otherwise keep this window (and its images) alive
+        for seq in getattr(self, "_bound_keys", ()):
             try:
-                self.after_cancel(self.after_id)
+                self.unbind_all(seq)
             except Exception:
                 pass
-            self.after_id = None
-        self._cancel_pending_auto_winner()
-        self.running = False
         self.destroy()
+        if getattr(self.root, "board", None) is self:
+            self.root.board = None
         self.root.deiconify()
         self.root.focus_force()
 
+# ---------------- Perf capture ----------------
+# F9 (or `--perf-capture`) profiles the running board: cProfile of the Tk
+# thread plus tracemalloc snapshots at start and stop, written to a folder
+# together with the scale, window size and match state at both ends, so a
+# hitch during a live bout can be analysed afterwards.
+PERF_DIR = "perf"
+
+class PerfCapture:
+    def __init__(self, board, out_dir=PERF_DIR):
+        import cProfile, tracemalloc
+        self.board = board
+        self.out = os.path.abspath(os.path.join(out_dir, time.strftime("capture-%Y%m%d-%H%M%S")))
+        self._tracemalloc = tracemalloc
+        self._own_tracing = not tracemalloc.is_tracing()
+        if self._own_tracing:
+            tracemalloc.start(16)
+        self.snap0 = tracemalloc.take_snapshot()
+        self.state0 = self._state()
+        self.started = time.perf_counter()
+        self.profile = cProfile.Profile()
+        self.profile.enable()  # profiles the calling (Tk) thread only
+
+    def _state(self):
+        b, core = self.board, self.board.core
+        try:
+            size = (b.winfo_width(), b.winfo_height())
+            dpi = b._scale_context().dpi
+            fullscreen = bool(b.attributes("-fullscreen"))
+        except Exception:
+            size, dpi, fullscreen = (0, 0), 0.0, False
+        return dict(
+            at=time.strftime("%Y-%m-%d %H:%M:%S"), scale=b.scale, zoom=b.zoom, size=size, dpi=dpi,
+            fullscreen=fullscreen, render=dict(b.render_stats),
+            match=dict(time_left_ms=core.time_left_ms(), running=core.running, jazzo=core.jaza_active,
+                       over=core.match_over, deciding=core.auto_deciding, winner=core.winner,
+                       blue=list(core.blue), green=list(core.green), timeouts=dict(core.timeout_counts)),
+        )
+
+    def stop(self):
+        """Stop profiling and write the capture; returns its folder."""
+        import pstats, platform
+        self.profile.disable()
+        duration = time.perf_counter() - self.started
+        snap1 = self._tracemalloc.take_snapshot()
+        if self._own_tracing:
+            self._tracemalloc.stop()
+        os.makedirs(self.out, exist_ok=True)
+        self.profile.dump_stats(os.path.join(self.out, "tk_thread.pstats"))
+        with open(os.path.join(self.out, "tk_thread.txt"), "w", encoding="utf-8") as fh:
+            stats = pstats.Stats(self.profile, stream=fh).strip_dirs()
+            stats.sort_stats("cumulative").print_stats(60)
+            stats.sort_stats("tottime").print_stats(30)
+        self.snap0.dump(os.path.join(self.out, "tracemalloc_start.snap"))
+        snap1.dump(os.path.join(self.out, "tracemalloc_stop.snap"))
+        with open(os.path.join(self.out, "tracemalloc_diff.txt"), "w", encoding="utf-8") as fh:
+            for stat in snap1.compare_to(self.snap0, "lineno")[:40]:
+                fh.write(f"{stat}\n")
+        cfg = {k: v for k, v in self.board.cfg.items() if isinstance(v, (str, int, float, bool, type(None)))}
+        meta = dict(duration_s=round(duration, 3), python=sys.version, platform=platform.platform(),
+                    cfg=cfg, start=self.state0, stop=self._state())
+        with open(os.path.join(self.out, "meta.json"), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, indent=2)
+        return self.out
+
+# ---------------- Broadcast output ----------------
+# Off-screen RGBA frames for OBS/vMix. Frames are drawn with Pillow from the same
+# view-model the Tk render loop uses, so the output does not depend on the window
+# being visible, focused or left where the capture expects it.
+BROADCAST_SIZES = {"1080p": (1920, 1080), "4k": (3840, 2160)}
+BROADCAST_FPS = 30
+
+PIL_FONT_CANDIDATES = {
+    True:  ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf"),
+    False: ("arial.ttf", "Arial.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf"),
+}
+
+@functools.lru_cache(maxsize=64)
+def pil_font(size_px: int, bold: bool = True):
+    """Arial (or the closest installed sans) at a pixel size, for Pillow drawing."""
+    for name in PIL_FONT_CANDIDATES[bool(bold)]:
+        try:
+            return ImageFont.truetype(name, size_px)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size_px)
+    except TypeError:  # Pillow < 10.1 has a single bitmap size
+        return ImageFont.load_default()
+
+
+class BroadcastRenderer:
+    """Draws the scoreboard into a persistent RGBA frame.
+
+    Static parts (meta, flags, codes, names, bucket letters) are painted once per
+    cfg; afterwards only the regions whose view-model entry changed are cleared
+    and redrawn. render() returns those dirty boxes so sinks can copy just them.
+    """
+    BG = (0, 0, 0, 255)
+
+    def __init__(self, cfg, size=BROADCAST_SIZES["1080p"]):
+        self.width, self.height = size
+        self.k = self.height / BASE_H
+        self.frame = Image.new("RGBA", size, self.BG)
+        self.draw = ImageDraw.Draw(self.frame)
+        self.set_cfg(cfg)
+
+    def set_cfg(self, cfg):
+        """Switch competitors/meta; the next render() repaints the whole frame."""
+        self.cfg = cfg
+        self._last = {}
+        self._static_drawn = False
+        self._layout()
+
+    # Layout is authored in 1920×1080 coordinates and scaled to the output size
+    def _box(self, x0, y0, x1, y1):
+        k = self.k
+        return (int(x0 * k), int(y0 * k), int(x1 * k), int(y1 * k))
+
+    def _font(self, key, bold=True):
+        # Same visual weight as the Tk board at its default zoom
+        return pil_font(max(8, int(BASE[key] * DEFAULT_ZOOM * 96 / 72 * self.k)), bold)
+
+    def _layout(self):
+        b = self._box
+        self.regions = {
+            "meta":   b(0, 0, 560, 250),
+            "time":   b(560, 0, 1360, 250),
+            "ribbon": b(0, 590, 1920, 680),
+        }
+        for side, y in (("BLUE", 290), ("GREEN", 700)):
+            self.regions[("flag", side)] = b(90, y + 15, 340, y + 185)
+            self.regions[("id", side)] = b(370, y, 810, y + 200)
+            for i in range(SCORE_COUNT):
+                x = 840 + i * 210
+                self.regions[("digit", side, i)] = b(x, y, x + 186, y + 200)
+                self.regions[("label", side, i)] = b(x, y + 205, x + 186, y + 285)
+        self.dynamic_keys = ["time", "ribbon"] + [
+            ("digit", side, i) for side in ("BLUE", "GREEN") for i in range(SCORE_COUNT)
+        ]
+
+    def _fit_font(self, key, text, max_w, bold=True):
+        """Largest font up to BASE[key] whose rendering of *text* fits in max_w pixels."""
+        font = self._font(key, bold)
+        while text and font.size > 8 and self.draw.textlength(text, font=font) > max_w:
+            font = pil_font(int(font.size * 0.9), bold)
+        return font
+
+    def _clear(self, box, fill=BG):
+        x0, y0, x1, y1 = box
+        self.draw.rectangle((x0, y0, x1 - 1, y1 - 1), fill=fill)
+
+    def _center_text(self, box, text, font, fill):
+        x0, y0, x1, y1 = box
+        self.draw.text(((x0 + x1) // 2, (y0 + y1) // 2), text, font=font, fill=fill, anchor="mm")
+
+    def _draw_static(self):
+        cfg = self.cfg
+        x0, y0, x1, _ = self.regions["meta"]
+        pad = int(20 * self.k)
+        event = cfg.get("event_left", "")
+        detail = f"{cfg.get('gender','')}   {cfg.get('weight','')}"
+        self.draw.text((x0 + pad, y0 + pad), event,
+                       font=self._fit_font("TOPMETA", event, x1 - x0 - 2 * pad), fill="white")
+        self.draw.text((x0 + pad, y0 + pad + int(110 * self.k)), detail,
+                       font=self._fit_font("SUBMETA", detail, x1 - x0 - 2 * pad, bold=False), fill="#cccccc")
+
+        for side, code_key, name_key, name_bg in (("BLUE", "code1", "name1", "#1976d2"),
+                                                  ("GREEN", "code2", "name2", "#2e7d32")):
+            if cfg.get("show_flags"):
+                self._draw_flag(self.regions[("flag", side)], cfg.get(code_key, ""))
+            x0, y0, x1, y1 = self.regions[("id", side)]
+            name_h = int(70 * self.k)
+            name_box = (x0, y0, x1, y0 + name_h)
+            code_box = (x0, y0 + name_h, x1, y1)
+            if side == "GREEN":  # Green stacks code above name, as on the Tk board
+                code_box = (x0, y0, x1, y1 - name_h)
+                name_box = (x0, y1 - name_h, x1, y1)
+            self._clear(name_box, name_bg)
+            self.draw.text((name_box[0] + int(12 * self.k), (name_box[1] + name_box[3]) // 2),
+                           cfg.get(name_key, ""), font=self._font("NAME"), fill="white", anchor="lm")
+            self.draw.text((code_box[0], (code_box[1] + code_box[3]) // 2),
+                           cfg.get(code_key, ""), font=self._font("CODE"), fill="white", anchor="lm")
+            for i, letter in enumerate(SCORE_LABELS):
+                self._center_text(self.regions[("label", side, i)], letter, self._font("LABEL"),
+                                  LABEL_COLORS.get(letter, "#ffe000"))
+
+    def _draw_flag(self, box, code):
+        src = FLAGS.image(code) if code else None
+        if src is None:
+            return
+        x0, y0, x1, y1 = box
+        try:
+            flag = src.convert("RGBA").resize((x1 - x0, y1 - y0), RESAMPLE)
+        except Exception:
+            return
+        self.frame.paste(flag, (x0, y0))
+
+    def _draw_dynamic(self, key, value, box):
+        if key == "time":
+            self._center_text(box, value, self._font("TIME"), "red")
+        elif key == "ribbon":
+            text, bg, fg = value
+            if text:
+                font = self._font("WINNER")
+                l, t, r, btm = self.draw.textbbox((0, 0), text, font=font)
+                cx = (box[0] + box[2]) // 2
+                half_w = (r - l) // 2 + int(30 * self.k)
+                self._clear((max(box[0], cx - half_w), box[1], min(box[2], cx + half_w), box[3]), bg)
+                self._center_text(box, text, font, fg)
+        else:
+            self._clear(box, "#222222")
+            letter = SCORE_LABELS[key[2]]
+            self._center_text(box, value, self._font("DIGIT"),
+                              "#ff5252" if letter in ("D", "T") else "white")
+
+    def render(self, vm):
+        """Bring the frame up to date with *vm*; returns the dirty (x0, y0, x1, y1) boxes."""
+        dirty = []
+        if not self._static_drawn:
+            self._clear((0, 0, self.width, self.height))
+            self._draw_static()
+            self._static_drawn = True
+            self._last = {}
+            dirty.append((0, 0, self.width, self.height))
+        for key in self.dynamic_keys:
+            value = vm.get(key)
+            if key in self._last and self._last[key] == value:
+                continue
+            box = self.regions[key]
+            self._clear(box)
+            if value is not None:
+                self._draw_dynamic(key, value, box)
+            self._last[key] = value
+            if len(dirty) == 0 or dirty[0] != (0, 0, self.width, self.height):
+                dirty.append(box)
+        return dirty
+
+
+class ShmFrameRing:
+    """Publishes frames into a named shared-memory ring of RGBA slots.
+
+    Header (little endian, HEADER_SIZE bytes): magic b"KSFB", u16 version,
+    u16 slot count, u32 width, u32 height, u32 latest slot, u64 frame sequence,
+    f64 timestamp; then one u64 sequence per slot, odd while that slot is being
+    written (the seqlock of kurash_shm.StateWriter). Slot i's pixels start at
+    HEADER_SIZE + slots * 8 + i * width * height * 4. Readers copy the latest
+    slot and retry if its sequence changed meanwhile (see read_frame_ring); it
+    is not rewritten until `slots - 1` newer frames have been published. Each
+    slot only receives the regions that changed since it was last written.
+    """
+    MAGIC = b"KSFB"
+    VERSION = 2
+    HEADER = struct.Struct("<4sHHIIIQd")
+    HEADER_SIZE = 64
+    SLOT_SEQ = struct.Struct("<Q")
+
+    def __init__(self, name, width, height, slots=3):
+        from multiprocessing import shared_memory
+        self.width, self.height, self.slots = width, height, slots
+        self.slot_size = width * height * 4
+        self.data_offset = self.HEADER_SIZE + slots * self.SLOT_SEQ.size
+        size = self.data_offset + slots * self.slot_size
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Stale segment from a previous run: reuse it if large enough
+            self.shm = shared_memory.SharedMemory(name=name)
+            if self.shm.size < size:
+                self.shm.close()
+                raise
+        self.name = name
+        self.seq = 0
+        self._slot_seq = [0] * slots
+        self._pending = [[(0, 0, width, height)] for _ in range(slots)]
+        for i in range(slots):
+            self.SLOT_SEQ.pack_into(self.shm.buf, self.HEADER_SIZE + i * self.SLOT_SEQ.size, 0)
+        self._write_header(0, 0.0)
+
+    def _write_header(self, latest, ts):
+        self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, self.VERSION, self.slots,
+                              self.width, self.height, latest, self.seq, ts)
+
+    def _blit(self, base, frame, box):
+        x0, y0, x1, y1 = box
+        buf = self.shm.buf
+        if box == (0, 0, self.width, self.height):
+            buf[base:base + self.slot_size] = frame.tobytes()
+            return
+        data = frame.crop(box).tobytes()
+        row = (x1 - x0) * 4
+        stride = self.width * 4
+        off = base + y0 * stride + x0 * 4
+        for r in range(y1 - y0):
+            buf[off:off + row] = data[r * row:(r + 1) * row]
+            off += stride
+
+    def publish(self, frame, dirty):
+        for pending in self._pending:
+            pending.extend(dirty)
+        slot = (self.seq + 1) % self.slots
+        boxes = self._pending[slot]
+        if len(boxes) > 16:
+            xs0, ys0, xs1, ys1 = zip(*boxes)
+            boxes = [(min(xs0), min(ys0), max(xs1), max(ys1))]
+        base = self.data_offset + slot * self.slot_size
+        seq_at = self.HEADER_SIZE + slot * self.SLOT_SEQ.size
+        buf = self.shm.buf
+        self.SLOT_SEQ.pack_into(buf, seq_at, self._slot_seq[slot] + 1)  # odd: readers retry
+        for box in boxes:
+            self._blit(base, frame, box)
+        self._slot_seq[slot] += 2
+        self.SLOT_SEQ.pack_into(buf, seq_at, self._slot_seq[slot])
+        self._pending[slot] = []
+        self.seq += 1
+        self._write_header(slot, time.time())
+
+    def close(self):
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except Exception:
+            pass
+
+
+def read_frame_ring(buf, timeout=0.25):
+    """(frame sequence, RGBA Image) of the newest complete frame in a ShmFrameRing
+    buffer (e.g. SharedMemory(name).buf of another process)."""
+    ring = ShmFrameRing
+    magic, version, slots, width, height, _, _, _ = ring.HEADER.unpack_from(buf, 0)
+    if magic != ring.MAGIC or version != ring.VERSION:
+        raise ValueError(f"not a v{ring.VERSION} broadcast frame ring")
+    slot_size = width * height * 4
+    deadline = time.monotonic() + timeout
+    while True:
+        _, _, _, _, _, slot, seq, _ = ring.HEADER.unpack_from(buf, 0)
+        seq_at = ring.HEADER_SIZE + slot * ring.SLOT_SEQ.size
+        s1 = ring.SLOT_SEQ.unpack_from(buf, seq_at)[0]
+        if not s1 & 1:
+            base = ring.HEADER_SIZE + slots * ring.SLOT_SEQ.size + slot * slot_size
+            data = bytes(buf[base:base + slot_size])
+            if ring.SLOT_SEQ.unpack_from(buf, seq_at)[0] == s1:
+                return seq, Image.frombytes("RGBA", (width, height), data)
+        if time.monotonic() > deadline:
+            raise TimeoutError("writer kept the frame busy")
+        time.sleep(0)
+
+
+class _ThreadedFrameSink:
+    """Hands frames to a writer thread so slow disks/pipes never stall the Tk thread.
+
+    The queue holds at most two frames; when the writer falls behind the newest
+    frame is dropped and counted rather than blocking the caller. A frame is
+    only copied when it will be queued, and an unchanged frame (no dirty
+    boxes) reuses the previous copy, which the writer never modifies.
+    """
+    def __init__(self):
+        self.dropped = 0
+        self.written = 0
+        self.copies = 0
+        self._last = None
+        self._q = queue.Queue(maxsize=2)
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def publish(self, frame, dirty):
+        if self._q.full():  # only this thread puts, so there is still room below
+            self.dropped += 1
+            if dirty:
+                self._last = None  # the kept copy is stale now
+            return
+        if dirty or self._last is None:
+            self._last = frame.copy()
+            self.copies += 1
+        self._q.put_nowait(self._last)
+
+    def _run(self):
+        while True:
+            frame = self._q.get()
+            if frame is None:
+                break
+            try:
+                self._write(frame)
+                self.written += 1
+            except Exception:
+                self.dropped += 1
+
+    def close(self):
+        try:
+            self._q.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=2.0)
+
+
+class ImageSequenceSink(_ThreadedFrameSink):
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._n = 0
+        super().__init__()
+
+    def _write(self, frame):
+        frame.save(os.path.join(self.directory, f"frame_{self._n:06d}.png"), compress_level=1)
+        self._n += 1
+
+
+class PipeSink(_ThreadedFrameSink):
+    """Raw RGBA to stdout or a FIFO, e.g. `ffmpeg -f rawvideo -pix_fmt rgba -s 1920x1080 -r 30 -i -`."""
+    def __init__(self, target="-"):
+        self._own = target != "-"
+        self._out = open(target, "wb") if self._own else sys.stdout.buffer
+        super().__init__()
+
+    def _write(self, frame):
+        self._out.write(frame.tobytes())
+
+    def close(self):
+        super().close()
+        if self._own:
+            try:
+                self._out.close()
+            except Exception:
+                pass
+
+
+def make_frame_sink(spec: str, width: int, height: int, ring: int = 1):
+    """`shm[:NAME]`, `png[:DIR]` or `pipe[:PATH]` (`pipe` alone writes to stdout)."""
+    kind, _, arg = spec.partition(":")
+    kind = kind.lower()
+    if kind == "shm":
+        return ShmFrameRing(arg or f"kurash_ring{ring}_frames", width, height)
+    if kind == "png":
+        return ImageSequenceSink(arg or "broadcast_frames")
+    if kind == "pipe":
+        return PipeSink(arg or "-")
+    raise ValueError(f"unknown broadcast output: {spec!r}")
+
+
+class BroadcastOutput:
+    """Renders a scoreboard's view-model off-screen and publishes it at a steady rate."""
+    def __init__(self, board, spec, size="1080p", fps=BROADCAST_FPS):
+        self.board = board
+        self.period = 1.0 / max(1, int(fps))
+        self.renderer = BroadcastRenderer(board.cfg, BROADCAST_SIZES[size])
+        self.sink = make_frame_sink(spec, self.renderer.width, self.renderer.height,
+                                    ring=int(board.cfg.get("ring", 1)))
+        self.stats = dict(frames=0, late=0, dirty_px=0, render_ms=0.0)
+        self._after_id = None
+        self._t0 = time.perf_counter()
+        self._n = 0
+        self._tick()
+
+    def _tick(self):
+        start = time.perf_counter()
+        dirty = self.renderer.render(self.board._view_model())
+        self.sink.publish(self.renderer.frame, dirty)
+        stats = self.stats
+        stats["frames"] += 1
+        stats["dirty_px"] += sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in dirty)
+        stats["render_ms"] = (time.perf_counter() - start) * 1000.0
+
+        # Fixed deadlines (t0 + n·period) so the output rate does not drift
+        self._n += 1
+        now = time.perf_counter()
+        next_at = self._t0 + self._n * self.period
+        if next_at < now:
+            missed = int((now - next_at) / self.period) + 1
+            stats["late"] += missed
+            self._n += missed
+            next_at = self._t0 + self._n * self.period
+        self._after_id = self.board.after(max(0, int((next_at - now) * 1000)), self._tick)
+
+    def close(self):
+        if self._after_id is not None:
+            try:
+                self.board.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self.sink.close()
+
+# ---------------- LED panel output ----------------
+# Small LED matrix boards (192×96, 256×128, ...) that take raw RGB frames.
+# The essentials (clock, bucket digits, IOC codes, winner colour) are drawn
+# with a built-in 5×7 bitmap font scaled by whole pixels, so glyphs stay
+# crisp on a coarse matrix. A frame is only rendered and sent when what it
+# shows changed, at most LED_MAX_FPS times a second, from a sender thread.
+LED_SIZE = (192, 96)
+LED_MAX_FPS = 30
+LED_PORT = 47700
+LED_MAGIC = b"KSLD"
+# UDP packet: magic, u32 frame, u16 first row, u16 rows, u16 width, u16 height, then RGB rows
+LED_UDP_HEADER = struct.Struct("<4sIHHHH")
+LED_UDP_PAYLOAD = 1400   # keeps every datagram under a typical 1500 byte MTU
+
+# 5×7 glyphs as five column bytes, bit 0 = top row (the classic LCD font)
+LED_FONT = {
+    "0": (0x3E, 0x51, 0x49, 0x45, 0x3E), "1": (0x00, 0x42, 0x7F, 0x40, 0x00),
+    "2": (0x42, 0x61, 0x51, 0x49, 0x46), "3": (0x21, 0x41, 0x45, 0x4B, 0x31),
+    "4": (0x18, 0x14, 0x12, 0x7F, 0x10), "5": (0x27, 0x45, 0x45, 0x45, 0x39),
+    "6": (0x3C, 0x4A, 0x49, 0x49, 0x30), "7": (0x01, 0x71, 0x09, 0x05, 0x03),
+    "8": (0x36, 0x49, 0x49, 0x49, 0x36), "9": (0x06, 0x49, 0x49, 0x29, 0x1E),
+    ":": (0x00, 0x36, 0x36, 0x00, 0x00), "-": (0x08, 0x08, 0x08, 0x08, 0x08),
+    " ": (0x00, 0x00, 0x00, 0x00, 0x00),
+    "A": (0x7E, 0x11, 0x11, 0x11, 0x7E), "B": (0x7F, 0x49, 0x49, 0x49, 0x36),
+    "C": (0x3E, 0x41, 0x41, 0x41, 0x22), "D": (0x7F, 0x41, 0x41, 0x22, 0x1C),
+    "E": (0x7F, 0x49, 0x49, 0x49, 0x41), "F": (0x7F, 0x09, 0x09, 0x01, 0x01),
+    "G": (0x3E, 0x41, 0x49, 0x49, 0x7A), "H": (0x7F, 0x08, 0x08, 0x08, 0x7F),
+    "I": (0x00, 0x41, 0x7F, 0x41, 0x00), "J": (0x20, 0x40, 0x41, 0x3F, 0x01),
+    "K": (0x7F, 0x08, 0x14, 0x22, 0x41), "L": (0x7F, 0x40, 0x40, 0x40, 0x40),
+    "M": (0x7F, 0x02, 0x0C, 0x02, 0x7F), "N": (0x7F, 0x04, 0x08, 0x10, 0x7F),
+    "O": (0x3E, 0x41, 0x41, 0x41, 0x3E), "P": (0x7F, 0x09, 0x09, 0x09, 0x06),
+    "Q": (0x3E, 0x41, 0x51, 0x21, 0x5E), "R": (0x7F, 0x09, 0x19, 0x29, 0x46),
+    "S": (0x46, 0x49, 0x49, 0x49, 0x31), "T": (0x01, 0x01, 0x7F, 0x01, 0x01),
+    "U": (0x3F, 0x40, 0x40, 0x40, 0x3F), "V": (0x1F, 0x20, 0x40, 0x20, 0x1F),
+    "W": (0x3F, 0x40, 0x38, 0x40, 0x3F), "X": (0x63, 0x14, 0x08, 0x14, 0x63),
+    "Y": (0x07, 0x08, 0x70, 0x08, 0x07), "Z": (0x61, 0x51, 0x49, 0x45, 0x43),
+}
+LED_SIDE_COLORS = {"BLUE": ((25, 118, 210), (0, 20, 60)), "GREEN": ((0, 230, 118), (0, 45, 20))}  # (full, dim)
+
+@functools.lru_cache(maxsize=32)
+def led_glyph(ch, k):
+    """Mask ("1" image) of *ch* scaled k×, with one blank column of spacing."""
+    cols = LED_FONT.get(ch.upper(), LED_FONT[" "])
+    im = Image.new("1", (6, 7))
+    px = im.load()
+    for x, bits in enumerate(cols):
+        for y in range(7):
+            if bits >> y & 1:
+                px[x, y] = 1
+    return im.resize((6 * k, 7 * k), Image.NEAREST) if k > 1 else im
+
+
+class LedRenderer:
+    """Draws the essential board into an RGB frame of the panel's size.
+
+    Layout: clock across the top ~40 %, then one band per competitor with
+    the IOC code and the five bucket digits. The winner's band lights up in
+    its colour; a tie turns the clock yellow.
+    """
+    def __init__(self, size=LED_SIZE):
+        self.width, self.height = size
+        self.frame = Image.new("RGB", size)
+        self.draw = ImageDraw.Draw(self.frame)
+        w, h = size
+        self.top_h = int(h * 0.4)
+        self.row_h = (h - self.top_h) // 2
+        self.k_time = max(1, min((w - 2) // 30, (self.top_h - 2) // 8))
+        self.k_code = max(1, min((self.row_h - 2) // 8, w // 5 // 18))
+        self.code_w = 3 * 6 * self.k_code + 2
+        self.cell_w = (w - self.code_w) // SCORE_COUNT
+        self.k_digit = max(1, min(self.cell_w // 12, (self.row_h - 2) // 8))
+
+    def _text(self, text, k, x, y, fill):
+        for ch in text:
+            self.frame.paste(fill, (x, y), led_glyph(ch, k))
+            x += 6 * k
+
+    def _centered(self, text, k, box, fill):
+        x0, y0, x1, y1 = box
+        w, h = len(text) * 6 * k - k, 7 * k
+        self._text(text, k, x0 + (x1 - x0 - w) // 2, y0 + (y1 - y0 - h) // 2, fill)
+
+    def render(self, state):
+        """Full redraw from `LedOutput.state()`; frames are a few kB, so no dirty tracking."""
+        time_text, digits, codes, final = state
+        self.draw.rectangle((0, 0, self.width, self.height), fill=(0, 0, 0))
+        tie = final == ("TIE",)
+        winner = final[1] if final and final[0] == "WINNER" else ""
+        self._centered(time_text, self.k_time, (0, 0, self.width, self.top_h), (255, 224, 0) if tie else (255, 0, 0))
+        for n, side in enumerate(("BLUE", "GREEN")):
+            y0 = self.top_h + n * self.row_h
+            full, dim = LED_SIDE_COLORS[side]
+            lit = side == winner
+            self.draw.rectangle((0, y0, self.width - 1, y0 + self.row_h - 1), fill=full if lit else dim)
+            ink = (0, 0, 0) if lit else (255, 255, 255)
+            self._centered(codes[n][:3], self.k_code, (0, y0, self.code_w, y0 + self.row_h), ink if lit else full)
+            for i, value in enumerate(digits[n]):
+                x = self.code_w + i * self.cell_w
+                red = SCORE_LABELS[i] in ("D", "T") and not lit
+                self._centered(value, self.k_digit, (x, y0, x + self.cell_w, y0 + self.row_h),
+                               (255, 82, 82) if red else ink)
+        return self.frame.tobytes()
+
+
+class UdpLedTransport:
+    """Raw frames as LED_UDP_HEADER + whole RGB rows, split to stay under the MTU."""
+    def __init__(self, arg):
+        import socket
+        host, _, port = (arg or "").partition(":")
+        self.addr = (host or "127.0.0.1", int(port or LED_PORT))
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.frame_no = 0
+
+    def send(self, data, width, height):
+        self.frame_no = (self.frame_no + 1) & 0xFFFFFFFF
+        stride = width * 3
+        per = max(1, LED_UDP_PAYLOAD // stride)
+        for row in range(0, height, per):
+            rows = min(per, height - row)
+            self.sock.sendto(LED_UDP_HEADER.pack(LED_MAGIC, self.frame_no, row, rows, width, height) +
+                             data[row * stride:(row + rows) * stride], self.addr)
+
+    def close(self):
+        self.sock.close()
+
+
+class SerialLedTransport:
+    """LED_MAGIC, u16 width, u16 height, then the RGB frame, over a serial port
+    (`serial:PORT[@BAUD]`, needs pyserial)."""
+    def __init__(self, arg):
+        try:
+            import serial
+        except ImportError:
+            raise RuntimeError("serial LED output needs pyserial (pip install pyserial)")
+        port, _, baud = arg.partition("@")
+        self.port = serial.Serial(port, int(baud or 921600), write_timeout=1.0)
+
+    def send(self, data, width, height):
+        self.port.write(LED_MAGIC + struct.pack("<HH", width, height) + data)
+
+    def close(self):
+        self.port.close()
+
+
+LED_TRANSPORTS = {"udp": UdpLedTransport, "serial": SerialLedTransport}
+
+def make_led_transport(spec):
+    """`udp[:HOST[:PORT]]` or `serial:PORT[@BAUD]`; more kinds can be added to LED_TRANSPORTS."""
+    kind, _, arg = spec.partition(":")
+    try:
+        return LED_TRANSPORTS[kind.lower()](arg)
+    except KeyError:
+        raise ValueError(f"unknown LED output: {spec!r} (have: {', '.join(LED_TRANSPORTS)})")
+
+
+class LedOutput:
+    """Polls a scoreboard's view-model and streams changed frames to an LED panel."""
+    def __init__(self, board, spec, size=LED_SIZE, fps=LED_MAX_FPS):
+        self.board = board
+        self.period_ms = max(1, int(1000 / min(LED_MAX_FPS, max(1, int(fps)))))
+        self.renderer = LedRenderer(size)
+        self.transport = make_led_transport(spec)
+        self.stats = dict(frames=0, skipped=0, dropped=0, render_ms=0.0, send_ms=0.0)
+        self._last = None
+        self._q = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="LedOutput", daemon=True)
+        self._thread.start()
+        self._after_id = None
+        self._tick()
+
+    def state(self):
+        vm, cfg = self.board._view_model(), self.board.cfg
+        digits = tuple(tuple(vm[("digit", side, i)] for i in range(SCORE_COUNT)) for side in ("BLUE", "GREEN"))
+        return vm["time"], digits, (cfg.get("code1", ""), cfg.get("code2", "")), vm["final"]
+
+    def _tick(self):
+        state = self.state()
+        if state == self._last:
+            self.stats["skipped"] += 1
+        else:
+            self._last = state
+            start = time.perf_counter()
+            data = self.renderer.render(state)
+            self.stats["render_ms"] = (time.perf_counter() - start) * 1000.0
+            try:
+                self._q.put_nowait(data)
+            except queue.Full:
+                # The panel is slower than the board: replace the unsent frame with this one
+                try:
+                    self._q.get_nowait()
+                    self.stats["dropped"] += 1
+                except queue.Empty:
+                    pass
+                self._q.put_nowait(data)
+        self._after_id = self.board.after(self.period_ms, self._tick)
+
+    def _run(self):
+        w, h = self.renderer.width, self.renderer.height
+        while True:
+            data = self._q.get()
+            if data is None:
+                break
+            start = time.perf_counter()
+            try:
+                self.transport.send(data, w, h)
+                self.stats["frames"] += 1
+            except Exception:
+                self.stats["dropped"] += 1
+            self.stats["send_ms"] = (time.perf_counter() - start) * 1000.0
+
+    def close(self):
+        if self._after_id is not None:
+            try:
+                self.board.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        try:
+            self._q.get_nowait()
+        except queue.Empty:
+            pass
+        self._q.put(None)
+        self._thread.join(timeout=2.0)
+        self.transport.close()
+
+
+class LedLoopbackDevice:
+    """Stand-in panel: receives the UDP stream, reassembles frames and counts
+    complete / incomplete ones and throughput. `main.py --led-loopback [PORT]`."""
+    def __init__(self, port=LED_PORT, host="127.0.0.1"):
+        import socket
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.2)
+        self.stats = dict(frames=0, incomplete=0, bytes=0, packets=0)
+        self.last_frame = None  # (width, height, rgb bytes)
+        self._frame = None      # [frame no, width, height, rows received, buffer]
+
+    def _complete(self):
+        no, w, h, rows, buf = self._frame
+        if rows >= h:
+            self.stats["frames"] += 1
+            self.last_frame = (w, h, bytes(buf))
+        else:
+            self.stats["incomplete"] += 1
+
+    def receive(self, seconds):
+        """Process packets for *seconds*; returns self.stats."""
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            try:
+                pkt = self.sock.recv(65535)
+            except OSError:
+                continue
+            if len(pkt) < LED_UDP_HEADER.size:
+                continue
+            magic, no, row, rows, w, h = LED_UDP_HEADER.unpack_from(pkt)
+            if magic != LED_MAGIC:
+                continue
+            self.stats["packets"] += 1
+            self.stats["bytes"] += len(pkt)
+            if self._frame is None or self._frame[0] != no:
+                if self._frame is not None:
+                    self._complete()
+                self._frame = [no, w, h, 0, bytearray(w * h * 3)]
+            buf, stride = self._frame[4], w * 3
+            buf[row * stride:(row + rows) * stride] = pkt[LED_UDP_HEADER.size:]
+            self._frame[3] += rows
+            if self._frame[3] >= h:
+                self._complete()
+                self._frame = None
+        return self.stats
+
+    def snapshot(self, path):
+        """Save the last complete frame, scaled up 4× so the pixels are visible."""
+        if self.last_frame:
+            w, h, data = self.last_frame
+            Image.frombytes("RGB", (w, h), data).resize((w * 4, h * 4), Image.NEAREST).save(path)
+
+    def close(self):
+        self.sock.close()
+
+
+def run_led_loopback(port=LED_PORT, snapshot=None):
+    dev = LedLoopbackDevice(port)
+    print(f"LED loopback on udp 127.0.0.1:{port} (Ctrl+C to stop)")
+    prev = dict(dev.stats)
+    try:
+        while True:
+            s = dev.receive(1.0)
+            print(f"{s['frames'] - prev['frames']:>4} fps  {(s['bytes'] - prev['bytes']) / 1e3:>8.1f} kB/s  "
+                  f"total {s['frames']} frames, {s['incomplete']} incomplete", flush=True)
+            prev = dict(s)
+            if snapshot:
+                dev.snapshot(snapshot)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        dev.close()
+
+# ---------------- Metrics endpoint ----------------
+# `--metrics [[HOST:]PORT]` serves this scoreboard's health in Prometheus text
+# format (GET /metrics, default port METRICS_PORT_BASE + ring) so one scraper
+# can watch every ring PC once given a host (0.0.0.0:PORT; localhost only
+# otherwise). The board only bumps counters under a lock (key presses, frames,
+# relayouts, flag cache lookups, bout ends); a scrape runs on the http.server
+# thread and reads those plus process-wide values, never Tk.
+METRICS_PORT_BASE = 47900
+METRICS_LATENCY_WINDOW = 1024   # the quantiles cover the last N inputs
+METRICS_QUANTILES = (0.5, 0.9, 0.99)
+METRICS_RATE_WINDOW_S = 60.0
+
+def metrics_address(spec="", ring=1):
+    """'' → localhost on this ring's default port; 'PORT' or 'HOST:PORT' otherwise."""
+    host, _, port = (spec or "").rpartition(":")
+    return (host or "127.0.0.1", int(port) if port else METRICS_PORT_BASE + int(ring or 1))
+
+def _prom_value(v):
+    if isinstance(v, bool) or isinstance(v, int):
+        return str(int(v))
+    return "NaN" if v != v else repr(float(v))
+
+def _quantiles(values, qs):
+    values = sorted(values)
+    if not values:
+        return [float("nan")] * len(qs)
+    return [values[min(len(values) - 1, int(q * len(values)))] for q in qs]
+
+class BoardMetrics:
+    """Process-wide counters and the scrape endpoint (see board_metrics).
+
+    Counter methods are called from the Tk thread; render() from any thread.
+    `sources` holds the open board's own stats dicts (render_stats, export and
+    clock-sync stats), which are only read, as a copy."""
+
+    def __init__(self, address):
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        self.lock = threading.Lock()
+        self.wall0, self.mono0 = time.time(), time.monotonic()
+        self.ring = 1
+        self.sources = {}
+        self.relayouts = 0
+        self._relayout_at = deque(maxlen=4096)
+        self.cache_hits = self.cache_misses = 0
+        self.inputs = 0
+        self.last_input = None          # time.monotonic() of the last key press
+        self._latencies = deque(maxlen=METRICS_LATENCY_WINDOW)
+        self._pending_input = None      # perf_counter() of the first input not yet on screen
+        self.bouts = 0
+        self._bout_open = False
+        self.scrapes = 0
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(address, Handler)
+        self.server.daemon_threads = True
+        self.address = self.server.server_address
+        threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True).start()
+
+    # ----- Tk thread -----
+    def input(self):
+        now = time.perf_counter()
+        with self.lock:
+            self.inputs += 1
+            self.last_input = time.monotonic()
+            if self._pending_input is None:
+                self._pending_input = now
+
+    def frame(self):
+        """A frame was drawn (or an input changed nothing): the pending input is on screen."""
+        if self._pending_input is None:
+            return
+        now = time.perf_counter()
+        with self.lock:
+            if self._pending_input is not None:
+                self._latencies.append(now - self._pending_input)
+                self._pending_input = None
+
+    def relayout(self):
+        with self.lock:
+            self.relayouts += 1
+            self._relayout_at.append(time.monotonic())
+
+    def cache(self, hit):
+        with self.lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def event(self, kind, t, data):
+        """MatchCore on_event tap: counts each bout once, however often its decision is amended."""
+        if kind == "load":
+            self._bout_open = True
+        elif kind == "end" and self._bout_open:
+            self._bout_open = False
+            with self.lock:
+                self.bouts += 1
+
+    # ----- any thread -----
+    def render(self):
+        now = time.monotonic()
+        with self.lock:
+            self.scrapes += 1
+            lat = list(self._latencies)
+            recent = sum(1 for t in self._relayout_at if now - t <= METRICS_RATE_WINDOW_S)
+            values = dict(relayouts=self.relayouts, hits=self.cache_hits, misses=self.cache_misses,
+                          inputs=self.inputs, last_input=self.last_input, bouts=self.bouts,
+                          scrapes=self.scrapes)
+            sources = {k: dict(v) for k, v in self.sources.items() if v is not None}
+        lookups = values["hits"] + values["misses"]
+        labels = f'{{ring="{self.ring}"}}'
+        out = []
+
+        def metric(name, kind, help_, value):
+            out.append(f"# HELP kurash_{name} {help_}")
+            out.append(f"# TYPE kurash_{name} {kind}")
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    out.append(f'kurash_{name}{{ring="{self.ring}",{k}}} {_prom_value(v)}')
+            else:
+                out.append(f"kurash_{name}{labels} {_prom_value(value)}")
+
+        elapsed = now - self.mono0
+        metric("uptime_seconds", "gauge", "Seconds since the metrics endpoint started.", elapsed)
+        metric("clock_drift_seconds", "gauge",
+               "Wall clock minus monotonic clock elapsed since start (NTP steps, slews, manual changes).",
+               (time.time() - self.wall0) - elapsed)
+        sync = sources.get("sync")
+        if sync:
+            metric("clock_sync_synced", "gauge", "1 while following the ring time authority.", int(sync["synced"]))
+            metric("clock_sync_offset_seconds", "gauge", "Estimated offset to the time authority.",
+                   sync["offset_ms"] / 1000)
+            metric("clock_sync_error_seconds", "gauge", "Error bound of the authority offset (NaN: no reply yet).",
+                   sync["error_ms"] / 1000 if sync["error_ms"] is not None else float("nan"))
+        metric("relayouts_total", "counter", "Scale/layout passes (resize, zoom, fullscreen).", values["relayouts"])
+        metric("relayouts_per_minute", "gauge", "Relayouts over the last minute.", recent * 60.0 / METRICS_RATE_WINDOW_S)
+        metric("flag_cache_lookups_total", "counter", "Flag image cache lookups by result.",
+               {'result="hit"': values["hits"], 'result="miss"': values["misses"]})
+        metric("flag_cache_hit_ratio", "gauge", "Flag image cache hits / lookups.",
+               values["hits"] / lookups if lookups else float("nan"))
+        metric("input_latency_seconds", "summary", "Key press to the frame showing it, last "
+               f"{METRICS_LATENCY_WINDOW} inputs.",
+               {f'quantile="{q}"': v for q, v in zip(METRICS_QUANTILES, _quantiles(lat, METRICS_QUANTILES))})
+        out.append(f"kurash_input_latency_seconds_sum{labels} {_prom_value(sum(lat))}")
+        out.append(f"kurash_input_latency_seconds_count{labels} {len(lat)}")
+        metric("inputs_total", "counter", "Operator key presses.", values["inputs"])
+        metric("seconds_since_last_input", "gauge", "Seconds since the last key press (NaN: none yet).",
+               now - values["last_input"] if values["last_input"] is not None else float("nan"))
+        metric("bouts_completed_total", "counter", "Bouts decided (winner or tie).", values["bouts"])
+        metric("resident_memory_bytes", "gauge", "Resident set size of the scoreboard process.",
+               process_rss_bytes())
+        render = sources.get("render")
+        if render:
+            metric("frames_total", "counter", "Board frames rendered.", render["frames"])
+            metric("frames_skipped_total", "counter", "Frame slots missed while the Tk thread was busy.",
+                   render["skipped"])
+            metric("frame_seconds_max", "gauge", "Slowest frame render.", render["max_ms"] / 1000)
+        export = sources.get("export")
+        if export:
+            metric("export_queue_depth", "gauge", "Bouts/events waiting for the export writer.", export["depth"])
+            metric("export_overflow", "gauge", "Of those, held in memory beyond the bounded queue.",
+                   export["overflow"])
+            metric("export_errors_total", "counter", "Export write errors.", export["errors"])
+        metric("metrics_scrapes_total", "counter", "Scrapes served.", values["scrapes"])
+        return "\n".join(out) + "\n"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+_BOARD_METRICS = None
+
+def board_metrics(spec="", ring=1):
+    """The process-wide endpoint (started on first use; a reopened board keeps counting)."""
+    global _BOARD_METRICS
+    if _BOARD_METRICS is None:
+        _BOARD_METRICS = BoardMetrics(metrics_address(spec, ring))
+    _BOARD_METRICS.ring = int(ring or 1)
+    return _BOARD_METRICS
+
+# ---------------- Soak test ----------------
+# `--soak N` plays N synthetic bouts back to back in one scoreboard (scores,
+# penalties, timeouts, HALOL / time-up / tie endings, New Match reload) and reports resident memory, Tk
+# object counts and tracemalloc growth so leaks show up before a 300-bout day.
+SOAK_REPORT_EVERY = 25
+
+def process_rss_bytes():
+    """Resident set size of this process in bytes (0 if unavailable)."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            class PMC(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+            pmc = PMC(); pmc.cb = ctypes.sizeof(PMC)
+            get_info = ctypes.windll.psapi.GetProcessMemoryInfo
+            if get_info(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(pmc), pmc.cb):
+                return int(pmc.WorkingSetSize)
+            return 0
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        try:
+            import resource  # macOS: peak only, still useful as an upper bound
+            return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        except Exception:
+            return 0
+
+def tk_object_counts(root):
+    """Live widgets, images, named fonts and pending after() callbacks in this interpreter."""
+    def count(w):
+        return 1 + sum(count(c) for c in w.winfo_children())
+    return dict(
+        widgets=count(root),
+        images=len(root.image_names()),
+        fonts=len(tkfont.names(root)),
+        afters=len(root.tk.splitlist(root.tk.call("after", "info"))),
+    )
+
+def _play_synthetic_match(board, rng):
+    core = board.core
+    sides = ("BLUE", "GREEN")
+    scoring = [LABEL_TO_INDEX[l] for l in ("Y", "C", "D", "T")]
+    for _ in range(rng.randint(3, 12)):
+        if core.match_over or core.auto_deciding:
+            break
+        side = rng.choice(sides)
+        core.delta(side, rng.choice(scoring), rng.choice((1, 1, 1, -1)))
+        if rng.random() < 0.08:
+            core.timeout(side)
+        core.time_left = max(1, core.time_left - rng.randint(5, 40))
+        board._invalidate()
+        board.update()
+    if not core.match_over and not core.auto_deciding:
+        if rng.random() < 0.2:
+            core.halol(rng.choice(sides))
+        else:
+            core.time_left = 0
+            core._handle_time_expired()
+    if core.auto_deciding:
+        core._apply_pending_auto_winner()
+    board.update()
+
+def run_soak(matches, seed=0, options=None):
+    import random, tracemalloc, gc
+    rng = random.Random(seed)
+    root = ConfigWindow(options=options)
+    root.withdraw()
+    codes = [c for _, c in COUNTRIES]
+    tracemalloc.start()
+    warmup = max(1, matches // 10)
+    base = None
+    print(f"{'match':>6} {'rss MB':>8} {'py MB':>7} {'widgets':>8} {'images':>7} {'fonts':>6} {'afters':>7}")
+
+    def sample(i):
+        gc.collect()
+        root.update()
+        py_now, _ = tracemalloc.get_traced_memory()
+        row = dict(rss=process_rss_bytes(), py=py_now, **tk_object_counts(root))
+        print(f"{i:>6} {row['rss']/1e6:>8.1f} {row['py']/1e6:>7.2f} {row['widgets']:>8} "
+              f"{row['images']:>7} {row['fonts']:>6} {row['afters']:>7}")
+        return row
+
+    for i in range(1, matches + 1):
+        cfg = dict(root.options, show_flags=True, show_names=True, fullscreen=False, mute=True,
+                   code1=rng.choice(codes), code2=rng.choice(codes),
+                   name1=f"Blue {i}", name2=f"Green {i}", event_left=f"Soak bout {i}",
+                   gender="Men", weight=rng.choice(WEIGHTS), ring=1, mm=5, ss=0)
+        if i == 1:
+            board = ScoreboardWindow(root, cfg)
+        else:
+            board.reload(cfg)  # the "New Match" path
+        board.update()
+        _play_synthetic_match(board, rng)
+        if i == warmup:
+            base = (sample(i), tracemalloc.take_snapshot())
+            end = base[0]
+        elif i % SOAK_REPORT_EVERY == 0 or i == matches:
+            end = sample(i)
+
+    first, snap0 = base
+    print(f"\nafter warm-up ({warmup} bouts) → {matches} bouts:")
+    print(f"  rss     {(end['rss'] - first['rss'])/1e6:+.2f} MB")
+    print(f"  python  {(end['py'] - first['py'])/1e6:+.3f} MB (tracemalloc)")
+    for key in ("widgets", "images", "fonts", "afters"):
+        print(f"  {key:<7} {end[key] - first[key]:+d}")
+    print("  top allocation growth:")
+    for stat in tracemalloc.take_snapshot().compare_to(snap0, "lineno")[:8]:
+        print(f"    {stat}")
+    tracemalloc.stop()
+    board._close()
+    root.destroy()
+
+# ---------------- Scenarios ----------------
+# `--scenarios` replays scripted bouts against MatchCore on virtual time, so a
+# 5-minute bout (JAZZO, auto-decision delay, ...) checks in milliseconds and
+# gives the same result on every run. Steps:
+#   ("bout", "M:SS")              reload with this bout time (default 5:00)
+#   ("start",) / ("pause",)       Space
+#   ("until", "M:SS")             run the clock until it shows M:SS (or stops)
+#   ("wait", seconds)             advance virtual time
+#   ("score", side, label, ±n)    bucket +/- (keyboard / click)
+#   ("timeout", side) ("halol", side) ("winner", side) ("resume",) ("reset",)
+#   ("expect", field, value)      field: time, jazzo, running, over, deciding,
+#                                 winner, reason, tie, blue, green ({label: n})
+SCENARIO_CFG = dict(name1="Blue", name2="Green", code1="UZB", code2="KAZ", mm=5, ss=0)
+
+SCENARIOS = {
+    "jazzo-resume-late-y": [
+        ("start",), ("until", "2:30"),
+        ("expect", "jazzo", True), ("expect", "running", False), ("expect", "time", "2:30"),
+        ("resume",), ("until", "0:01"), ("score", "BLUE", "Y", 1),
+        ("wait", 1), ("expect", "deciding", True), ("expect", "over", False),
+        ("wait", 5), ("expect", "over", True), ("expect", "winner", "BLUE"),
+        ("expect", "reason", "POINT ADVANTAGE"),
+    ],
+    "two-y": [
+        ("start",), ("wait", 10), ("score", "GREEN", "Y", 1), ("score", "GREEN", "Y", 1),
+        ("expect", "over", True), ("expect", "running", False), ("expect", "winner", "GREEN"),
+        ("expect", "reason", "POINT ADVANTAGE"), ("expect", "time", "4:50"),
+    ],
+    "halol": [
+        ("start",), ("wait", 20), ("halol", "GREEN"),
+        ("expect", "over", True), ("expect", "winner", "GREEN"), ("expect", "reason", "HALOL"),
+        ("wait", 10), ("expect", "time", "4:40"),
+    ],
+    "draw-by-last-c": [
+        ("start",), ("wait", 30), ("score", "BLUE", "C", 1), ("wait", 30), ("score", "GREEN", "C", 1),
+        ("until", "0:00"), ("expect", "deciding", True),
+        ("wait", 5), ("expect", "winner", "GREEN"), ("expect", "reason", 'Last "C" score'),
+    ],
+    "penalties-mirror": [
+        ("start",), ("wait", 5), ("score", "GREEN", "T", 1),
+        ("expect", "blue", {"C": 1}), ("expect", "green", {"T": 1}),
+        ("score", "GREEN", "D", 1),
+        ("expect", "blue", {"Y": 1, "C": 0}), ("expect", "green", {"T": 0, "D": 1}),
+        ("until", "0:00"), ("wait", 5), ("expect", "winner", "BLUE"),
+    ],
+    "third-timeout-loses": [
+        ("timeout", "BLUE"), ("timeout", "BLUE"), ("expect", "deciding", False),
+        ("timeout", "BLUE"), ("expect", "deciding", True),
+        ("wait", 4.9), ("expect", "over", False),
+        ("wait", 0.1), ("expect", "winner", "GREEN"), ("expect", "reason", "Time out"),
+    ],
+    "override-auto-decision": [
+        ("bout", "1:00"), ("start",), ("wait", 10), ("score", "BLUE", "G", 1),
+        ("expect", "deciding", True), ("winner", "BLUE"),
+        ("expect", "over", True), ("expect", "winner", "BLUE"),
+        ("wait", 10), ("expect", "winner", "BLUE"),
+    ],
+    "tie": [
+        ("start",), ("until", "2:30"), ("resume",), ("until", "0:00"),
+        ("expect", "tie", True), ("expect", "over", True), ("expect", "running", False),
+        ("reset",), ("expect", "tie", False), ("expect", "time", "5:00"),
+    ],
+}
+
+def _clock(text):
+    m, s = str(text).split(":")
+    return int(m) * 60 + int(s)
+
+def _scenario_field(core, field):
+    if field == "time":
+        m, s = divmod(max(0, core.time_left), 60)
+        return f"{m}:{s:02d}"
+    if field in ("blue", "green"):
+        return dict(zip(SCORE_LABELS, getattr(core, field)))
+    return {"jazzo": core.jaza_active, "running": core.running, "over": core.match_over,
+            "deciding": core.auto_deciding, "winner": core.winner, "reason": core.final_reason,
+            "tie": core.final == ("TIE",)}[field]
+
+def run_scenario(steps, cfg=None):
+    """Play *steps* on virtual time. Returns (virtual seconds, failure message or "")."""
+    sched = VirtualScheduler()
+    core = MatchCore(dict(cfg or SCENARIO_CFG), sched)
+    for n, (op, *args) in enumerate(steps, 1):
+        if op == "bout":
+            mm, ss = divmod(_clock(args[0]), 60)
+            core.load(dict(core.cfg, mm=mm, ss=ss))
+        elif op == "start":
+            if not core.running: core.toggle_timer()
+        elif op == "pause":
+            if core.running: core.toggle_timer()
+        elif op == "until":
+            target = _clock(args[0])
+            while core.running and core.time_left > target:
+                sched.advance(1)
+        elif op == "wait":
+            sched.advance(float(args[0]))
+        elif op == "score":
+            side, label, d = args
+            core.delta(side, LABEL_TO_INDEX[label], int(d))
+        elif op == "timeout":
+            core.timeout(args[0])
+        elif op == "halol":
+            core.halol(args[0])
+        elif op == "winner":
+            core.show_winner(args[0])
+        elif op == "resume":
+            core.resume_from_jaza()
+        elif op == "reset":
+            core.reset_all()
+        elif op == "expect":
+            field, want = args
+            got = _scenario_field(core, field)
+            if isinstance(want, dict):
+                got = {k: got[k] for k in want}
+            if got != want:
+                return sched.now(), f"step {n} {field}: expected {want!r}, got {got!r}"
+        else:
+            raise ValueError(f"step {n}: unknown scenario op {op!r}")
+    return sched.now(), ""
+
+def run_scenarios(names=None, path=None, repeat=1):
+    """Run built-in (and file) scenarios; prints one line each, returns True when all pass."""
+    scenarios = dict(SCENARIOS)
+    if path:
+        with open(path, encoding="utf-8") as fh:
+            scenarios.update(json.load(fh))
+    names = names or list(scenarios)
+    unknown = [n for n in names if n not in scenarios]
+    if unknown:
+        raise SystemExit(f"unknown scenario(s): {', '.join(unknown)}")
+    ok = True
+    total_virtual = total_wall = 0.0
+    for name in names:
+        start = time.perf_counter()
+        for _ in range(max(1, repeat)):
+            virtual, error = run_scenario(scenarios[name])
+            if error:
+                break
+        wall = time.perf_counter() - start
+        runs = max(1, repeat)
+        total_virtual += virtual * runs; total_wall += wall
+        ok = ok and not error
+        print(f"{'FAIL' if error else 'ok  '} {name:<26} {virtual:7.1f} s virtual  "
+              f"{wall / runs * 1000:8.3f} ms wall" + (f"  {error}" if error else ""))
+    if total_wall > 0:
+        print(f"{len(names)} scenario(s), {total_virtual:.0f} s of bout time in {total_wall:.3f} s "
+              f"(×{total_virtual / total_wall:,.0f})")
+    return ok
+
+# ---------------- Result cards ----------------
+# `--result-cards RESULTS.jsonl` turns stored bout summaries (`--analytics`)
+# into PNG result cards (social media, same look as the final winner screen)
+# and printable bout sheets. Flags are decoded and resized once in the parent
+# and handed to every pool worker through the initializer; the workers only
+# draw and encode.
+CARD_SIZE = (1080, 1080)
+SHEET_SIZE = (1240, 1754)  # A4 at 150 dpi
+CARD_FLAG = (216, 144)
+SHEET_FLAG = (120, 80)
+CARDS_DIR = "cards"
+
+_card_flags = {}  # (code, (w, h)) -> RGBA image, per worker process
+
+def _card_worker_init(flags):
+    _card_flags.clear()
+    for key, (mode, size, data) in flags.items():
+        _card_flags[key] = Image.frombytes(mode, size, data)
+
+def prepare_card_flags(codes):
+    """Flags resized for cards and sheets, as picklable (mode, size, bytes)."""
+    out = {}
+    for code in sorted(set(codes)):
+        src = FLAGS.image(code)
+        if src is None:
+            continue
+        for box in (CARD_FLAG, SHEET_FLAG):
+            im = src.convert("RGBA").resize(box, RESAMPLE)
+            out[(code, box)] = (im.mode, im.size, im.tobytes())
+    return out
+
+def load_results(path):
+    """Bout summaries from a JSONL file; an "amended" record replaces the earlier
+    record of the same (session, ring, bout), wherever it is in the file."""
+    results, index = [], {}
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            key = (rec.get("session"), rec.get("ring"), rec.get("bout"))
+            if rec.get("amended") and key in index:
+                results[index[key]] = rec
+            else:
+                index[key] = len(results)
+                results.append(rec)
+    return results
+
+def _fit(draw, text, size, max_w, bold=True):
+    font = pil_font(size, bold)
+    while text and font.size > 10 and draw.textlength(text, font=font) > max_w:
+        font = pil_font(int(font.size * 0.9), bold)
+    return font
+
+def _paste_flag(im, code, box, xy):
+    flag = _card_flags.get((code.upper(), box))
+    if flag is not None:
+        im.paste(flag, xy, flag)
+        return True
+    return False
+
+def _bucket_table(draw, rec, x0, y0, x1, row_h, fg, line=None, highlight=None):
+    """Header row of bucket letters, then one row per side."""
+    cols = len(SCORE_LABELS)
+    label_w = (x1 - x0) // 4
+    cw = (x1 - x0 - label_w) // cols
+    head = pil_font(int(row_h * 0.5))
+    digit = pil_font(int(row_h * 0.62))
+    for i, label in enumerate(SCORE_LABELS):
+        cx = x0 + label_w + cw * i + cw // 2
+        draw.text((cx, y0 + row_h // 2), label, font=head, anchor="mm", fill=LABEL_COLORS.get(label, fg))
+    buckets = rec.get("buckets", {})
+    codes = rec.get("codes", ["", ""])
+    for r, side in enumerate(("BLUE", "GREEN")):
+        y = y0 + row_h * (r + 1)
+        if highlight and highlight.get(side):
+            draw.rectangle((x0, y, x1, y + row_h), fill=highlight[side])
+        if line:
+            draw.line((x0, y, x1, y), fill=line, width=2)
+        draw.rectangle((x0, y + 8, x0 + 12, y + row_h - 8), fill=SIDE_COLORS[side][0])
+        draw.text((x0 + 28, y + row_h // 2), codes[r], font=head, anchor="lm", fill=fg)
+        for i, label in enumerate(SCORE_LABELS):
+            cx = x0 + label_w + cw * i + cw // 2
+            draw.text((cx, y + row_h // 2), str(buckets.get(side, {}).get(label, 0)), font=digit, anchor="mm",
+                      fill=LABEL_COLORS.get(label, fg))
+    if line:
+        draw.line((x0, y0 + row_h * 3, x1, y0 + row_h * 3), fill=line, width=2)
+
+def render_result_card(rec):
+    w, h = CARD_SIZE
+    names, codes = rec.get("names", ["", ""]), rec.get("codes", ["", ""])
+    winner = rec.get("winner") if rec.get("winner") in SIDE_COLORS else ""
+    if winner:
+        bg, fg = SIDE_COLORS[winner]
+        i = 0 if winner == "BLUE" else 1
+        title, name, code = "WINNER", names[i] or IOC_NAMES.get(codes[i].upper(), ""), codes[i]
+    else:
+        bg, fg, title, name, code = "black", "#ffe000", "TIME UP - TIE", "", ""
+    im = Image.new("RGB", (w, h), bg)
+    draw = ImageDraw.Draw(im)
+    draw.text((w // 2, 110), title, font=_fit(draw, title, 88, w - 100), anchor="mm", fill=fg)
+    if winner:
+        draw.text((w // 2, 260), name, font=_fit(draw, name, 96, w - 100), anchor="mm", fill=fg)
+        font = pil_font(110)
+        code_w = draw.textlength(code, font=font)
+        fw = CARD_FLAG[0] + 32 if (code.upper(), CARD_FLAG) in _card_flags else 0
+        x = int((w - fw - code_w) // 2)
+        if fw:
+            _paste_flag(im, code, CARD_FLAG, (x, 420 - CARD_FLAG[1] // 2))
+        draw.text((x + fw, 420), code, font=font, anchor="lm", fill=fg)
+        reason = final_reason_text(rec.get("reason", ""))
+        if reason:
+            draw.text((w // 2, 575), reason, font=_fit(draw, reason, 64, w - 100), anchor="mm", fill=fg)
+    else:
+        for r, y in ((0, 300), (1, 440)):
+            text = f"{names[r] or IOC_NAMES.get(codes[r].upper(), '')} ({codes[r]})"
+            draw.text((w // 2, y), text, font=_fit(draw, text, 64, w - 100), anchor="mm", fill="#cccccc")
+    draw.rectangle((40, 650, w - 40, 990), fill="#111111")
+    _bucket_table(draw, rec, 70, 660, w - 70, 105, "white",
+                  highlight={winner: "#222222"} if winner else None)
+    foot = "   ".join(t for t in (rec.get("event", ""), rec.get("weight", "")) if t)
+    if foot:
+        draw.text((w // 2, 1035), foot, font=_fit(draw, foot, 36, w - 100, bold=False), anchor="mm", fill=fg)
+    return im
+
+def render_bout_sheet(rec):
+    w, h = SHEET_SIZE
+    im = Image.new("RGB", (w, h), "white")
+    draw = ImageDraw.Draw(im)
+    ink, grey, m = "black", "#777777", 90
+    names, codes = rec.get("names", ["", ""]), rec.get("codes", ["", ""])
+    draw.text((m, m), rec.get("event", "") or "Bout sheet", font=_fit(draw, rec.get("event", "") or "Bout sheet", 52, w - 2 * m), fill=ink)
+    draw.text((m, m + 75), f"Bout {rec.get('bout', '')}   {rec.get('weight', '')}   "
+                           f"{rec.get('bout_s', 0) // 60}:{rec.get('bout_s', 0) % 60:02d}",
+              font=pil_font(30, False), fill=grey)
+    y = m + 150
+    for r, side in enumerate(("BLUE", "GREEN")):
+        draw.rectangle((m, y, m + 16, y + SHEET_FLAG[1]), fill=SIDE_COLORS[side][0])
+        x = m + 36
+        if _paste_flag(im, codes[r], SHEET_FLAG, (x, y)):
+            draw.rectangle((x, y, x + SHEET_FLAG[0] - 1, y + SHEET_FLAG[1] - 1), outline="#cccccc")
+            x += SHEET_FLAG[0] + 24
+        draw.text((x, y + 4), codes[r], font=pil_font(44), fill=ink)
+        draw.text((x, y + 56), names[r] or IOC_NAMES.get(codes[r].upper(), ""), font=pil_font(28, False), fill=grey)
+        y += SHEET_FLAG[1] + 30
+    y += 20
+    _bucket_table(draw, rec, m, y, w - m, 80, ink, line="#cccccc")
+    y += 80 * 3 + 50
+
+    winner = rec.get("winner") if rec.get("winner") in SIDE_COLORS else ""
+    if winner:
+        i = 0 if winner == "BLUE" else 1
+        result = f"Winner: {codes[i]} {names[i]}".strip()
+    else:
+        result = "Result: TIE"
+    draw.text((m, y), result, font=_fit(draw, result, 44, w - 2 * m), fill=ink)
+    reason = final_reason_text(rec.get("reason", ""))
+    el = rec.get("elapsed_s", 0)
+    draw.text((m, y + 60), f"{reason}   (after {el // 60}:{el % 60:02d})".strip(), font=pil_font(30, False), fill=grey)
+    y += 140
+
+    small = pil_font(26, False)
+    lines = []
+    fs = rec.get("first_score")
+    if fs:
+        lines.append(f"First score: {fs['side']} {fs['label']} at {fs['t'] // 60}:{fs['t'] % 60:02d}")
+    rate = rec.get("rate_per_min", {})
+    lead = rec.get("lead_s", {})
+    if rate:
+        lines.append(f"Scores / min: BLUE {rate.get('BLUE', 0)}   GREEN {rate.get('GREEN', 0)}")
+    if lead:
+        lines.append(f"Time leading: BLUE {lead.get('BLUE', 0)} s   GREEN {lead.get('GREEN', 0)} s   "
+                     f"level {lead.get('level', 0)} s   lead changes: {rec.get('lead_changes', 0)}")
+    jz = rec.get("jazzo")
+    if jz:
+        after = jz.get("first_score_after_s")
+        lines.append(f"JAZZO at {jz['at'] // 60}:{jz['at'] % 60:02d}; first score after resume: "
+                     + ("none" if after is None else f"{after} s"))
+    timeline = sorted([(t, f"{side} {label}") for t, side, label in rec.get("penalties", [])] +
+                      [(t, f"{side} time out") for t, side in rec.get("timeouts", [])])
+    if timeline:
+        lines.append("Penalties / time outs:")
+    for t, text in timeline:
+        lines.append(f"  {t // 60}:{t % 60:02d}  {text}")
+    for text in lines:
+        if y > h - 260:
+            break
+        draw.text((m, y), text, font=small, fill=ink)
+        y += 38
+
+    for i, label in enumerate(("Referee", "Judge", "Secretary")):
+        x = m + i * (w - 2 * m) // 3
+        draw.line((x, h - 140, x + (w - 2 * m) // 3 - 40, h - 140), fill=ink, width=2)
+        draw.text((x, h - 125), label, font=small, fill=grey)
+    return im
+
+def _render_result_job(job):
+    kind, rec, path = job
+    im = render_result_card(rec) if kind == "card" else render_bout_sheet(rec)
+    im.save(path, optimize=False, compress_level=3)
+    return path
+
+def render_results(path, out_dir=CARDS_DIR, kinds=("card", "sheet"), jobs=None):
+    """Render every stored bout of *path* into *out_dir* on a process pool."""
+    from concurrent.futures import ProcessPoolExecutor
+    results = load_results(path)
+    os.makedirs(out_dir, exist_ok=True)
+    work = []
+    for n, rec in enumerate(results, 1):
+        stem = "-".join(c for c in rec.get("codes", []) if c) or "bout"
+        for kind in kinds:
+            work.append((kind, rec, os.path.join(out_dir, f"{n:04d}_{stem}_{kind}.png")))
+    start = time.perf_counter()
+    flags = prepare_card_flags(c.upper() for rec in results for c in rec.get("codes", []) if c)
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(work) or 1))
+    with ProcessPoolExecutor(workers, initializer=_card_worker_init, initargs=(flags,)) as pool:
+        done = list(pool.map(_render_result_job, work, chunksize=max(1, len(work) // (workers * 4))))
+    print(f"{len(done)} image(s) from {len(results)} bout(s) → {out_dir} "
+          f"in {time.perf_counter() - start:.2f} s on {workers} process(es)")
+    return done
+
+# ---------------- Rule re-evaluation ----------------
+# For the rules committee: how would past results change under variants of the
+# time-up decision (MatchCore._winner_by_point_advantage, then
+# _resolve_draw_by_last_event)? Final states from --analytics / --export files
+# are packed into NumPy arrays and every variant is evaluated for all bouts at
+# once. The "current" variant must reproduce the board's own decisions exactly;
+# --reevaluate-check plays random bouts through MatchCore to prove it.
+# NumPy is only needed for these tool modes.
+RULE_VARIANTS = {
+    # advantage: "lexi" = Y outranks any number of C, "weighted" = compare 2·Y + C
+    # direct_c: equal Y and C → more direct (non-penalty) C wins
+    # last_event: still level → the later of the last C/Y score and the last D/T penalty decides
+    "current":        dict(advantage="lexi", direct_c=True, last_event=True),
+    "no-direct-c":    dict(advantage="lexi", direct_c=False, last_event=True),
+    "y-equals-2c":    dict(advantage="weighted", direct_c=True, last_event=True),
+    "no-last-event":  dict(advantage="lexi", direct_c=True, last_event=False),
+}
+# Outcome codes: winner 0 = tie, 1 = BLUE, 2 = GREEN; reasons as MatchCore words them
+RULE_SIDES = ("", "BLUE", "GREEN")
+RULE_REASONS = ("", "POINT ADVANTAGE", 'Last "Y" score', 'Last "C" score')
+TIME_UP_REASONS = set(RULE_REASONS[1:])
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise SystemExit("rule re-evaluation needs NumPy (pip install numpy)")
+    return numpy
+
+def rule_arrays(records):
+    """Column arrays of the final states the time-up rules look at."""
+    np = _numpy()
+    n = len(records)
+    a = {k: np.zeros(n, dtype=np.int32) for k in ("by", "bc", "gy", "gc", "bdc", "gdc", "cy_side", "cy_y",
+                                                   "cy_seq", "dt_side", "dt_d", "dt_seq", "winner", "reason")}
+    a["decided_at_time_up"] = np.zeros(n, dtype=bool)
+    side_no = {"BLUE": 1, "GREEN": 2}
+    for i, rec in enumerate(records):
+        b, g = rec["buckets"]["BLUE"], rec["buckets"]["GREEN"]
+        a["by"][i], a["bc"][i], a["gy"][i], a["gc"][i] = b["Y"], b["C"], g["Y"], g["C"]
+        dc = rec.get("direct_c") or {}
+        a["bdc"][i], a["gdc"][i] = dc.get("BLUE", 0), dc.get("GREEN", 0)
+        last = rec.get("last_events") or {}
+        if last.get("cy"):
+            side, label, seq = last["cy"]
+            a["cy_side"][i], a["cy_y"][i], a["cy_seq"][i] = side_no[side], label == "Y", seq
+        if last.get("dt"):
+            side, label, seq = last["dt"]
+            a["dt_side"][i], a["dt_d"][i], a["dt_seq"][i] = side_no[side], label == "D", seq
+        a["winner"][i] = 0 if rec.get("tie") else side_no.get(rec.get("winner"), 0)
+        reason = rec.get("reason") or ""
+        a["reason"][i] = RULE_REASONS.index(reason) if reason in TIME_UP_REASONS else 0
+        # Only bouts whose clock ran out went through the time-up rules (HALOL, G
+        # penalty, 2×Y, time-outs did not; an operator pick has another reason).
+        # Files written before "time_up" was recorded: best guess from the reason
+        # (which also counts early 2×Y ends)
+        ruled = bool(rec.get("tie")) or reason in TIME_UP_REASONS
+        a["decided_at_time_up"][i] = ruled and rec.get("time_up", True)
+    return a
+
+def evaluate_rules(a, variant):
+    """(winner, reason) code arrays for every bout under *variant* (see RULE_VARIANTS)."""
+    np = _numpy()
+    v = RULE_VARIANTS[variant] if isinstance(variant, str) else variant
+    by, bc, gy, gc = a["by"], a["bc"], a["gy"], a["gc"]
+    if v["advantage"] == "weighted":
+        diff = np.sign((2 * by + bc) - (2 * gy + gc))
+    else:
+        diff = np.where(by != gy, np.sign(by - gy), np.sign(bc - gc))
+    if v["direct_c"]:
+        level = (diff == 0) & ((bc > 0) | (gc > 0))
+        diff = np.where(level, np.sign(a["bdc"] - a["gdc"]), diff)
+    winner = np.where(diff > 0, 1, np.where(diff < 0, 2, 0)).astype(np.int32)
+    reason = np.where(winner > 0, 1, 0).astype(np.int32)
+
+    draw = winner == 0
+    if v["last_event"]:
+        has_cy = a["cy_side"] > 0
+        use_dt = (a["dt_side"] > 0) & (~has_cy | (a["dt_seq"] > a["cy_seq"]))
+        use_cy = has_cy & ~use_dt
+        # A score wins for its scorer; a penalty wins for the opponent (D → "Y", T → "C")
+        ev_winner = np.where(use_cy, a["cy_side"], np.where(use_dt, 3 - a["dt_side"], 0))
+        ev_reason = np.where(use_cy, np.where(a["cy_y"] == 1, 2, 3),
+                             np.where(use_dt, np.where(a["dt_d"] == 1, 2, 3), 0))
+        winner = np.where(draw, ev_winner, winner)
+        reason = np.where(draw, ev_reason, reason)
+    return winner, reason
+
+def reevaluate(records, variants=None, show=5):
+    """Report how each variant changes the time-up decisions; False if "current"
+    does not reproduce the recorded ones."""
+    np = _numpy()
+    t0 = time.perf_counter()
+    a = rule_arrays(records)
+    t1 = time.perf_counter()
+    mask = a["decided_at_time_up"]
+    n, shared = len(records), int(mask.sum())
+    base_w, base_r = evaluate_rules(a, "current")
+    bad = mask & ((base_w != a["winner"]) | (base_r != a["reason"]))
+    print(f"{n} bouts, {shared} decided by the time-up rules "
+          f"(loaded in {t1 - t0:.2f} s)")
+    print(f"current rules reproduce {shared - int(bad.sum())}/{shared} recorded decisions")
+    for i in np.flatnonzero(bad)[:show]:
+        rec = records[i]
+        print(f"  MISMATCH bout {rec.get('bout')}: recorded {rec.get('winner') or 'tie'} {rec.get('reason')!r}, "
+              f"rules give {RULE_SIDES[base_w[i]] or 'tie'} {RULE_REASONS[base_r[i]]!r}")
+    print(f"\n{'variant':<16} {'changed':>8} {'flipped':>8} {'→ tie':>7} {'tie →':>7} {'reason':>7} {'ms':>7}")
+    for name in variants or RULE_VARIANTS:
+        t = time.perf_counter()
+        w, r = evaluate_rules(a, name)
+        ms = (time.perf_counter() - t) * 1000
+        w_changed = mask & (w != base_w)
+        flipped = w_changed & (w > 0) & (base_w > 0)
+        to_tie = w_changed & (w == 0)
+        from_tie = w_changed & (base_w == 0)
+        reason_only = mask & ~w_changed & (r != base_r)
+        print(f"{name:<16} {int(w_changed.sum()):>8} {int(flipped.sum()):>8} {int(to_tie.sum()):>7} "
+              f"{int(from_tie.sum()):>7} {int(reason_only.sum()):>7} {ms:>7.1f}")
+        for i in np.flatnonzero(w_changed)[:show if name != "current" else 0]:
+            rec = records[i]
+            print(f"    bout {rec.get('bout')} {'/'.join(rec.get('codes', []))}: "
+                  f"{RULE_SIDES[base_w[i]] or 'tie'} → {RULE_SIDES[w[i]] or 'tie'} {RULE_REASONS[r[i]]!r}")
+    return not bad.any()
+
+def _random_bout(core, sched, rng):
+    """Random operator input up to time-up (only the buckets the rules compare);
+    the operator resumes after JAZZO as on the board."""
+    core.load(core.cfg)
+    core.toggle_timer()
+    for _ in range(rng.randint(0, 8)):
+        sched.advance(rng.uniform(0.2, 20))
+        if core.jaza_active:
+            core.resume_from_jaza()
+        side = rng.choice(("BLUE", "GREEN"))
+        idx = LABEL_TO_INDEX[rng.choice("YCCCDTT")]
+        core.delta(side, idx, 1 if rng.random() < 0.9 else -1)
+        if core.match_over or core.auto_deciding:
+            break
+    for _ in range(2):  # run out the clock and the 5 s auto decision, past a JAZZO pause
+        if core.jaza_active:
+            core.resume_from_jaza()
+        sched.advance(core.total_match_time + 10)
+
+def rules_self_check(bouts=20000, seed=1):
+    """Play random bouts on MatchCore and check the vectorized current rules agree."""
+    import random
+    rng = random.Random(seed)
+    records = []
+    sched = VirtualScheduler()
+    analytics = BoutAnalytics(records.append)
+    core = MatchCore(dict(name1="B", name2="G", code1="BLU", code2="GRN", mm=1, ss=0), sched,
+                     on_event=analytics.event)
+    for _ in range(bouts):
+        _random_bout(core, sched, rng)
+    ok = reevaluate(records)
+    if len(records) != bouts:
+        print(f"FAILED: {bouts} bouts played but {len(records)} recorded (a bout never ended)")
+        return False
+    return ok
+
 # ---------------- main ----------------
-def main(): ConfigWindow().mainloop()
-if __name__ == "__main__": main()
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description=APP_TITLE)
+    ap.add_argument("--render-fps", type=int, default=RENDER_FPS,
+                    help="frame cap for the scoreboard render loop (Hz)")
+    ap.add_argument("--digit-sprites", action="store_true",
+                    help="draw timer/bucket digits from pre-rasterized glyph images")
+    ap.add_argument("--watch-flags", action="store_true",
+                    help="pick up flag files added or replaced while the app is running")
+    ap.add_argument("--build-flag-manifest", action="store_true",
+                    help=f"write {FLAG_MANIFEST_JSON} into the flags directory and exit")
+    ap.add_argument("--pack-assets", metavar="OUT",
+                    help=f"pack {' and '.join(ASSET_PACK_DIRS)} into one archive (e.g. {ASSET_PACK_NAME}) and exit")
+    ap.add_argument("--layout", metavar="PROFILE",
+                    help=f"layout profile ({', '.join(LAYOUT_PROFILES)} or one from {LAYOUT_FILE}); "
+                         f"compiled for this screen once and cached in {LAYOUT_CACHE}")
+    ap.add_argument("--analytics", metavar="FILE",
+                    help="append a per-bout analytics summary (JSON lines) to FILE")
+    ap.add_argument("--export", metavar="DIR",
+                    help="write finished bouts and their event timelines as CSV / JSON lines into DIR")
+    ap.add_argument("--export-session", metavar="NAME",
+                    help="session name in the export file names (default: start date and time)")
+    ap.add_argument("--perf-capture", type=float, nargs="?", const=0, metavar="SECONDS",
+                    help="profile the board from the start (stop with F9, on close, or after SECONDS)")
+    ap.add_argument("--perf-dir", default=PERF_DIR, metavar="DIR",
+                    help="where F9 / --perf-capture write their captures")
+    ap.add_argument("--result-cards", metavar="RESULTS",
+                    help="render result cards and bout sheets from an --analytics JSONL file and exit")
+    ap.add_argument("--cards-out", default=CARDS_DIR, metavar="DIR")
+    ap.add_argument("--cards-kind", choices=("card", "sheet", "both"), default="both")
+    ap.add_argument("--jobs", type=int, metavar="N", help="worker processes for --result-cards (default: CPUs)")
+    ap.add_argument("--reevaluate", metavar="RESULTS",
+                    help="re-decide the time-up results in an --analytics / --export JSONL file under each "
+                         "rule variant, report the differences and exit (needs NumPy)")
+    ap.add_argument("--rule-variants", nargs="+", choices=sorted(RULE_VARIANTS), metavar="VARIANT",
+                    help=f"variants for --reevaluate (default all: {', '.join(RULE_VARIANTS)})")
+    ap.add_argument("--reevaluate-check", type=int, nargs="?", const=20000, metavar="N",
+                    help="play N random bouts and check the vectorized rules match MatchCore, then exit")
+    ap.add_argument("--soak", type=int, metavar="N",
+                    help="play N synthetic bouts back to back and report memory growth, then exit")
+    ap.add_argument("--scenarios", nargs="*", metavar="NAME",
+                    help=f"run scripted bouts on virtual time (all, or the named ones: {', '.join(SCENARIOS)}) and exit")
+    ap.add_argument("--scenario-file", metavar="JSON",
+                    help="extra scenarios as {name: [[op, args...], ...]} (implies --scenarios)")
+    ap.add_argument("--scenario-repeat", type=int, default=1, metavar="N",
+                    help="run each scenario N times (timing)")
+    ap.add_argument("--state-shm", nargs="?", const="", metavar="NAME",
+                    help="publish live match state to shared memory (default kurash_ring<N>_state); "
+                         "read it with kurash_shm.py")
+    ap.add_argument("--core-process", nargs="?", const="", metavar="[HOST:]PORT",
+                    help=f"run the clock and rules in a separate process (default port {CORE_PORT_BASE}+ring; "
+                         "started on demand, or attach to a running --core-server)")
+    ap.add_argument("--core-server", nargs="?", const="", metavar="[HOST:]PORT",
+                    help="serve the match core for a --core-process board until it closes")
+    ap.add_argument("--core-journal", metavar="FILE",
+                    help="journal core commands/state to FILE; a restarted server resumes its last bout")
+    ap.add_argument("--broadcast", metavar="OUTPUT",
+                    help="off-screen frame output: shm[:NAME], png[:DIR] or pipe[:PATH]")
+    ap.add_argument("--broadcast-size", choices=sorted(BROADCAST_SIZES), default="1080p")
+    ap.add_argument("--broadcast-fps", type=int, default=BROADCAST_FPS)
+    ap.add_argument("--clock-authority", nargs="?", const="", metavar="[HOST:]PORT",
+                    help=f"serve this PC's clock to --clock-sync followers on udp PORT (default {SYNC_PORT}); "
+                         "localhost only unless HOST is given, e.g. 0.0.0.0:47600 for the LAN")
+    ap.add_argument("--clock-sync", metavar="HOST[:PORT]",
+                    help="count bout seconds on the clock of the --clock-authority at HOST")
+    ap.add_argument("--clock-sync-demo", type=int, nargs="?", const=3, metavar="N",
+                    help="run an authority and N follower processes with skewed clocks locally, "
+                         "report the sync error and exit")
+    ap.add_argument("--led", metavar="OUTPUT",
+                    help=f"stream to an LED matrix panel: udp[:HOST[:PORT]] (port {LED_PORT}) or serial:PORT[@BAUD]")
+    ap.add_argument("--led-size", type=lambda s: tuple(int(v) for v in s.lower().split("x")),
+                    default=LED_SIZE, metavar="WxH", help="panel resolution (default 192x96)")
+    ap.add_argument("--led-fps", type=int, default=LED_MAX_FPS, help=f"frame cap, at most {LED_MAX_FPS}")
+    ap.add_argument("--metrics", nargs="?", const="", metavar="[HOST:]PORT",
+                    help=f"serve Prometheus metrics on http://HOST:PORT/metrics "
+                         f"(default localhost only, port {METRICS_PORT_BASE} + ring; "
+                         f"e.g. 0.0.0.0:{METRICS_PORT_BASE + 1} for the LAN)")
+    ap.add_argument("--led-loopback", type=int, nargs="?", const=LED_PORT, metavar="PORT",
+                    help="run a stand-in LED panel on udp PORT that reports throughput, and exit on Ctrl+C")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    opts = parse_args(argv)
+    if opts.build_flag_manifest:
+        FLAGS.write_prebuilt(); return
+    if opts.scenarios is not None or opts.scenario_file:
+        sys.exit(0 if run_scenarios(opts.scenarios, opts.scenario_file, opts.scenario_repeat) else 1)
+    if opts.reevaluate:
+        sys.exit(0 if reevaluate(load_results(opts.reevaluate), opts.rule_variants) else 1)
+    if opts.reevaluate_check:
+        sys.exit(0 if rules_self_check(opts.reevaluate_check) else 1)
+    if opts.result_cards:
+        kinds = ("card", "sheet") if opts.cards_kind == "both" else (opts.cards_kind,)
+        render_results(opts.result_cards, opts.cards_out, kinds, opts.jobs); return
+    if opts.core_server is not None:
+        CoreServer(core_address(opts.core_server), opts.core_journal).serve(); return
+    if opts.clock_sync_demo:
+        sys.exit(0 if run_sync_demo(opts.clock_sync_demo) else 1)
+    if opts.clock_authority is not None:
+        host, port = sync_authority_address(opts.clock_authority)
+        ClockAuthority(port, host)  # daemon thread, serves for as long as the app runs
+    if opts.led_loopback:
+        run_led_loopback(opts.led_loopback); return
+    if opts.soak:
+        run_soak(opts.soak, options=vars(opts)); return
+    if opts.pack_assets:
+        if ASSETS:
+            ASSETS.close()  # the pack being rebuilt may be the one mapped at import
+        n = AssetPack.build(opts.pack_assets)
+        if not n:
+            sys.exit(f"no assets found under {', '.join(ASSET_PACK_DIRS)} in {ROOT_DIR}")
+        print(f"packed {n} assets into {opts.pack_assets}"); return
+    ConfigWindow(options=vars(opts)).mainloop()
+if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()  # pool workers of the frozen exe (--result-cards)
+    main()
@@ -0,0 +1,98 @@
+"""TkAsyncBridge pump cadence: idle backoff and early wake."""
+import asyncio
+import heapq
+import itertools
+import threading
+import unittest
+
+import main
+
+
+class FakeTk:
+    def call(self, *args):
+        return 1  # tcl_platform(threaded) exists
+
+
+class FakeWidget:
+    """Just enough of a Tk widget: a virtual-time after() queue."""
+
+    def __init__(self):
+        self.now = 0
+        self.timers = []
+        self.ids = itertools.count()
+        self.tk = FakeTk()
+        self.binds = {}
+        self.events = []
+
+    def after(self, ms, fn):
+        i = next(self.ids)
+        heapq.heappush(self.timers, (self.now + ms, i, fn))
+        return i
+
+    def after_cancel(self, i):
+        self.timers = [t for t in self.timers if t[1] != i]
+        heapq.heapify(self.timers)
+
+    def bind(self, sequence, fn, add=None):
+        self.binds[sequence] = fn
+
+    def event_generate(self, sequence, when=None):
+        self.events.append(sequence)
+
+    def run(self, ms):
+        until = self.now + ms
+        while self.timers and self.timers[0][0] <= until:
+            self.now, _, fn = heapq.heappop(self.timers)
+            fn()
+        self.now = until
+
+
+class TkAsyncBridgeTest(unittest.TestCase):
+    def setUp(self):
+        self.widget = FakeWidget()
+        self.aio = main.TkAsyncBridge(self.widget)
+        self.addCleanup(self.aio.close)
+
+    def test_idle_pump_backs_off(self):
+        self.widget.run(5000)
+        self.assertEqual(self.aio._interval, main.AIO_IDLE_MS)
+        self.assertLess(self.aio.stats["pumps"], 30)  # not 500
+
+    def test_call_in_ui_wakes_the_pump(self):
+        self.widget.run(5000)
+        got = []
+        self.aio.call_in_ui(got.append, 1)
+        self.widget.run(0)
+        self.assertEqual(got, [1])
+        self.assertEqual(self.aio._interval, main.AIO_PUMP_MS)
+
+    def test_submit_keeps_short_interval_while_task_alive(self):
+        self.widget.run(5000)
+        done = asyncio.Event()
+
+        async def waiter():
+            await done.wait()
+            return 7
+
+        task = self.aio.submit(waiter())
+        pumps = self.aio.stats["pumps"]
+        self.widget.run(100)
+        self.assertGreaterEqual(self.aio.stats["pumps"] - pumps, 9)
+        done.set()
+        self.widget.run(20)
+        self.assertEqual(task.result(), 7)
+
+    def test_worker_thread_posts_wake_event(self):
+        self.widget.run(5000)
+        got = []
+        worker = threading.Thread(target=self.aio.call_in_ui, args=(got.append, 2))
+        worker.start()
+        worker.join()
+        self.assertEqual(self.widget.events, ["<<AioWake>>"])
+        self.widget.binds["<<AioWake>>"](None)
+        self.widget.run(0)
+        self.assertEqual(got, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""BoutAnalytics summaries for bouts scripted on a VirtualScheduler, and
+reading them back with load_results()."""
+import json
+import os
+import tempfile
+import unittest
+
+import main
+
+L = main.LABEL_TO_INDEX
+
+
+class BoutAnalyticsTest(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        self.sched = main.VirtualScheduler()
+        self.analytics = main.BoutAnalytics(self.records.append)
+        cfg = dict(name1="Blue", code1="UZB", name2="Green", code2="KAZ", mm=1, ss=0)
+        self.core = main.MatchCore(cfg, self.sched, on_event=self.analytics.event)
+
+    def test_scripted_bout_summary(self):
+        core, sched = self.core, self.sched
+        core.toggle_timer()
+        sched.advance(31)                      # no score at half time: JAZZO at 0:30
+        self.assertTrue(core.jaza_active)
+        core.resume_from_jaza()
+        sched.advance(4.5)
+        core.delta("BLUE", L["C"], 1)          # t=34, BLUE leads
+        sched.advance(5)
+        core.delta("GREEN", L["Y"], 1)         # t=39, GREEN leads
+        sched.advance(5)
+        core.reset_bucket("GREEN", L["Y"])     # t=44, the Y was a mistake: BLUE leads again
+        core.delta("GREEN", L["T"], 1)         # mirrored as C for BLUE
+        core.timeout("GREEN")
+        sched.advance(30)
+
+        self.assertEqual(len(self.records), 1)
+        rec = self.records[0]
+        self.assertEqual(rec["first_score"], {"t": 34, "side": "BLUE", "label": "C"})
+        self.assertEqual(rec["scores"], {"BLUE": 2, "GREEN": 1})
+        self.assertEqual(rec["penalties"], [[44, "GREEN", "T"]])
+        self.assertEqual(rec["timeouts"], [[44, "GREEN"]])
+        self.assertEqual(rec["corrections"], 1)
+        self.assertEqual(rec["lead_s"], {"BLUE": 21, "GREEN": 5, "level": 34})
+        self.assertEqual(rec["lead_changes"], 3)
+        self.assertEqual(rec["jazzo"], {"at": 30, "resumed_at": 30, "first_score_after_s": 4,
+                                        "scores_after": {"BLUE": 2, "GREEN": 1}})
+        self.assertEqual(rec["buckets"]["BLUE"]["C"], 2)
+        self.assertEqual(rec["buckets"]["GREEN"]["Y"], 0)
+        self.assertEqual(rec["elapsed_s"], 60)
+        self.assertTrue(rec["time_up"])
+        self.assertEqual((rec["winner"], rec["reason"]), ("BLUE", "POINT ADVANTAGE"))
+
+    def test_reset_bucket_updates_leader(self):
+        core = self.core
+        core.toggle_timer()
+        core.delta("GREEN", L["C"], 2)
+        self.assertEqual(self.analytics.leader, "GREEN")
+        core.reset_bucket("GREEN", L["C"])
+        self.assertEqual(self.analytics.leader, "")
+        self.assertEqual(self.analytics.corrections, 1)
+        self.assertEqual(core._direct_c["GREEN"], 0)
+
+    def test_reset_of_empty_bucket_is_not_a_correction(self):
+        self.core.reset_bucket("BLUE", L["Y"])
+        self.assertEqual(self.analytics.corrections, 0)
+        self.assertEqual(self.analytics.lead_changes, 0)
+
+
+class LoadResultsTest(unittest.TestCase):
+    def load(self, records):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.jsonl")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.writelines(json.dumps(rec) + "\n" for rec in records)
+            return main.load_results(path)
+
+    def test_amendment_replaces_the_same_bout_of_its_ring(self):
+        results = self.load([
+            dict(session="s1", ring=1, bout=1, winner=""),
+            dict(session="s1", ring=2, bout=1, winner="GREEN"),
+            dict(session="s1", ring=1, bout=1, winner="BLUE", amended=True),
+        ])
+        self.assertEqual([(r["ring"], r["winner"]) for r in results], [(1, "BLUE"), (2, "GREEN")])
+
+    def test_sessions_are_kept_apart(self):
+        results = self.load([
+            dict(session="s1", ring=1, bout=1, winner=""),
+            dict(session="s2", ring=1, bout=1, winner=""),
+            dict(session="s2", ring=1, bout=1, winner="GREEN", amended=True),
+        ])
+        self.assertEqual([(r["session"], r["winner"]) for r in results], [("s1", ""), ("s2", "GREEN")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""AssetPack build/read round trip."""
+import io
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+import main
+
+
+class AssetPackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        os.makedirs(os.path.join(self.root, "Flags"))
+        os.makedirs(os.path.join(self.root, "Sounds"))
+        buf = io.BytesIO()
+        Image.new("RGB", (30, 20), "red").save(buf, "PNG")
+        self.files = {"Flags/UZB.png": buf.getvalue(), "Sounds/beep.wav": b"RIFF" + bytes(range(256)) * 4}
+        for name, data in self.files.items():
+            with open(os.path.join(self.root, name), "wb") as fh:
+                fh.write(data)
+        self.out = os.path.join(self.root, "assets.pak")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(main.AssetPack.build(self.out, root=self.root, dirs=("Flags", "Sounds")), 2)
+        pack = main.AssetPack(self.out)
+        try:
+            self.assertEqual(sorted(pack.names()), sorted(self.files))
+            self.assertEqual(pack.names("Sounds/"), ["Sounds/beep.wav"])
+            for name, data in self.files.items():
+                self.assertIn(name, pack)
+                self.assertEqual(pack.read(name), data)
+            self.assertEqual(pack.index["Flags/UZB.png"]["size"], [30, 20])
+            self.assertNotIn("size", pack.index["Sounds/beep.wav"])
+            with Image.open(pack.open("Flags/UZB.png")) as im:
+                self.assertEqual(im.size, (30, 20))
+            path = pack.extract("Sounds/beep.wav")
+            self.assertIs(pack.extract("Sounds/beep.wav"), path)
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), self.files["Sounds/beep.wav"])
+        finally:
+            pack.close()
+        self.assertFalse(os.path.exists(path))  # extracted copies go with the pack
+
+    def test_rebuild_in_place_and_empty_build(self):
+        main.AssetPack.build(self.out, root=self.root, dirs=("Flags", "Sounds"))
+        with open(os.path.join(self.root, "Flags", "KAZ.png"), "wb") as fh:
+            fh.write(self.files["Flags/UZB.png"])
+        self.assertEqual(main.AssetPack.build(self.out, root=self.root, dirs=("Flags", "Sounds")), 3)
+        # Nothing to pack: the existing pack is left as it is
+        self.assertEqual(main.AssetPack.build(self.out, root=self.root, dirs=("Missing",)), 0)
+        pack = main.AssetPack(self.out)
+        try:
+            self.assertEqual(len(pack.names()), 3)
+        finally:
+            pack.close()
+        self.assertEqual([f for f in os.listdir(self.root) if f.endswith(".tmp")], [])
+
+    def test_rejects_other_files(self):
+        with open(self.out, "wb") as fh:
+            fh.write(b"not a pack at all")
+        with self.assertRaises(ValueError):
+            main.AssetPack(self.out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""ClockSync offset/delay estimate and slewing."""
+import time
+import unittest
+
+import main
+
+
+class FakeClock:
+    def __init__(self, t=100.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+
+class ClockSyncMathTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        # Nothing answers on this port; samples are fed to _update() directly
+        self.sync = main.ClockSync("127.0.0.1:9", clock=self.clock)
+        self.sync.close()
+
+    def exchange(self, offset, out_s, back_s, hold_s=0.002):
+        """Feed one request/reply with the authority *offset* s ahead."""
+        t1 = self.clock.t
+        t2 = t1 + out_s + offset
+        t3 = t2 + hold_s
+        t4 = t1 + out_s + hold_s + back_s
+        self.sync._update(t1, t2, t3, t4)
+
+    def test_offset_and_delay(self):
+        self.exchange(5.0, 0.010, 0.010)
+        self.assertAlmostEqual(self.sync.offset, 5.0, places=9)
+        self.assertAlmostEqual(self.sync.stats["delay_ms"], 20.0, places=6)
+        self.assertAlmostEqual(self.sync.stats["error_ms"], 10.0, places=6)
+        self.assertTrue(self.sync.stats["synced"])
+
+    def test_asymmetric_path_error_is_within_the_bound(self):
+        self.exchange(5.0, 0.002, 0.018)
+        err_ms = abs(self.sync.offset - 5.0) * 1e3
+        self.assertAlmostEqual(err_ms, 8.0, places=6)
+        self.assertLessEqual(err_ms, self.sync.stats["error_ms"] + 1e-9)
+
+    def test_lowest_delay_sample_wins(self):
+        self.exchange(5.0, 0.001, 0.001)
+        self.exchange(5.3, 0.050, 0.050)  # queued: larger delay, worse estimate
+        self.assertAlmostEqual(self.sync.offset, 5.0, places=9)
+        for _ in range(main.SYNC_WINDOW):
+            self.exchange(5.1, 0.004, 0.004)
+        self.assertEqual(len(self.sync.samples), main.SYNC_WINDOW)
+        self.assertAlmostEqual(self.sync.offset, 5.1, places=9)  # the old best left the window
+
+    def test_first_estimate_steps(self):
+        self.assertEqual(self.sync.now(), 100.0)
+        self.exchange(5.0, 0.001, 0.001)
+        self.assertAlmostEqual(self.sync.now(), 105.0, places=9)
+
+    def test_later_estimates_slew(self):
+        self.exchange(5.0, 0.002, 0.002)
+        self.exchange(5.2, 0.001, 0.001)
+        self.assertAlmostEqual(self.sync.offset, 5.2, places=9)
+        self.assertAlmostEqual(self.sync.applied_offset(), 5.0, places=9)
+        self.clock.t += 1.0
+        self.assertAlmostEqual(self.sync.applied_offset(), 5.0 + main.SYNC_SLEW_RATE, places=9)
+        # Authority time keeps moving forward while catching up
+        before = self.sync.now()
+        self.clock.t += 1.0
+        self.assertAlmostEqual(self.sync.now() - before, 1.0 + main.SYNC_SLEW_RATE, places=9)
+        self.clock.t += 60.0
+        self.assertAlmostEqual(self.sync.applied_offset(), 5.2, places=9)
+
+    def test_slewing_backwards_never_reverses_time(self):
+        self.exchange(5.0, 0.002, 0.002)
+        self.exchange(4.0, 0.001, 0.001)
+        last = self.sync.now()
+        for _ in range(100):
+            self.clock.t += 0.5
+            now = self.sync.now()
+            self.assertGreater(now, last)
+            last = now
+        self.assertAlmostEqual(self.sync.applied_offset(), 4.0, places=9)
+
+
+class AuthorityAddressTest(unittest.TestCase):
+    def test_defaults_to_localhost(self):
+        self.assertEqual(main.sync_authority_address(""), ("127.0.0.1", main.SYNC_PORT))
+        self.assertEqual(main.sync_authority_address("47610"), ("127.0.0.1", 47610))
+        self.assertEqual(main.sync_authority_address("0.0.0.0:47611"), ("0.0.0.0", 47611))
+
+
+class ClockSyncLoopbackTest(unittest.TestCase):
+    def test_follows_a_local_authority(self):
+        authority = main.ClockAuthority(0, clock=lambda: main.sync_clock() + 3.0)
+        sync = main.ClockSync(f"127.0.0.1:{authority.port}")
+        try:
+            deadline = time.monotonic() + 5.0
+            while not sync.stats["received"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(sync.stats["synced"])
+            self.assertAlmostEqual(sync.applied_offset(), 3.0, delta=0.01)
+        finally:
+            sync.close()
+            authority.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""CoreServer / RemoteCore round trip over a local socket."""
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+import main
+
+C = main.LABEL_TO_INDEX["C"]
+
+
+def free_address():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()
+
+
+class CoreProcessTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.journal = os.path.join(self.tmp.name, "core.jsonl")
+        self.cfg = dict(name1="Blue", code1="UZB", name2="Green", code2="KAZ", mm=0, ss=30, ring=1)
+        self.ui = queue.Queue()  # stands in for TkAsyncBridge.call_in_ui
+        self.events, self.buzzes, self.lost = [], [], []
+
+    def start_server(self, journal=True):
+        address = free_address()
+        server = main.CoreServer(address, self.journal if journal else None)
+        thread = threading.Thread(target=server.serve, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(setattr, server, "stopped", True)
+        return server, address
+
+    def attach(self, address, **kw):
+        core = main.RemoteCore(self.cfg, address, lambda fn, *args: self.ui.put((fn, args)), spawn=False,
+                               on_event=lambda kind, t, data: self.events.append(kind),
+                               on_buzz=lambda: self.buzzes.append(1), on_lost=self.lost.append, **kw)
+        self.addCleanup(core.close, False)
+        return core
+
+    def wait(self, until, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not until():
+            self.assertLess(time.monotonic(), deadline, "timed out")
+            time.sleep(0.01)
+
+    def pump(self, until, timeout=5.0):
+        """Run delivered callbacks (as the Tk thread would) until *until()* holds."""
+        deadline = time.monotonic() + timeout
+        while not until():
+            try:
+                fn, args = self.ui.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.fail("timed out waiting for the core")
+            fn(*args)
+
+    def test_attach_commands_and_state(self):
+        server, address = self.start_server()
+        core = self.attach(address)
+        self.assertEqual((core.time_left, core.running, core.blue), (30, False, [0] * 5))
+        core.delta("BLUE", C, 1)
+        self.pump(lambda: core.blue[C] == 1)
+        self.assertEqual(self.events[:2], ["load", "score"])
+        core.toggle_timer()
+        self.pump(lambda: core.running)
+        self.assertLessEqual(core.time_left_ms(), 30000)
+        core.toggle_timer()
+        self.pump(lambda: not core.running)
+
+    def test_buzz_at_time_up(self):
+        self.cfg["ss"] = 1
+        server, address = self.start_server()
+        core = self.attach(address)
+        core.toggle_timer()
+        self.pump(lambda: self.buzzes, timeout=5.0)
+        self.pump(lambda: core.match_over)
+        self.assertEqual((core.time_left, tuple(core.final)), (0, ("TIE",)))
+
+    def test_journal_resume(self):
+        server, address = self.start_server()
+        core = self.attach(address)
+        core.delta("GREEN", C, 2)
+        self.pump(lambda: core.green[C] == 2)
+        core.close()  # normal close: the server stops
+        self.wait(lambda: server.stopped)
+        # A restarted server continues the journaled bout, clock stopped
+        server, address = self.start_server()
+        self.assertIsNotNone(server.core)
+        self.cfg["name1"] = "Someone else"
+        core = self.attach(address)
+        self.assertEqual((core.green[C], core.running, core.cfg["name1"]), (2, False, "Blue"))
+
+    def test_lost_server_and_reattach_with_state(self):
+        server, address = self.start_server(journal=False)
+        core = self.attach(address)
+        core.delta("BLUE", C, 1)
+        self.pump(lambda: core.blue[C] == 1)
+        server.stopped = True
+        self.pump(lambda: self.lost)
+        state = core.snapshot()
+        # A fresh server without a journal continues from the board's snapshot
+        server, address = self.start_server(journal=False)
+        core = self.attach(address, state=state)
+        self.assertEqual(core.blue[C], 1)
+        # ... and MatchCore can take over in-process from the same snapshot
+        local = main.MatchCore(self.cfg, main.VirtualScheduler())
+        local.restore(state)
+        self.assertEqual((local.blue[C], local.bout), (1, state["bout"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
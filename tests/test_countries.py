@@ -0,0 +1,56 @@
+"""CountryRegistry type-ahead search and parse_code."""
+import unittest
+
+import main
+
+
+class CountryRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.reg = main.CountryRegistry(["ALG", "GER", "GEO", "NGR", "nig", "GER"])
+
+    def test_values_sorted_by_name_and_deduplicated(self):
+        self.assertEqual(self.reg.values, ["Algeria (ALG)", "Georgia (GEO)", "Germany (GER)",
+                                           "Niger (NIG)", "Nigeria (NGR)"])
+
+    def test_exact_code_then_prefix_then_substring(self):
+        self.assertEqual(self.reg.search("ger"),
+                         ["Germany (GER)", "Algeria (ALG)", "Niger (NIG)", "Nigeria (NGR)"])
+        self.assertEqual(self.reg.search("ge")[:2], ["Georgia (GEO)", "Germany (GER)"])
+
+    def test_blank_and_long_queries(self):
+        self.assertEqual(self.reg.search("  "), self.reg.values)
+        self.assertEqual(self.reg.search("Nigeria (NGR)"), ["Nigeria (NGR)"])
+        self.assertEqual(self.reg.search("xyz"), [])
+
+    def test_code_for(self):
+        self.assertEqual(self.reg.code_for("Georgia (GEO)"), "GEO")
+        self.assertEqual(self.reg.code_for(" germany "), "GER")
+        self.assertEqual(self.reg.code_for("nig"), "NIG")
+        self.assertIsNone(self.reg.code_for("Atlantis"))
+
+
+class AliasTest(unittest.TestCase):
+    def test_alias_codes_have_names_but_names_mean_the_ioc_code(self):
+        reg = main.CountryRegistry(["UZE", "UZB", "TPA", "TPE", "SGP"])
+        self.assertIn("Uzbekistan (UZE)", reg.values)
+        self.assertIn("Chinese Taipei (TPA)", reg.values)
+        self.assertEqual(reg.code_for("uzbekistan"), "UZB")
+        self.assertEqual(reg.code_for("Chinese Taipei"), "TPE")
+        self.assertEqual(reg.code_for("Uzbekistan (UZE)"), "UZE")
+        self.assertEqual(reg.search("singapore"), ["Singapore (SGP)"])
+
+    def test_every_shipped_alias_is_named(self):
+        for alias in main.FLAG_CODE_ALIASES:
+            self.assertNotEqual(main.IOC_NAMES.get(alias, alias), alias)
+
+
+class ParseCodeTest(unittest.TestCase):
+    def test_registry_and_free_text(self):
+        self.assertEqual(main.parse_code("Uzbekistan (UZB)"), "UZB")
+        self.assertEqual(main.parse_code("uzbekistan"), "UZB")
+        self.assertEqual(main.parse_code("Somewhere (xy)"), "XY")
+        self.assertEqual(main.parse_code(" abcd "), "ABC")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""ExportPipeline back-pressure, ordering and rotation."""
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import main
+
+
+def read_records(paths):
+    records = []
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as fh:
+            records += [json.loads(line) for line in fh]
+    return records
+
+
+class ExportPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def files(self, suffix=""):
+        return sorted(f for f in os.listdir(self.dir) if f.endswith(suffix))
+
+    def test_full_queue_spills_without_blocking_and_keeps_order(self):
+        pipe = main.ExportPipeline(self.dir, "s1")
+        gate = threading.Event()
+        handle = pipe._handle
+        pipe._handle = lambda kind, payload: (gate.wait(), handle(kind, payload))
+        path = pipe._path(1, "bouts", "jsonl")
+        n = main.EXPORT_QUEUE * 2
+        start = time.perf_counter()
+        for i in range(n):
+            pipe.append_jsonl(path, {"i": i})
+        self.assertLess(time.perf_counter() - start, 1.0)  # never waited on the stalled writer
+        self.assertGreater(pipe.stats["full"], 0)
+        self.assertGreater(pipe.stats["max_overflow"], 0)
+        self.assertEqual(pipe.stats["submitted"], n)
+        gate.set()
+        pipe.close()
+        self.assertEqual(pipe.stats["written"], n)
+        self.assertEqual(pipe.stats["errors"], 0)
+        # Closing compresses the session's file
+        self.assertEqual(self.files(), ["s1-ring1-bouts.1.jsonl.gz"])
+        self.assertEqual([r["i"] for r in read_records([os.path.join(self.dir, self.files()[0])])], list(range(n)))
+
+    def test_backlog_is_reported_once_to_the_latest_board(self):
+        first, second = [], []
+        pipe = main.export_pipeline(self.dir, "s1", on_error=first.append)
+        self.addCleanup(main._EXPORT_PIPELINES.pop, os.path.abspath(self.dir))
+        self.assertIs(main.export_pipeline(self.dir, on_error=second.append), pipe)
+        gate = threading.Event()
+        handle = pipe._handle
+        pipe._handle = lambda kind, payload: (gate.wait(), handle(kind, payload))
+        path = pipe._path(1, "bouts", "jsonl")
+        for i in range(main.EXPORT_QUEUE + main.EXPORT_OVERFLOW_WARN + 10):
+            pipe.append_jsonl(path, {"i": i})
+        gate.set()
+        pipe.close()
+        self.assertEqual(first, [])
+        self.assertEqual(len(second), 1)
+        self.assertIsInstance(second[0], main.ExportBacklog)
+
+    def test_rotates_by_size_and_leaves_other_files_alone(self):
+        foreign = os.path.join(self.dir, "s0-ring2-bouts.csv")  # another ring's process
+        with open(foreign, "w") as fh:
+            fh.write("x\n")
+        with mock.patch.object(main, "EXPORT_ROTATE_BYTES", 256):
+            pipe = main.ExportPipeline(self.dir, "s1")
+            path = pipe._path(1, "bouts", "jsonl")
+            for i in range(200):
+                pipe.append_jsonl(path, {"i": i, "pad": "x" * 20})
+                if i % 10 == 9:
+                    time.sleep(0.005)  # let the writer batch and rotate as it goes
+            pipe.close()
+        rotated = self.files(".jsonl.gz")
+        self.assertGreater(len(rotated), 1)
+        self.assertEqual(pipe.stats["rotated"], len(rotated))
+        self.assertEqual(self.files(".jsonl"), [])
+        key = lambda f: int(f.split(".")[1])
+        records = read_records([os.path.join(self.dir, f) for f in sorted(rotated, key=key)])
+        self.assertEqual([r["i"] for r in records], list(range(200)))
+        self.assertTrue(os.path.exists(foreign))
+        self.assertFalse(os.path.exists(foreign + ".gz"))
+
+    def test_other_paths_are_appended_but_not_rotated(self):
+        pipe = main.ExportPipeline(self.dir, "s1")
+        path = os.path.join(self.dir, "analytics.jsonl")
+        for i in range(3):
+            pipe.append_jsonl(path, {"i": i})
+        pipe.close()
+        self.assertEqual(self.files(), ["analytics.jsonl"])
+        self.assertEqual([r["i"] for r in read_records([path])], [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
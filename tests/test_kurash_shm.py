@@ -0,0 +1,87 @@
+"""Shared-memory state segment: publish/read and the seqlock."""
+import os
+import sys
+import threading
+import unittest
+
+import kurash_shm
+
+
+def retrack(shm):
+    """Readers drop the segment from the resource tracker (see kurash_shm._attach);
+    in the writer's own process, hand it back so the writer's unlink stays balanced."""
+    if sys.version_info < (3, 13) and sys.platform != "win32":
+        from multiprocessing import resource_tracker
+        resource_tracker.register(shm._name, "shared_memory")
+
+
+class StateSegmentTest(unittest.TestCase):
+    def setUp(self):
+        self.name = f"kurash_test_{os.getpid()}_{self._testMethodName[-12:]}"
+        self.writer = kurash_shm.StateWriter(self.name)
+        self.reader = kurash_shm.StateReader(self.name, spins=10)
+        retrack(self.writer.shm)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+
+    def test_round_trip(self):
+        self.writer.publish(61234, 238766, (1, 0, 2, 0, 0), (0, 1, 0, 0, 1), timeouts=(1, 0),
+                            running=True, deciding=True, winner="GREEN", code1="UZB", code2="KAZ", bout=7)
+        s = self.reader.read()
+        self.assertEqual((s.seq, s.time_left_ms, s.bout_ms, s.bout), (1, 61234, 238766, 7))
+        self.assertEqual((s.blue, s.green, s.timeouts), ((1, 0, 2, 0, 0), (0, 1, 0, 0, 1), (1, 0)))
+        self.assertEqual((s.running, s.jazzo, s.over, s.deciding, s.tie), (True, False, False, True, False))
+        self.assertEqual((s.winner, s.code1, s.code2), ("GREEN", "UZB", "KAZ"))
+
+    def test_changed_tracks_the_sequence(self):
+        self.writer.publish(1000, 0, (0,) * 5, (0,) * 5)
+        self.assertTrue(self.reader.changed())
+        self.reader.read()
+        self.assertFalse(self.reader.changed())
+        self.writer.publish(900, 100, (0,) * 5, (0,) * 5)
+        self.assertTrue(self.reader.changed())
+
+    def test_odd_sequence_is_never_returned(self):
+        self.writer.publish(1000, 0, (0,) * 5, (0,) * 5)
+        kurash_shm.SEQ.pack_into(self.writer.shm.buf, kurash_shm.SEQ_OFFSET, self.writer.seq + 1)
+        with self.assertRaises(TimeoutError):
+            self.reader.read(timeout=0.02)
+
+    def test_reads_are_consistent_under_a_concurrent_writer(self):
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                v = i % 200
+                self.writer.publish(v, v, (v,) * 5, (v,) * 5, bout=i)
+
+        t = threading.Thread(target=write)
+        t.start()
+        try:
+            for _ in range(2000):
+                s = self.reader.read(timeout=1.0)
+                v = s.time_left_ms
+                self.assertEqual((s.bout_ms, s.blue, s.green), (v, (v,) * 5, (v,) * 5))
+                self.assertEqual(s.bout % 200, v)
+        finally:
+            stop.set()
+            t.join()
+
+    def test_rejects_foreign_segments(self):
+        from multiprocessing import shared_memory
+        other = shared_memory.SharedMemory(name=self.name + "_x", create=True, size=kurash_shm.SIZE)
+        try:
+            with self.assertRaises(ValueError):
+                kurash_shm.StateReader(self.name + "_x")
+        finally:
+            retrack(other)
+            other.close()
+            other.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
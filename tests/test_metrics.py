@@ -0,0 +1,112 @@
+"""BoardMetrics counters and the Prometheus text exposition."""
+import math
+import re
+import unittest
+import urllib.error
+import urllib.request
+
+import main
+
+SAMPLE_RE = re.compile(r'^(kurash_[a-z_]+)\{((?:[a-z_]+="[^"]*",?)+)\} (\S+)$')
+
+
+def parse(text):
+    """{family: kind} and [(name, labels, value)], checking the exposition rules on the way."""
+    assert text.endswith("\n")
+    kinds, helps, samples = {}, set(), []
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name = line.split()[2]
+            assert name not in helps, f"duplicate HELP {name}"
+            helps.add(name)
+        elif line.startswith("# TYPE "):
+            _, _, name, kind = line.split()
+            assert name in helps and name not in kinds, f"TYPE out of place: {line}"
+            assert kind in ("counter", "gauge", "summary"), line
+            kinds[name] = kind
+        else:
+            m = SAMPLE_RE.match(line)
+            assert m, f"not a sample line: {line!r}"
+            name, labels, value = m.groups()
+            family = re.sub(r"_(sum|count)$", "", name) if name not in kinds else name
+            assert family in kinds, f"sample before its TYPE: {line}"
+            samples.append((name, dict(re.findall(r'([a-z_]+)="([^"]*)"', labels)), float(value)))
+    return kinds, samples
+
+
+class BoardMetricsTest(unittest.TestCase):
+    def setUp(self):
+        self.m = main.BoardMetrics(("127.0.0.1", 0))
+        self.m.ring = 3
+
+    def tearDown(self):
+        self.m.close()
+
+    def value(self, name, **labels):
+        _, samples = parse(self.m.render())
+        found = [v for n, l, v in samples if n == name and all(l.get(k) == v2 for k, v2 in labels.items())]
+        self.assertEqual(len(found), 1, name)
+        return found[0]
+
+    def test_exposition_format(self):
+        kinds, samples = parse(self.m.render())
+        self.assertEqual(kinds["kurash_inputs_total"], "counter")
+        self.assertEqual(kinds["kurash_input_latency_seconds"], "summary")
+        for name, kind in kinds.items():
+            if kind == "counter":
+                self.assertTrue(name.endswith("_total"), name)
+        self.assertTrue(all(labels["ring"] == "3" for _, labels, _ in samples))
+
+    def test_counters(self):
+        for hit in (True, True, True, False):
+            self.m.cache(hit)
+        self.m.input()
+        self.m.input()  # both on the same frame: one latency sample
+        self.m.frame()
+        self.m.relayout()
+        for kind in ("load", "end", "end", "load", "end"):  # the second "end" is an amendment
+            self.m.event(kind, 0.0, {})
+        self.assertEqual(self.value("kurash_flag_cache_lookups_total", result="hit"), 3)
+        self.assertEqual(self.value("kurash_flag_cache_hit_ratio"), 0.75)
+        self.assertEqual(self.value("kurash_inputs_total"), 2)
+        self.assertEqual(self.value("kurash_input_latency_seconds_count"), 1)
+        self.assertEqual(self.value("kurash_relayouts_total"), 1)
+        self.assertEqual(self.value("kurash_bouts_completed_total"), 2)
+        self.assertEqual(self.value("kurash_metrics_scrapes_total"), 7)
+
+    def test_empty_values_are_nan(self):
+        self.assertTrue(math.isnan(self.value("kurash_flag_cache_hit_ratio")))
+        self.assertTrue(math.isnan(self.value("kurash_input_latency_seconds", quantile="0.5")))
+        self.assertTrue(math.isnan(self.value("kurash_seconds_since_last_input")))
+
+    def test_sources(self):
+        self.m.sources["render"] = dict(frames=10, skipped=1, max_ms=12.0)
+        self.m.sources["export"] = dict(depth=4, overflow=1, errors=0)
+        self.m.sources["sync"] = dict(synced=False, offset_ms=0.0, error_ms=None)  # no reply yet
+        self.assertEqual(self.value("kurash_frames_total"), 10)
+        self.assertEqual(self.value("kurash_frame_seconds_max"), 0.012)
+        self.assertEqual(self.value("kurash_export_queue_depth"), 4)
+        self.assertEqual(self.value("kurash_export_overflow"), 1)
+        self.assertEqual(self.value("kurash_clock_sync_synced"), 0)
+        self.assertTrue(math.isnan(self.value("kurash_clock_sync_error_seconds")))
+
+    def test_http_endpoint(self):
+        host, port = self.m.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as resp:
+            self.assertTrue(resp.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+            parse(resp.read().decode())
+        with self.assertRaises(urllib.error.HTTPError) as cm:
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+        self.assertEqual(cm.exception.code, 404)
+        cm.exception.close()
+
+
+class MetricsAddressTest(unittest.TestCase):
+    def test_localhost_unless_a_host_is_given(self):
+        self.assertEqual(main.metrics_address("", 2), ("127.0.0.1", main.METRICS_PORT_BASE + 2))
+        self.assertEqual(main.metrics_address("9100", 2), ("127.0.0.1", 9100))
+        self.assertEqual(main.metrics_address("0.0.0.0:9100"), ("0.0.0.0", 9100))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""text_metrics layout and memoization (a stand-in for tkinter.font.Font)."""
+import unittest
+from unittest import mock
+
+import main
+
+
+class FakeFont:
+    """Fixed-pitch font: 10 px per char per 10 pt, linespace 2 × size."""
+
+    def __init__(self, family="Arial", size=10, weight="bold"):
+        self.opts = dict(family=family, size=size, weight=weight)
+        self.measured = 0
+
+    def cget(self, key):
+        return self.opts[key]
+
+    def measure(self, text):
+        self.measured += 1
+        return len(text) * self.opts["size"]
+
+    def metrics(self, key):
+        assert key == "linespace"
+        return 2 * self.opts["size"]
+
+
+class TextMetricsTest(unittest.TestCase):
+    def setUp(self):
+        main._TEXT_METRICS.clear()
+        self.addCleanup(main._TEXT_METRICS.clear)
+
+    def test_lines(self):
+        font = FakeFont()
+        self.assertEqual(main.text_metrics(font, "ABC"), (30, 20))
+        self.assertEqual(main.text_metrics(font, "A\nLONGER\nBC"), (60, 60))
+        self.assertEqual(main.text_metrics(font, ""), (0, 20))
+
+    def test_memoized_per_font_and_text(self):
+        font = FakeFont()
+        main.text_metrics(font, "UZB")
+        main.text_metrics(font, "UZB")
+        self.assertEqual(font.measured, 1)
+        # Same family/size/weight in another Font object: still a hit
+        other = FakeFont()
+        self.assertEqual(main.text_metrics(other, "UZB"), (30, 20))
+        self.assertEqual(other.measured, 0)
+        # A resized font is a different key
+        font.opts["size"] = 20
+        self.assertEqual(main.text_metrics(font, "UZB"), (60, 40))
+        self.assertEqual(font.measured, 2)
+
+    def test_lru_bound(self):
+        font = FakeFont()
+        with mock.patch.object(main, "TEXT_METRICS_CACHE", 3):
+            for text in ("a", "b", "c"):
+                main.text_metrics(font, text)
+            main.text_metrics(font, "a")   # now the most recent
+            main.text_metrics(font, "d")   # evicts "b"
+            self.assertEqual(len(main._TEXT_METRICS), 3)
+            font.measured = 0
+            main.text_metrics(font, "a")
+            self.assertEqual(font.measured, 0)
+            main.text_metrics(font, "b")
+            self.assertEqual(font.measured, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()